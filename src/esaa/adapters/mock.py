@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any
 
 from .base import AgentAdapter
@@ -14,87 +16,108 @@ class MockAgentAdapter(AgentAdapter):
 
     def execute(self, dispatch_context: dict[str, Any]) -> dict[str, Any]:
         task = dispatch_context["task"]
-        task_id = task["task_id"]
-        status = task["status"]
-
-        if status == "todo":
-            return {
-                "activity_event": {
-                    "action": "claim",
-                    "task_id": task_id,
-                    "prior_status": "todo",
-                    "notes": "mock claim",
-                }
-            }
+        return _STATUS_HANDLERS.get(task["status"], _report_not_actionable)(task)
 
-        if status == "in_progress":
-            checks = [f"mock-check:{task_id}"]
-            if task.get("is_hotfix"):
-                checks.append(f"mock-hotfix-check:{task_id}")
-
-            output_file = _choose_output_file(task)
-            file_updates = []
-            if output_file:
-                file_updates = [
-                    {
-                        "path": output_file,
-                        "content": _build_file_content(task),
-                    }
-                ]
-
-            event = {
-                "action": "complete",
-                "task_id": task_id,
-                "prior_status": "in_progress",
-                "notes": "mock complete",
-                "verification": {"checks": checks},
-            }
-            if task.get("is_hotfix"):
-                event["issue_id"] = task["issue_id"]
-                event["fixes"] = task["fixes"]
-            return {"activity_event": event, "file_updates": file_updates}
-
-        if status == "review":
-            return {
-                "activity_event": {
-                    "action": "review",
-                    "task_id": task_id,
-                    "prior_status": "review",
-                    "decision": "approve",
-                    "tasks": [task_id],
-                    "notes": "mock review approve",
-                }
-            }
 
-        return {
-            "activity_event": {
-                "action": "issue.report",
-                "task_id": task_id,
-                "prior_status": status if status in {"todo", "in_progress", "review"} else "in_progress",
-                "issue_id": f"ISS-MOCK-{task_id}",
-                "severity": "low",
-                "title": "Task not actionable",
-                "evidence": {
-                    "symptom": f"task status is {status}",
-                    "repro_steps": [f"load task {task_id}", f"check status {status}"],
-                },
+def _claim(task: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "activity_event": {
+            "action": "claim",
+            "task_id": task["task_id"],
+            "prior_status": "todo",
+            "notes": "mock claim",
+        }
+    }
+
+
+def _complete(task: dict[str, Any]) -> dict[str, Any]:
+    task_id = task["task_id"]
+    checks = [f"mock-check:{task_id}"]
+    if task.get("is_hotfix"):
+        checks.append(f"mock-hotfix-check:{task_id}")
+
+    output_file = _choose_output_file(task)
+    file_updates = []
+    if output_file:
+        file_updates = [
+            {
+                "path": output_file,
+                "content": _build_file_content(task),
             }
+        ]
+
+    event = {
+        "action": "complete",
+        "task_id": task_id,
+        "prior_status": "in_progress",
+        "notes": "mock complete",
+        "verification": {"checks": checks},
+    }
+    if task.get("is_hotfix"):
+        event["issue_id"] = task["issue_id"]
+        event["fixes"] = task["fixes"]
+    return {"activity_event": event, "file_updates": file_updates}
+
+
+def _review(task: dict[str, Any]) -> dict[str, Any]:
+    task_id = task["task_id"]
+    return {
+        "activity_event": {
+            "action": "review",
+            "task_id": task_id,
+            "prior_status": "review",
+            "decision": "approve",
+            "tasks": [task_id],
+            "notes": "mock review approve",
+        }
+    }
+
+
+def _report_not_actionable(task: dict[str, Any]) -> dict[str, Any]:
+    task_id = task["task_id"]
+    status = task["status"]
+    return {
+        "activity_event": {
+            "action": "issue.report",
+            "task_id": task_id,
+            "prior_status": status if status in _STATUS_HANDLERS else "in_progress",
+            "issue_id": f"ISS-MOCK-{task_id}",
+            "severity": "low",
+            "title": "Task not actionable",
+            "evidence": {
+                "symptom": f"task status is {status}",
+                "repro_steps": [f"load task {task_id}", f"check status {status}"],
+            },
         }
+    }
+
+
+# Dispatch por status; qualquer outro status (done, desconhecido) vira issue.report.
+# Cada handler devolve dicts novos: o chamador valida e pode muta-los.
+_STATUS_HANDLERS: dict[str, Callable[[dict[str, Any]], dict[str, Any]]] = {
+    "todo": _claim,
+    "in_progress": _complete,
+    "review": _review,
+}
 
 
 def _choose_output_file(task: dict[str, Any]) -> str:
     outputs = task.get("outputs", {}).get("files", [])
-    task_kind = task["task_kind"]
+    return _output_file_for(task["task_id"], task["task_kind"], tuple(outputs))
+
+
+@lru_cache(maxsize=128)
+def _output_file_for(task_id: str, task_kind: str, outputs: tuple[str, ...]) -> str:
     for output in outputs:
         if output.startswith("runtime://"):
             continue
         if _path_allowed_for_kind(output, task_kind):
             return output
     if task_kind == "spec":
-        return f"docs/spec/{task['task_id']}.md"
+        return f"docs/spec/{task_id}.md"
     if task_kind == "impl":
-        return f"src/{task['task_id'].lower()}.txt"
-    return f"docs/qa/{task['task_id']}.md"
+        return f"src/{task_id.lower()}.txt"
+    return f"docs/qa/{task_id}.md"
 
 
 def _path_allowed_for_kind(path: str, task_kind: str) -> bool:
@@ -107,10 +130,11 @@ def _path_allowed_for_kind(path: str, task_kind: str) -> bool:
     return path.startswith("src/hotfix/")
 
 
+# Conteudo deterministico do fixture; um unico format por arquivo gerado.
+_FILE_TEMPLATE = (
+    "# {task_id}\n\n- kind: {task_kind}\n- generated_by: mock_adapter\n- note: deterministic fixture output\n"
+)
+
+
 def _build_file_content(task: dict[str, Any]) -> str:
-    return (
-        f"# {task['task_id']}\n\n"
-        f"- kind: {task['task_kind']}\n"
-        f"- generated_by: mock_adapter\n"
-        f"- note: deterministic fixture output\n"
-    )
+    return _FILE_TEMPLATE.format(task_id=task["task_id"], task_kind=task["task_kind"])
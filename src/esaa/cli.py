@@ -5,36 +5,50 @@ import json
 import os
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from .adapters.http_llm import HttpLlmAdapter
-from .bootstrap import bootstrap_workspace
+from . import jsonio
 from .constants import ESAA_VERSION, PACKAGE_VERSION, SCHEMA_VERSION
 from .errors import ESAAError
-from .plugins import (
-    activate_roadmap,
-    deactivate_roadmap,
-    diagnose_plugin,
-    install_plugin,
-    list_available_plugins,
-    list_installed_plugins,
-    list_roadmaps,
-    remove_plugin,
-    scaffold_plugin,
-    set_roadmap_status,
-    validate_plugin,
-)
 from .provenance import ENV_RUNNER_ID
-from .runner_inputs import register_commands_input, show_commands_input, validate_commands_input
-from .scenarios import run_hotfix_trace
-from .service import ESAAService
-from .snapshot import compact_event_store, create_snapshot
-from .store import init_hash_chain, verify_hash_chain
-from .vocabulary import vocabulary_payload
+
+if TYPE_CHECKING:
+    from .service import ESAAService
+
+# Comandos que operam via ESAAService. Os demais (plugin, vocabulary, snapshot,
+# ...) nao importam o service: imports pesados (jsonschema, projector, plugins)
+# sao adiados para o ramo do comando escolhido, encurtando `esaa --help`.
+_SERVICE_COMMANDS = frozenset(
+    {
+        "init",
+        "run",
+        "submit",
+        "claim",
+        "complete",
+        "review",
+        "state",
+        "dispatch-context",
+        "reject",
+        "task",
+        "issue",
+        "hotfix",
+        "activity",
+        "process",
+        "project",
+        "verify",
+        "eligible",
+        "metrics",
+        "effects",
+        "runner",
+        "replay",
+    }
+)
 
 
 def _read_json_arg(path_arg: str) -> object:
-    raw = sys.stdin.read() if path_arg == "-" else Path(path_arg).read_text(encoding="utf-8")
-    return json.loads(raw)
+    # Bytes direto para o parser: evita decode UTF-8 + copia str antes do loads.
+    raw = sys.stdin.buffer.read() if path_arg == "-" else Path(path_arg).read_bytes()
+    return jsonio.loads(raw)
 
 
 def _read_file_updates(path_arg: str) -> list[dict[str, str]]:
@@ -57,7 +71,7 @@ def _plugin_status(root: Path, detail: bool = False, plugin_filter: str | None =
     projected_status: dict[str, str] = {}
     if projection_path.is_file():
         try:
-            proj = json.loads(projection_path.read_text(encoding="utf-8"))
+            proj = jsonio.loads(projection_path.read_bytes())
             for t in proj.get("tasks", []):
                 tid = t.get("task_id")
                 if tid:
@@ -74,7 +88,7 @@ def _plugin_status(root: Path, detail: bool = False, plugin_filter: str | None =
         if plugin_filter and path.name != plugin_filter:
             continue
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            data = jsonio.loads(path.read_bytes())
         except (ValueError, OSError):
             continue
         tasks = data.get("tasks") or []
@@ -406,42 +420,60 @@ def _build_parser() -> argparse.ArgumentParser:
     cmd_replay = sub.add_parser("replay", help="rebuild state until event id/seq")
     cmd_replay.add_argument("--until", default=None, help="event_seq (number) or event_id")
     cmd_replay.add_argument("--no-write", action="store_true", help="compute replay without writing views")
+    cmd_replay.add_argument(
+        "--rebuild", action="store_true", help="ignore state checkpoints and replay from the first event"
+    )
     return parser
 
 
-def main(argv: list[str] | None = None) -> int:
-    args = _build_parser().parse_args(argv)
-    if getattr(args, "runner", None):
-        os.environ[ENV_RUNNER_ID] = args.runner  # G08: precedencia CLI > env > default
-    root = Path(args.root).resolve()
+def _make_service(root: Path, args: argparse.Namespace) -> ESAAService:
+    from .service import ESAAService
+
     adapter = None
-    if getattr(args, "command", None) == "run" and getattr(args, "adapter", "mock") == "http":
+    if args.command == "run" and args.adapter == "http":
+        from .adapters.http_llm import HttpLlmAdapter
+
         url = args.llm_url
         if url:
             adapter = HttpLlmAdapter(url=url, token=args.llm_token, timeout=args.llm_timeout)
         else:
             adapter = HttpLlmAdapter.from_env()
-    service = ESAAService(root=root, adapter=adapter)
+    return ESAAService(root=root, adapter=adapter)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = _build_parser().parse_args(argv)
+    if getattr(args, "runner", None):
+        os.environ[ENV_RUNNER_ID] = args.runner  # G08: precedencia CLI > env > default
+    root = Path(args.root).resolve()
+    lazy_service = _make_service(root, args) if args.command in _SERVICE_COMMANDS else None
+
+    def service() -> ESAAService:
+        # So ramos de _SERVICE_COMMANDS chamam service(); os demais nunca constroem o service().
+        assert lazy_service is not None, f"{args.command} is missing from _SERVICE_COMMANDS"
+        return lazy_service
 
     try:
         if args.command == "bootstrap":
+            from .bootstrap import bootstrap_workspace
+
             result = bootstrap_workspace(root, profile=args.profile, force=args.force)
         elif args.command == "init":
-            result = service.init(
+            result = service().init(
                 run_id=args.run_id,
                 master_correlation_id=args.master_correlation_id,
                 force=args.force,
             )
         elif args.command == "run":
             steps = None if args.until_done else args.steps
-            result = service.run(steps=steps, dry_run=args.dry_run, parallel=args.parallel)
+            result = service().run(steps=steps, dry_run=args.dry_run, parallel=args.parallel)
         elif args.command == "submit":
             agent_output = _read_json_arg(args.file)
             if not isinstance(agent_output, dict):
                 raise ESAAError("SCHEMA_INVALID", "submit payload must be a JSON object")
-            result = service.submit(agent_output, actor=args.actor, dry_run=args.dry_run)
+            result = service().submit(agent_output, actor=args.actor, dry_run=args.dry_run)
         elif args.command == "claim":
-            result = service.claim_task(
+            result = service().claim_task(
                 args.task_id,
                 actor=args.actor,
                 notes=args.notes,
@@ -449,7 +481,7 @@ def main(argv: list[str] | None = None) -> int:
             )
         elif args.command == "complete":
             file_updates = _read_file_updates(args.file_updates) if args.file_updates else None
-            result = service.complete_task(
+            result = service().complete_task(
                 args.task_id,
                 actor=args.actor,
                 checks=args.checks,
@@ -460,7 +492,7 @@ def main(argv: list[str] | None = None) -> int:
                 dry_run=args.dry_run,
             )
         elif args.command == "review":
-            result = service.review_task(
+            result = service().review_task(
                 args.task_id,
                 actor=args.actor,
                 decision=args.decision,
@@ -468,11 +500,11 @@ def main(argv: list[str] | None = None) -> int:
                 dry_run=args.dry_run,
             )
         elif args.command == "state":
-            result = service.task_state(args.task_id)
+            result = service().task_state(args.task_id)
         elif args.command == "dispatch-context":
-            result = service.dispatch_context(args.task_id)
+            result = service().dispatch_context(args.task_id)
         elif args.command == "reject":
-            result = service.reject_output(
+            result = service().reject_output(
                 args.task_id,
                 error_code=args.error_code,
                 source_action=args.source_action,
@@ -480,7 +512,7 @@ def main(argv: list[str] | None = None) -> int:
                 dry_run=args.dry_run,
             )
         elif args.command == "task" and args.task_command == "create":
-            result = service.create_task(
+            result = service().create_task(
                 args.task_id,
                 task_kind=args.kind,
                 title=args.title,
@@ -492,7 +524,7 @@ def main(argv: list[str] | None = None) -> int:
                 dry_run=args.dry_run,
             )
         elif args.command == "issue" and args.issue_command == "report":
-            result = service.report_issue(
+            result = service().report_issue(
                 args.task_id,
                 actor=args.actor,
                 issue_id=args.issue_id,
@@ -504,37 +536,43 @@ def main(argv: list[str] | None = None) -> int:
                 dry_run=args.dry_run,
             )
         elif args.command == "issue" and args.issue_command == "resolve":
-            result = service.resolve_issue(
+            result = service().resolve_issue(
                 args.issue_id,
                 hotfix_task_id=args.hotfix_task_id,
                 dry_run=args.dry_run,
             )
         elif args.command == "hotfix" and args.hotfix_command == "create":
-            result = service.create_hotfix(
+            result = service().create_hotfix(
                 issue_id=args.issue_id,
                 fixes=args.fixes,
                 scope_patch=args.scope_patch,
                 dry_run=args.dry_run,
             )
         elif args.command == "activity" and args.activity_command == "clear":
-            result = service.clear_activity(
+            result = service().clear_activity(
                 force=args.force,
                 dry_run=args.dry_run,
                 backup_dir=args.backup_dir,
             )
         elif args.command == "process":
-            result = service.process(dry_run=args.dry_run)
+            result = service().process(dry_run=args.dry_run)
         elif args.command == "project":
-            result = service.project()
+            result = service().project()
         elif args.command == "verify":
-            result = verify_hash_chain(root) if getattr(args, "chain", False) else service.verify()
+            from .store import verify_hash_chain
+
+            result = verify_hash_chain(root) if getattr(args, "chain", False) else service().verify()
         elif args.command == "chain" and args.chain_command == "init":
+            from .store import init_hash_chain
+
             result = init_hash_chain(root, force=args.force)
         elif args.command == "eligible":
-            result = service.eligible()
+            result = service().eligible()
         elif args.command == "metrics":
-            result = service.metrics()
+            result = service().metrics()
         elif args.command == "input" and args.input_command == "commands":
+            from .runner_inputs import register_commands_input, show_commands_input, validate_commands_input
+
             if args.commands_command == "validate":
                 result = validate_commands_input(Path(args.path))
             elif args.commands_command == "register":
@@ -544,6 +582,8 @@ def main(argv: list[str] | None = None) -> int:
             else:
                 raise ESAAError("UNKNOWN_COMMAND", f"unknown input commands action: {args.commands_command}")
         elif args.command == "plugin" and args.plugin_command == "list":
+            from .plugins import list_available_plugins, list_installed_plugins
+
             source_filter = None
             if args.bundled and args.external:
                 raise ESAAError("INVALID_ARGUMENT", "--bundled and --external are mutually exclusive")
@@ -559,20 +599,36 @@ def main(argv: list[str] | None = None) -> int:
                 ),
             }
         elif args.command == "plugin" and args.plugin_command == "new":
+            from .plugins import scaffold_plugin
+
             result = scaffold_plugin(root, args.plugin_id, directory=args.directory)
         elif args.command == "plugin" and args.plugin_command == "validate":
+            from .plugins import validate_plugin
+
             result = validate_plugin(root, args.plugin_ref)
         elif args.command == "plugin" and args.plugin_command == "doctor":
+            from .plugins import diagnose_plugin
+
             result = diagnose_plugin(root, args.plugin_ref)
         elif args.command == "plugin" and args.plugin_command == "install":
+            from .plugins import install_plugin
+
             result = install_plugin(root, args.plugin_ref)
         elif args.command == "plugin" and args.plugin_command == "remove":
+            from .plugins import remove_plugin
+
             result = remove_plugin(root, args.plugin_id)
         elif args.command == "plugin" and args.plugin_command == "status":
+            from .plugins import list_roadmaps
+
             result = {"roadmaps": list_roadmaps(root, detail=args.detail)}
         elif args.command == "roadmap" and args.roadmap_command in {"list", "status"}:
+            from .plugins import list_roadmaps
+
             result = {"roadmaps": list_roadmaps(root, detail=args.detail)}
         elif args.command == "roadmap" and args.roadmap_command == "activate":
+            from .plugins import activate_roadmap
+
             result = activate_roadmap(
                 root,
                 args.plugin_id,
@@ -580,15 +636,21 @@ def main(argv: list[str] | None = None) -> int:
                 input_path=args.input_path,
             )
         elif args.command == "roadmap" and args.roadmap_command == "pause":
+            from .plugins import set_roadmap_status
+
             result = set_roadmap_status(root, args.plugin_id, args.execution_id, "paused")
         elif args.command == "roadmap" and args.roadmap_command == "resume":
+            from .plugins import set_roadmap_status
+
             result = set_roadmap_status(root, args.plugin_id, args.execution_id, "active")
         elif args.command == "roadmap" and args.roadmap_command == "deactivate":
+            from .plugins import deactivate_roadmap
+
             result = deactivate_roadmap(root, args.plugin_id, args.execution_id)
         elif args.command == "plugin-status":
             result = _plugin_status(root, detail=args.detail, plugin_filter=args.plugin)
         elif args.command == "effects" and args.effects_command == "recover":
-            result = service.recover_file_effects(dry_run=args.dry_run)
+            result = service().recover_file_effects(dry_run=args.dry_run)
         elif args.command == "runner" and args.runner_command == "metrics":
             if args.file:
                 payload = _read_json_arg(args.file)
@@ -613,20 +675,26 @@ def main(argv: list[str] | None = None) -> int:
                     "error_code": args.error_code,
                     "correlation_id": args.correlation_id,
                 }
-            result = service.record_runner_metrics(payload, dry_run=args.dry_run)
+            result = service().record_runner_metrics(payload, dry_run=args.dry_run)
         elif args.command == "scenario" and args.scenario_command == "hotfix":
+            from .scenarios import run_hotfix_trace
+
             result = run_hotfix_trace(
                 root, target_root=root if args.current else None, issue_id=args.issue_id
             )
         elif args.command == "vocabulary":
+            from .vocabulary import vocabulary_payload
+
             result = vocabulary_payload(profile=args.profile)
         elif args.command == "snapshot":
+            from .snapshot import compact_event_store, create_snapshot
+
             if args.compact:
                 result = compact_event_store(root, before=args.before, dry_run=args.dry_run)
             else:
                 result = create_snapshot(root, before=args.before, dry_run=args.dry_run)
         elif args.command == "replay":
-            result = service.replay(until=args.until, write_views=not args.no_write)
+            result = service().replay(until=args.until, write_views=not args.no_write, rebuild=args.rebuild)
         else:
             raise ESAAError("UNKNOWN_COMMAND", f"unknown command: {args.command}")
 
@@ -2,9 +2,19 @@ from __future__ import annotations
 
 from typing import Any
 
+# Status legados de verify (v0.3) -> canonicos (v0.4).
+_LEGACY_VERIFY_STATUS = {"fail": "mismatch"}
+
 
 def normalize_legacy_event(raw: dict[str, Any]) -> dict[str, Any]:
-    """Normalize v0.3-style events into canonical v0.4 shape."""
+    """Normalize v0.3-style events into canonical v0.4 shape.
+
+    Eventos ja canonicos (caso comum) sao devolvidos sem copia; so um evento
+    que precisa de reescrita gera um dict novo.
+    """
+    if "data" not in raw and "schema_version" in raw and raw.get("action") != "run.init":
+        return raw
+
     event = dict(raw)
 
     if "payload" not in event and "data" in event:
@@ -22,6 +32,4 @@ def normalize_legacy_event(raw: dict[str, Any]) -> dict[str, Any]:
 
 
 def normalize_legacy_verify_status(status: str) -> str:
-    if status == "fail":
-        return "mismatch"
-    return status
+    return _LEGACY_VERIFY_STATUS.get(status, status)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import sys
+
 SCHEMA_VERSION = "0.4.1"
 ESAA_VERSION = "0.4.x"
 PACKAGE_VERSION = "0.5.0b9"  # QUA-02: fonte unica de versao; pyproject usa [tool.setuptools.dynamic]
@@ -14,27 +16,58 @@ ROADMAP_SCHEMA_PATH = ".roadmap/roadmap.schema.json"
 AGENT_RESULT_SCHEMA_PATH = ".roadmap/agent_result.schema.json"
 AGENT_CONTRACT_PATH = ".roadmap/AGENT_CONTRACT.yaml"
 
-CANONICAL_ACTIONS = {
-    "run.start",
-    "run.end",
-    "task.create",
-    "claim",
-    "complete",
-    "review",
-    "issue.report",
-    "hotfix.create",
-    "issue.resolve",
-    "runner.metrics",
-    "chain.anchor",
-    "output.rejected",
-    "orchestrator.file.write",
-    "orchestrator.view.mutate",
-    "verify.start",
-    "verify.ok",
-    "verify.fail",
-}
-
-RUN_STATUS = {"initialized", "running", "success", "failed", "halted"}
-VERIFY_STATUS = {"unknown", "ok", "mismatch", "corrupted"}
-TASK_STATUS = {"todo", "in_progress", "review", "done"}
-TASK_KINDS = {"spec", "impl", "qa"}
+# Actions internadas (sys.intern): o loader do store interna event["action"], entao
+# lookups nesses sets e na tabela de handlers do projetor resolvem por identidade.
+CANONICAL_ACTIONS = frozenset(
+    map(
+        sys.intern,
+        {
+            "run.start",
+            "run.end",
+            "task.create",
+            "claim",
+            "complete",
+            "review",
+            "issue.report",
+            "hotfix.create",
+            "issue.resolve",
+            "runner.metrics",
+            "chain.anchor",
+            "output.rejected",
+            "orchestrator.file.write",
+            "orchestrator.view.mutate",
+            "verify.start",
+            "verify.ok",
+            "verify.fail",
+        },
+    )
+)
+
+RUN_STATUS = frozenset({"initialized", "running", "success", "failed", "halted"})
+VERIFY_STATUS = frozenset({"unknown", "ok", "mismatch", "corrupted"})
+TASK_STATUS = frozenset({"todo", "in_progress", "review", "done"})
+TASK_KINDS = frozenset({"spec", "impl", "qa"})
+
+# Actions que apenas avancam last_event_seq/updated_at na projecao (sem efeito no read model).
+NOOP_ACTIONS = frozenset(
+    map(
+        sys.intern,
+        {
+            "output.rejected",
+            "orchestrator.file.write",
+            "runner.metrics",
+            "chain.anchor",
+            "verify.start",
+            "plugin.install",
+            "plugin.remove",
+            "plugin.update",
+            "roadmap.activate",
+            "roadmap.pause",
+            "roadmap.resume",
+            "roadmap.deactivate",
+        },
+    )
+)
+
+# FIX-1807: roles que revisam sem ser owner do lock (review_authorization=qa_role).
+REVIEWER_ROLES = frozenset({"qa", "orchestrator"})
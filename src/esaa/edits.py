@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import re
+from collections.abc import Sequence
 from pathlib import Path, PurePosixPath
 from typing import Any
 
@@ -55,7 +56,7 @@ def apply_edits(text: str, edits: list[dict[str, Any]], path: str) -> str:
     return current
 
 
-def resolve_edit_updates(root: Path, file_updates: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def resolve_edit_updates(root: Path, file_updates: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
     resolved: list[dict[str, Any]] = []
     for item in file_updates:
         if "edits" not in item:
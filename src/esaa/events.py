@@ -5,19 +5,22 @@ from typing import Any
 
 from .constants import SCHEMA_VERSION
 from .errors import ESAAError
-from .projector import materialize
+from .projector import ProjectionState
 from .provenance import resolve_runner
 from .store import next_event_seq
 from .utils import utc_now_iso
 
 
-def make_event(event_seq: int, actor: str, action: str, payload: dict[str, Any]) -> dict[str, Any]:
+def make_event(
+    event_seq: int, actor: str, action: str, payload: dict[str, Any], ts: str | None = None
+) -> dict[str, Any]:
+    """Monta um evento canonico; ``ts`` permite a um lote atomico compartilhar um unico timestamp."""
 
     return {
         "schema_version": SCHEMA_VERSION,
         "event_id": f"EV-{event_seq:08d}",
         "event_seq": event_seq,
-        "ts": utc_now_iso(),
+        "ts": ts or utc_now_iso(),
         "actor": actor,
         "runner": resolve_runner(),  # G08/PROV-01: proveniencia carimbada pelo single writer
         "action": action,
@@ -25,13 +28,18 @@ def make_event(event_seq: int, actor: str, action: str, payload: dict[str, Any])
     }
 
 
+def _as_projection(current: list[dict[str, Any]] | ProjectionState) -> ProjectionState:
+    return current if isinstance(current, ProjectionState) else ProjectionState(current)
+
+
 def validate_hotfix_request(
-    current_events: list[dict[str, Any]],
+    current_events: list[dict[str, Any]] | ProjectionState,
     issue_payload: dict[str, Any],
 ) -> tuple[bool, str | None, str | None]:
     """FIX-1811 - Valida payload de issue.report para criar hotfix.
 
-
+    ``current_events`` pode ser a lista de eventos ou uma ProjectionState ja
+    projetada (submit/run), o que evita reprojetar o log.
 
     Returns (ok, error_code, message). Se ok=True, hotfix pode ser criado.
 
@@ -51,17 +59,11 @@ def validate_hotfix_request(
 
         return False, "HOTFIX_TARGET_NOT_FOUND", "fixes ausente"
 
-    # Materializa projecao atual para inspecionar issues e tasks
-
-    roadmap, issues_view, _ = materialize(current_events)
-
-    tasks_by_id = {t["task_id"]: t for t in roadmap.get("tasks", [])}
-
-    issues_by_id = {i["issue_id"]: i for i in issues_view.get("issues", [])}
+    projection = _as_projection(current_events)
 
     # 1. fixes deve apontar para task existente
 
-    target = tasks_by_id.get(fixes)
+    target = projection.task(fixes)
 
     if target is None:
 
@@ -93,11 +95,13 @@ def validate_hotfix_request(
 
     # 4. issue deve existir e estar open
 
-    if issue_id not in issues_by_id:
+    issue = projection.issue(issue_id)
+
+    if issue is None:
 
         return False, "HOTFIX_ISSUE_NOT_FOUND", f"issue {issue_id} nao encontrada"
 
-    issue_status = issues_by_id[issue_id].get("status")
+    issue_status = issue.get("status")
 
     if issue_status != "open":
 
@@ -107,7 +111,7 @@ def validate_hotfix_request(
 
 
 def build_hotfix_event(
-    current_events: list[dict[str, Any]],
+    current_events: list[dict[str, Any]] | ProjectionState,
     issue_payload: dict[str, Any],
     *,
     raise_on_invalid: bool = True,
@@ -125,22 +129,21 @@ def build_hotfix_event(
     if not issue_id or not fixes:
         return None
 
+    projection = _as_projection(current_events)
+
     # M-03: validacao agora interna; caller nao precisa duplicar.
-    ok, code, message = validate_hotfix_request(current_events, issue_payload)
+    ok, code, message = validate_hotfix_request(projection, issue_payload)
     if not ok:
         if raise_on_invalid:
             raise ESAAError(code or "HOTFIX_INVALID", message or "invalid hotfix request")
         return None
 
     hotfix_task_id = f"HF-{issue_id}"
-    for event in current_events:
-        if event["action"] == "hotfix.create" and event["payload"].get("task_id") == hotfix_task_id:
-            return None
-
-    seq = next_event_seq(current_events)
+    if projection.has_hotfix_task(hotfix_task_id):
+        return None
 
     return make_event(
-        seq,
+        projection.next_seq,
         actor="orchestrator",
         action="hotfix.create",
         payload={
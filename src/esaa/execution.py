@@ -2,12 +2,13 @@ from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from itertools import chain
 from typing import Any
 
 from .errors import ESAAError
 from .events import make_event
 from .file_effects import commit_staged, discard_staged
-from .projector import materialize
+from .projector import ProjectionState, materialize
 from .runtime_policy import (
     attempt_expired,
     is_blocked_by_max_attempts,
@@ -22,7 +23,8 @@ from .seeds import (
     select_task_wave,
     tasks_with_planned_plugins,
 )
-from .store import load_agent_contract, load_agent_result_schema, next_event_seq, parse_event_store
+from .store import load_agent_contract, load_agent_result_schema, parse_event_store
+from .utils import utc_now_iso
 
 
 class ExecutionMixin:
@@ -120,11 +122,21 @@ class ExecutionMixin:
 
         iteration = 0
 
+        # Estado de `events + new_events` mantido durante todo o run: cada evento novo
+        # e aplicado uma vez, sem reprojetar o historico a cada iteracao.
+        projection = ProjectionState(events)
+
+        base_hash = projection.snapshot()[0]["meta"]["run"]["projection_hash_sha256"]
+
+        def record(event: dict[str, Any]) -> None:
+            new_events.append(event)
+            projection.apply(event)
+
         while steps is None or iteration < steps:
 
             iteration += 1
 
-            roadmap, _, _ = materialize(events + new_events)
+            roadmap, _, _ = projection.snapshot()
             effective_tasks, _ = tasks_with_planned_plugins(self.root, roadmap["tasks"])
             effective_roadmap = {**roadmap, "tasks": effective_tasks}
 
@@ -135,8 +147,8 @@ class ExecutionMixin:
             candidates = [
                 t
                 for t in effective_roadmap["tasks"]
-                if not is_blocked_by_max_attempts(events + new_events, t["task_id"], max_attempts)
-                and not is_in_cooldown(events + new_events, t["task_id"], now, cooldown)
+                if not is_blocked_by_max_attempts(chain(events, new_events), t["task_id"], max_attempts)
+                and not is_in_cooldown(chain(events, new_events), t["task_id"], now, cooldown)
             ]
 
             wave = select_task_wave(candidates, limit=parallel)
@@ -151,14 +163,13 @@ class ExecutionMixin:
 
             for task in wave:
 
+                # Timeouts anexados neste laco sao output.rejected: nao mudam claim/complete do historico.
                 if task["status"] == "in_progress" and attempt_expired(
-                    events + new_events, task["task_id"], now, ttl
+                    chain(events, new_events), task["task_id"], now, ttl
                 ):
 
-                    seq_to = next_event_seq(events + new_events)
-
                     timeout_ev = make_event(
-                        seq_to,
+                        projection.next_seq,
                         actor="orchestrator",
                         action="output.rejected",
                         payload={
@@ -169,7 +180,7 @@ class ExecutionMixin:
                         },
                     )
 
-                    new_events.append(timeout_ev)
+                    record(timeout_ev)
 
                     blocked += 1
 
@@ -228,10 +239,10 @@ class ExecutionMixin:
 
             for task, output, execute_error in outputs:
 
-                current_seq = next_event_seq(events + new_events)
-
                 executed += 1
 
+                accepting = False
+
                 try:
 
                     if execute_error is not None:
@@ -248,6 +259,8 @@ class ExecutionMixin:
 
                     assert output is not None
 
+                    accepting = True
+
                     files_written += self._accept_agent_output(
                         events,
                         new_events,
@@ -258,13 +271,18 @@ class ExecutionMixin:
                         dry_run,
                         wave_write_set=run_write_set,
                         staged_file_effects=staged_file_effects,
+                        projection=projection,
                     )
                 except ESAAError as exc:
 
+                    if accepting:
+                        # Candidatos rejeitados podem ter sido aplicados: reconstroi o estado do run.
+                        projection = ProjectionState(chain(events, new_events))
+
                     rejected += 1
 
                     reject_event = make_event(
-                        current_seq,
+                        projection.next_seq,
                         actor="orchestrator",
                         action="output.rejected",
                         payload={
@@ -279,16 +297,14 @@ class ExecutionMixin:
                         },
                     )
 
-                    new_events.append(reject_event)
+                    record(reject_event)
 
                     # R2: se atingiu max_attempts, escalar via issue.report severity=high
 
-                    if is_blocked_by_max_attempts(events + new_events, task["task_id"], max_attempts):
-
-                        esc_seq = next_event_seq(events + new_events)
+                    if is_blocked_by_max_attempts(chain(events, new_events), task["task_id"], max_attempts):
 
                         esc = make_event(
-                            esc_seq,
+                            projection.next_seq,
                             actor="orchestrator",
                             action="issue.report",
                             payload={
@@ -303,14 +319,17 @@ class ExecutionMixin:
                             },
                         )
 
-                        new_events.append(esc)
+                        record(esc)
 
                 except ValueError as exc:
 
+                    if accepting:
+                        projection = ProjectionState(chain(events, new_events))
+
                     rejected += 1
 
                     reject_event = make_event(
-                        current_seq,
+                        projection.next_seq,
                         actor="orchestrator",
                         action="output.rejected",
                         payload={
@@ -321,56 +340,59 @@ class ExecutionMixin:
                         },
                     )
 
-                    new_events.append(reject_event)
+                    record(reject_event)
 
-        final_events = events + new_events
+        ts = utc_now_iso()  # bloco final de verificacao gravado junto: um unico timestamp
 
-        final_roadmap, final_issues, final_lessons = materialize(final_events)
+        final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         if all_tasks_done(final_roadmap["tasks"]) and final_roadmap["meta"]["run"]["status"] != "success":
 
             run_end = make_event(
-                next_event_seq(final_events),
+                projection.next_seq,
                 actor="orchestrator",
                 action="run.end",
                 payload={"status": "success"},
+                ts=ts,
             )
 
-            final_events.append(run_end)
-
             new_events.append(run_end)
 
-            final_roadmap, final_issues, final_lessons = materialize(final_events)
+            projection.apply(run_end)
+
+            final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         verify_start = make_event(
-            next_event_seq(final_events),
+            projection.next_seq,
             actor="orchestrator",
             action="verify.start",
             payload={"strict": True},
+            ts=ts,
         )
 
-        final_events.append(verify_start)
-
         new_events.append(verify_start)
 
-        final_roadmap, final_issues, final_lessons = materialize(final_events)
+        projection.apply(verify_start)
+
+        final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         verify_ok = make_event(
-            next_event_seq(final_events),
+            projection.next_seq,
             actor="orchestrator",
             action="verify.ok",
             payload={"projection_hash_sha256": final_roadmap["meta"]["run"]["projection_hash_sha256"]},
+            ts=ts,
         )
 
-        final_events.append(verify_ok)
-
         new_events.append(verify_ok)
 
-        final_roadmap, final_issues, final_lessons = materialize(final_events)
+        projection.apply(verify_ok)
+
+        final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         if not dry_run:
             try:
-                self._append_events_transactionally(events, new_events)
+                self._append_events_transactionally(events, new_events, base_hash)
                 commit_staged(self.root, staged_file_effects)
             except Exception:
                 discard_staged(staged_file_effects)
@@ -55,10 +55,12 @@ def stage_file_updates(root: Path, file_updates: list[dict[str, str]]) -> list[d
     for i, item in enumerate(file_updates):
         final_path = item["path"].replace("\\", "/")
         content = item["content"]
+        # Encode uma vez: os mesmos bytes dao o nome e o conteudo (write_text com newline="" e identico).
+        data = content.encode("utf-8")
         # Use hash-based staging name to avoid collisions
-        staged_name = f"stage-{i:04d}-{_sha256_bytes(content.encode('utf-8'))[:12]}.tmp"
+        staged_name = f"stage-{i:04d}-{_sha256_bytes(data)[:12]}.tmp"
         staged_path = staging_root / staged_name
-        staged_path.write_text(content, encoding="utf-8", newline="")
+        staged_path.write_bytes(data)
         staged.append(
             {
                 "final_path": final_path,
@@ -77,10 +79,14 @@ def stage_file_updates(root: Path, file_updates: list[dict[str, str]]) -> list[d
 
 def commit_staged(root: Path, staged: list[dict[str, Any]]) -> None:
     """Apply staged files atomically to final paths."""
+    # Um mkdir por diretorio de destino, nao por arquivo.
+    created: set[Path] = set()
     for entry in staged:
         final = Path(entry["final_abs_path"]) if entry.get("final_abs_path") else root / entry["final_path"]
         staged_p = Path(entry["staged_path"])
-        final.parent.mkdir(parents=True, exist_ok=True)
+        if final.parent not in created:
+            final.parent.mkdir(parents=True, exist_ok=True)
+            created.add(final.parent)
         os.replace(staged_p, final)
 
 
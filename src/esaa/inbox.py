@@ -0,0 +1,195 @@
+"""Processamento do inbox (`esaa process`) em lote: um parse do store, um append por lote."""
+
+from __future__ import annotations
+
+import os
+from typing import Any
+
+from . import jsonio
+from .errors import ESAAError
+from .file_effects import commit_staged, discard_staged
+from .store import load_agent_contract, load_agent_result_schema, parse_event_store
+from .utils import normalize_rel_path
+
+
+def _rejection(exc: ESAAError) -> dict[str, Any]:
+    return {"status": "rejected", "error_code": exc.code, "error": exc.message}
+
+
+def _error_fields(rejection: dict[str, Any]) -> dict[str, Any]:
+    return {key: rejection[key] for key in ("error", "error_code") if key in rejection}
+
+
+def _raw_update_paths(agent_output: dict[str, Any]) -> set[str]:
+    updates = agent_output.get("file_updates") if isinstance(agent_output, dict) else None
+    if not isinstance(updates, list):
+        return set()
+    return {
+        normalize_rel_path(item["path"])
+        for item in updates
+        if isinstance(item, dict) and isinstance(item.get("path"), str)
+    }
+
+
+def _read_entry(entry: os.DirEntry[str]) -> bytes:
+    with open(entry.path, "rb") as handle:
+        return handle.read()
+
+
+class InboxMixin:
+    def submit_batch(
+        self, submissions: list[tuple[str, dict[str, Any]]], dry_run: bool = False
+    ) -> list[dict[str, Any]]:
+        """Aplica (actor, agent_output) em sequencia com um parse do store e um append por lote.
+
+        Cada submissao e validada contra o store + eventos pendentes do lote. O lote e
+        descarregado antes de uma submissao que toca path ja staged (edits leem o disco).
+        """
+        events = parse_event_store(self.root)
+        contract = load_agent_contract(self.root)
+        schema = load_agent_result_schema(self.root)
+        policy = self._policy()
+        results: list[dict[str, Any]] = []
+        pending_events: list[dict[str, Any]] = []
+        pending_staged: list[dict[str, Any]] = []
+        pending_results: list[int] = []
+        pending_paths: set[str] = set()
+        base_hash: list[str] = []  # projection hash de `events`, capturado no primeiro stage do lote
+
+        def flush() -> list[dict[str, Any]]:
+            if not pending_events:
+                return events
+            if dry_run:
+                # Nada a gravar: os pendentes passam a base, como apos um append real.
+                flushed = events + pending_events
+                pending_events.clear()
+                pending_staged.clear()
+                pending_results.clear()
+                pending_paths.clear()
+                base_hash.clear()
+                return flushed
+            try:
+                self._append_events_transactionally(events, pending_events, base_hash[0])
+                commit_staged(self.root, pending_staged)
+            except ESAAError as exc:
+                discard_staged(pending_staged)
+                for index in pending_results:
+                    results[index] = _rejection(exc)
+            except Exception:
+                discard_staged(pending_staged)
+                raise
+            pending_events.clear()
+            pending_staged.clear()
+            pending_results.clear()
+            pending_paths.clear()
+            base_hash.clear()
+            return parse_event_store(self.root)
+
+        for actor, agent_output in submissions:
+            paths = _raw_update_paths(agent_output)
+            if paths & pending_paths:
+                events = flush()
+            try:
+                result, new_events, staged, projection_hash = self._stage_submission(
+                    events + pending_events, agent_output, actor, dry_run, contract, schema, policy
+                )
+            except ESAAError as exc:
+                results.append(_rejection(exc))
+                continue
+            if not pending_events:
+                base_hash[:] = [projection_hash]
+            pending_events.extend(new_events)
+            pending_staged.extend(staged)
+            pending_results.append(len(results))
+            pending_paths |= paths
+            results.append(result)
+        flush()
+        return results
+
+    def process(self, dry_run: bool = False) -> dict[str, Any]:
+
+        inbox = self.root / ".roadmap" / "inbox"
+
+        # scandir entrega nome e tipo numa unica listagem, sem stat por arquivo (nem do proprio inbox).
+        try:
+
+            with os.scandir(inbox) as it:
+
+                files = sorted(
+                    (e for e in it if e.name.endswith(".json") and e.is_file()), key=lambda e: e.name
+                )
+
+        except FileNotFoundError:
+
+            return {"processed": 0, "accepted": 0, "rejected": 0, "results": []}
+
+        done_dir = inbox / "done"
+
+        rejected_dir = inbox / "rejected"
+
+        # Parse de todo o inbox primeiro; JSON invalido e rejeitado sem entrar no lote.
+        outcomes: list[dict[str, Any] | None] = []
+
+        submissions: list[tuple[str, dict[str, Any]]] = []
+
+        for entry in files:
+
+            name = entry.name[: -len(".json")]
+
+            actor = name.split("__", 1)[0] if "__" in name else "agent-external"
+
+            try:
+
+                submissions.append((actor, jsonio.loads(_read_entry(entry))))
+
+                outcomes.append(None)
+
+            except jsonio.JSONDecodeError as exc:
+
+                outcomes.append({"status": "rejected", "error": str(exc)})
+
+        batch = iter(self.submit_batch(submissions, dry_run=dry_run) if submissions else ())
+
+        results: list[dict[str, Any]] = []
+
+        accepted = 0
+
+        rejected = 0
+
+        moves: list[tuple[str, str]] = []
+
+        for entry, outcome in zip(files, outcomes, strict=True):
+
+            result = outcome if outcome is not None else next(batch)
+
+            if result["status"] == "rejected":
+
+                results.append({"status": "rejected", "file": entry.name, **_error_fields(result)})
+
+                rejected += 1
+
+                target_dir = rejected_dir
+
+            else:
+
+                results.append(result)
+
+                accepted += 1
+
+                target_dir = done_dir
+
+            moves.append((entry.path, os.path.join(target_dir, entry.name)))
+
+        # Moves so depois de todas as decisoes: uma falha de validacao nao deixa o inbox pela metade.
+        if not dry_run:
+
+            # Diretorios de destino so quando ha o que mover: sweep vazio nao toca o disco.
+            for directory in {os.path.dirname(dst) for _, dst in moves}:
+
+                os.makedirs(directory, exist_ok=True)
+
+            for src, dst in moves:
+
+                os.replace(src, dst)
+
+        return {"processed": len(files), "accepted": accepted, "rejected": rejected, "results": results}
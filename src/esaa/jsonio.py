@@ -0,0 +1,93 @@
+"""Backend JSON com orjson opcional (extra `esaa-core[fast]`).
+
+Invariante: hashes (event_hash, projection hash, checkpoints) sao sempre
+calculados pela stdlib sobre os valores (utils.canonical_json_bytes), e as
+saidas ASCII do CLI continuam na stdlib. O orjson entra no parse (loads) e na
+escrita de linhas do event store, views e checkpoints (dumps/dumps_indent):
+os bytes gravados dependem do backend instalado, os valores relidos deles nao.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+try:  # pragma: no cover - depende do ambiente
+    import orjson
+except ImportError:  # pragma: no cover - depende do ambiente
+    orjson = None  # type: ignore[assignment]
+
+HAS_ORJSON = orjson is not None
+
+# orjson.JSONDecodeError herda de json.JSONDecodeError: chamadores tratam um unico tipo.
+JSONDecodeError = json.JSONDecodeError
+
+
+# orjson converte inteiros fora de int64/uint64 em float (com perda); a stdlib os
+# mantem exatos. Qualquer sequencia de 19+ digitos manda o parse para a stdlib
+# (falsos positivos, ex. digitos dentro de strings, so custam o caminho lento).
+_WIDE_INT_BYTES = re.compile(rb"\d{19}")
+_WIDE_INT_STR = re.compile(r"\d{19}")
+
+
+def _keeps_values(out: bytes, value: Any) -> bool:
+    # orjson grava NaN/Infinity como null (a stdlib preserva o valor, e o event_hash e
+    # calculado sobre ele). So ha o que conferir se a saida tem null; a volta pelo parse
+    # e a comparacao rodam em C. Falsos negativos (ex. tupla vs lista) so custam a stdlib.
+    return b"null" not in out or orjson.loads(out) == value
+
+
+def loads(data: bytes | str) -> Any:
+    """Decodifica JSON de bytes UTF-8 (ou str) sem decode intermediario.
+
+    Entradas que o orjson recusa mas a stdlib aceita (NaN/Infinity gravados por
+    json.dumps) caem na stdlib, que tambem da a mensagem de erro final. Inteiros
+    largos demais para 64 bits tambem: o orjson os devolveria como float.
+    """
+    if isinstance(data, str):
+        wide = _WIDE_INT_STR.search(data) is not None
+    else:
+        wide = _WIDE_INT_BYTES.search(data) is not None
+    if orjson is not None and not wide:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps(value: Any) -> bytes:
+    """JSON compacto UTF-8 (linha do event store), no layout de
+    ``json.dumps(value, ensure_ascii=False, separators=(",", ":"))``.
+
+    Com orjson a notacao de floats pode diferir (``1e16`` vs ``1e+16``); o valor
+    relido e o mesmo, entao event_hash (calculado sobre o valor) nao muda.
+    """
+    if orjson is not None:
+        try:
+            out = orjson.dumps(value)
+        except TypeError:
+            pass  # int > 64 bits, chaves nao-str: a stdlib cobre.
+        else:
+            if _keeps_values(out, value):
+                return out
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def dumps_indent(value: Any) -> bytes:
+    """JSON UTF-8 com indent=2 e newline final (formato dos read models em .roadmap/).
+
+    Layout de ``json.dumps(value, ensure_ascii=False, indent=2)``; com orjson a
+    notacao de floats pode diferir, como em dumps, sem afetar hashes
+    (calculados sobre os valores por utils.canonical_json_bytes).
+    """
+    if orjson is not None:
+        try:
+            out = orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            pass  # int > 64 bits, chaves nao-str: a stdlib cobre.
+        else:
+            if _keeps_values(out, value):
+                return out
+    return (json.dumps(value, ensure_ascii=False, indent=2) + "\n").encode("utf-8")
@@ -17,7 +17,7 @@ ERROR_CODE_TO_GATE = {
 
 
 def _sorted_dict(counter: Counter[str] | dict[str, int]) -> dict[str, int]:
-    return dict(sorted(counter.items(), key=lambda item: item[0]))
+    return dict(sorted(counter.items()))
 
 
 def _optional_int(value: Any) -> int:
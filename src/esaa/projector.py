@@ -1,19 +1,43 @@
+"""Projecao deterministica do event store em read models (roadmap/issues/lessons).
+
+Invariante de aliasing: payloads de eventos sao tratados como somente-leitura.
+O estado projetado referencia sub-estruturas dos payloads (outputs, verification,
+evidence, ...) sem copia-las, e ``materialize`` devolve o estado vivo sem
+deepcopy - cada chamada constroi um estado novo que nao e reutilizado. Quem
+precisar mutar o resultado in place deve copiar no proprio call site.
+"""
+
 from __future__ import annotations
 
-from copy import deepcopy
+import json
+import sys
+from collections import Counter
+from collections.abc import Callable, Iterable, Iterator
+from operator import itemgetter
 from typing import Any
 
 from .compat import normalize_legacy_verify_status
-from .constants import ESAA_VERSION, SCHEMA_VERSION
+from .constants import CANONICAL_ACTIONS, ESAA_VERSION, NOOP_ACTIONS, REVIEWER_ROLES, SCHEMA_VERSION
 from .errors import ESAAError
 from .state_machine import (
     REJECT_IMMUTABLE_DONE,
     REJECT_LOCK,
     REJECT_MISSING_CLAIM,
     REJECT_WORKFLOW_GATE,
+    TRANSITION_REJECTS,
     classify_transition,
 )
-from .utils import sha256_hex, utc_now_iso
+from .utils import stream_sha256, utc_now_iso
+
+_HOTFIX_FIELDS = ("issue_id", "fixes", "scope_patch", "required_verification", "baseline_id")
+
+
+def _payload_list(payload: dict[str, Any], key: str) -> list[Any]:
+    # Payload e read-only (ver docstring do modulo): listas JSON sao compartilhadas sem copia.
+    value = payload.get(key)
+    if type(value) is list:
+        return value
+    return list(value) if value else []
 
 
 def _new_task(payload: dict[str, Any]) -> dict[str, Any]:
@@ -27,39 +51,83 @@ def _new_task(payload: dict[str, Any]) -> dict[str, Any]:
         "title": payload["title"],
         "description": description,
         "status": "todo",
-        "depends_on": list(payload.get("depends_on", [])),
-        "targets": list(payload.get("targets", [])),
-        "outputs": payload.get("outputs", {"files": []}),
+        "depends_on": _payload_list(payload, "depends_on"),
+        "targets": _payload_list(payload, "targets"),
+        "outputs": payload["outputs"] if "outputs" in payload else {"files": []},
         "immutability": {"done_is_immutable": True},
     }
     if payload.get("is_hotfix"):
         task["is_hotfix"] = True
-        for field in ("issue_id", "fixes", "scope_patch", "required_verification", "baseline_id"):
-            if field in payload:
-                task[field] = deepcopy(payload[field])
+        task.update({field: payload[field] for field in _HOTFIX_FIELDS if field in payload})
     if payload.get("boundary_grant"):
-        task["boundary_grant"] = deepcopy(payload["boundary_grant"])
+        task["boundary_grant"] = payload["boundary_grant"]
     if payload.get("plugin"):
-        task["plugin"] = deepcopy(payload["plugin"])
+        task["plugin"] = payload["plugin"]
     return task
 
 
-def _index_counts(tasks: list[dict[str, Any]], key: str) -> dict[str, int]:
-    out: dict[str, int] = {}
-    for task in tasks:
-        value = str(task.get(key, "unknown"))
-        out[value] = out.get(value, 0) + 1
-    return dict(sorted(out.items(), key=lambda item: item[0]))
+def compute_projection_hash(roadmap: dict[str, Any]) -> str:
+    return stream_sha256(
+        _projection_chunks(
+            roadmap["meta"]["schema_version"],
+            roadmap["project"],
+            map(_canonical_fragment, roadmap["tasks"]),
+            roadmap["indexes"],
+        )
+    )
 
 
-def compute_projection_hash(roadmap: dict[str, Any]) -> str:
-    payload = {
-        "schema_version": roadmap["meta"]["schema_version"],
-        "project": roadmap["project"],
-        "tasks": roadmap["tasks"],
-        "indexes": roadmap["indexes"],
-    }
-    return sha256_hex(payload)
+def _canonical_fragment(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _projection_chunks(
+    schema_version: Any, project: Any, task_chunks: Iterable[bytes], indexes: Any
+) -> Iterator[bytes]:
+    """Bytes de canonical_json_bytes({schema_version, project, tasks, indexes}) em partes.
+
+    O JSON canonico ordena as chaves (indexes, project, schema_version, tasks),
+    entao cada campo e serializado e entregue ao hash isoladamente - o payload
+    completo nunca existe num buffer unico.
+    """
+    yield b'{"indexes":'
+    yield _canonical_fragment(indexes)
+    yield b',"project":'
+    yield _canonical_fragment(project)
+    yield b',"schema_version":'
+    yield _canonical_fragment(schema_version)
+    yield b',"tasks":['
+    for position, chunk in enumerate(task_chunks):
+        if position:
+            yield b","
+        yield chunk
+    yield b"]}\n"
+
+
+def _state_projection_hash(state: dict[str, Any]) -> str:
+    """Mesmo digest de compute_projection_hash, reaproveitando bytes canonicos por task.
+
+    So tasks alteradas desde o ultimo hash do mesmo estado (ver _apply_transition)
+    sao re-serializadas.
+    """
+    cache = state["_task_bytes"]
+    tasks_by_id = state["_tasks_by_id"]
+
+    def task_chunks() -> Iterator[bytes]:
+        for task in state["tasks"]:
+            task_id = task["task_id"]
+            if tasks_by_id.get(task_id) is not task:
+                # task.create duplicado (legado): nunca e mutado, mas nao pode usar a chave do original.
+                yield _canonical_fragment(task)
+                continue
+            chunk = cache.get(task_id)
+            if chunk is None:
+                chunk = cache[task_id] = _canonical_fragment(task)
+            yield chunk
+
+    return stream_sha256(
+        _projection_chunks(state["meta"]["schema_version"], state["project"], task_chunks(), state["indexes"])
+    )
 
 
 def _empty_state(project_name: str) -> dict[str, Any]:
@@ -81,16 +149,53 @@ def _empty_state(project_name: str) -> dict[str, Any]:
         "project": {"name": project_name, "audit_scope": ".roadmap/"},
         "tasks": [],
         "indexes": {"by_status": {}, "by_kind": {}},
+        "_tasks_by_id": {},
+        "_task_bytes": {},
         "_issues": {},
         "_lessons": [],
     }
 
 
+def _bump_index(counts: dict[str, int], value: Any, delta: int) -> None:
+    key = str(value)
+    total = counts.get(key, 0) + delta
+    if total:
+        counts[key] = total
+    else:
+        counts.pop(key, None)
+
+
+def _add_task(state: dict[str, Any], payload: dict[str, Any]) -> dict[str, Any]:
+    task = _new_task(payload)
+    state["tasks"].append(task)
+    # task.create duplicado preserva a semantica legada: a primeira ocorrencia vence.
+    state["_tasks_by_id"].setdefault(task["task_id"], task)
+    _bump_index(state["indexes"]["by_status"], task["status"], 1)
+    _bump_index(state["indexes"]["by_kind"], task["task_kind"], 1)
+    return task
+
+
+def _index_counts(tasks: list[dict[str, Any]], key: str) -> dict[str, int]:
+    """Recontagem completa (fallback das atualizacoes incrementais de _bump_index).
+
+    Mesma chave de _bump_index (str) para os dois caminhos nao divergirem.
+    """
+    return dict(Counter(str(task.get(key, "unknown")) for task in tasks))
+
+
+def _set_status(state: dict[str, Any], task: dict[str, Any], status: str) -> None:
+    """Transiciona o status mantendo indexes.by_status incremental."""
+    by_status = state["indexes"]["by_status"]
+    _bump_index(by_status, task["status"], -1)
+    _bump_index(by_status, status, 1)
+    task["status"] = status
+
+
 def _task_by_id(state: dict[str, Any], task_id: str) -> dict[str, Any]:
-    for task in state["tasks"]:
-        if task["task_id"] == task_id:
-            return task
-    raise ESAAError("TASK_NOT_FOUND", f"task_id not found: {task_id}")
+    task = state["_tasks_by_id"].get(task_id)
+    if task is None:
+        raise ESAAError("TASK_NOT_FOUND", f"task_id not found: {task_id}")
+    return task
 
 
 def _ensure_owner(task: dict[str, Any], actor: str) -> None:
@@ -101,29 +206,71 @@ def _ensure_owner(task: dict[str, Any], actor: str) -> None:
 
 def _check_transition(task: dict[str, Any], action: str) -> None:
     """Aplica a maquina de estado canonica (RF01) com reject_codes do contrato."""
-    ok, code = classify_transition(task["status"], action)
-    if not ok:
+    key = (task["status"], action)
+    code = TRANSITION_REJECTS[key] if key in TRANSITION_REJECTS else classify_transition(*key)[1]
+    if code is not None:
         raise ESAAError(code, f"{action} invalid for status={task['status']}")
 
 
-def _apply_claim(state: dict[str, Any], event: dict[str, Any]) -> None:
-    task = _task_by_id(state, event["payload"]["task_id"])
-    _check_transition(task, "claim")
+def _gate_claim(task: dict[str, Any], event: dict[str, Any]) -> None:
     if task.get("assigned_to"):
         raise ESAAError(REJECT_LOCK, "task already locked")
-    task["status"] = "in_progress"
+
+
+def _gate_owner(task: dict[str, Any], event: dict[str, Any]) -> None:
+    _ensure_owner(task, event["actor"])
+
+
+def _gate_review(task: dict[str, Any], event: dict[str, Any]) -> None:
+    # FIX-1807: review autoriza-se por owner (legado) ou por role qa/orchestrator.
+    # O service injeta '_reviewer_role' no payload apos resolver runtime_policy.
+    reviewer_role = event.get("reviewer_role") or event["payload"].get("_reviewer_role")
+    if reviewer_role not in REVIEWER_ROLES:
+        _ensure_owner(task, event["actor"])
+
+
+# action -> (gate de autorizacao, status destino). review escolhe o destino pelo
+# payload.decision; decisao fora da tabela e WORKFLOW_GATE.
+_TRANSITIONS: dict[str, tuple[Callable[[dict[str, Any], dict[str, Any]], None], str | dict[str, str]]] = {
+    "claim": (_gate_claim, "in_progress"),
+    "complete": (_gate_owner, "review"),
+    "review": (_gate_review, {"approve": "done", "request_changes": "in_progress"}),
+}
+
+
+def _apply_transition(state: dict[str, Any], event: dict[str, Any]) -> dict[str, Any]:
+    """Valida (estado, gate, destino) e grava o novo status num unico ponto."""
+    action = event["action"]
+    task = _task_by_id(state, event["payload"]["task_id"])
+    gate, target = _TRANSITIONS[action]
+    _check_transition(task, action)
+    gate(task, event)
+    if isinstance(target, str):
+        status = target
+    else:
+        decision = event["payload"].get("decision")
+        # decision vem do store sem validacao de tipo: nao-str (ex. lista) nao e hashable.
+        resolved = target.get(decision) if isinstance(decision, str) else None
+        if resolved is None:
+            raise ESAAError(REJECT_WORKFLOW_GATE, f"review decision invalid: {decision}")
+        status = resolved
+    _set_status(state, task, status)
+    # Unico ponto que muta tasks existentes: invalida os bytes canonicos em cache.
+    state["_task_bytes"].pop(task["task_id"], None)
+    return task
+
+
+def _apply_claim(state: dict[str, Any], event: dict[str, Any]) -> None:
+    task = _apply_transition(state, event)
     task["assigned_to"] = event["actor"]
     task["started_at"] = event["ts"]
 
 
 def _apply_complete(state: dict[str, Any], event: dict[str, Any]) -> None:
-    task = _task_by_id(state, event["payload"]["task_id"])
-    _check_transition(task, "complete")
-    _ensure_owner(task, event["actor"])
-    task["status"] = "review"
+    task = _apply_transition(state, event)
     verification = event["payload"].get("verification")
     if verification:
-        task["verification"] = deepcopy(verification)
+        task["verification"] = verification
     if "issue_id" in event["payload"]:
         task["issue_id"] = event["payload"]["issue_id"]
     if "fixes" in event["payload"]:
@@ -131,21 +278,9 @@ def _apply_complete(state: dict[str, Any], event: dict[str, Any]) -> None:
 
 
 def _apply_review(state: dict[str, Any], event: dict[str, Any]) -> None:
-    task = _task_by_id(state, event["payload"]["task_id"])
-    decision = event["payload"].get("decision")
-    _check_transition(task, "review")
-    # FIX-1807: review autoriza-se por owner (legado) ou por role qa/orchestrator.
-    # O service injeta '_reviewer_role' no payload apos resolver runtime_policy.
-    reviewer_role = event.get("reviewer_role") or event["payload"].get("_reviewer_role")
-    if reviewer_role not in {"qa", "orchestrator"}:
-        _ensure_owner(task, event["actor"])
-    if decision == "approve":
-        task["status"] = "done"
+    task = _apply_transition(state, event)
+    if task["status"] == "done":
         task["completed_at"] = event["ts"]
-    elif decision == "request_changes":
-        task["status"] = "in_progress"
-    else:
-        raise ESAAError(REJECT_WORKFLOW_GATE, f"review decision invalid: {decision}")
 
 
 def _apply_issue_report(state: dict[str, Any], event: dict[str, Any]) -> None:
@@ -159,8 +294,8 @@ def _apply_issue_report(state: dict[str, Any], event: dict[str, Any]) -> None:
             "severity": payload.get("severity", "medium"),
             "title": payload.get("title", issue_id),
             "baseline_id": payload.get("affected", {}).get("baseline_id"),
-            "affected": deepcopy(payload.get("affected", {})),
-            "evidence": deepcopy(payload.get("evidence", {})),
+            "affected": payload.get("affected", {}),
+            "evidence": payload.get("evidence", {}),
             "resolution": None,
             "links": {
                 "reported_by_task_id": payload.get("task_id"),
@@ -176,10 +311,10 @@ def _apply_issue_report(state: dict[str, Any], event: dict[str, Any]) -> None:
     issue["status"] = "open"
     issue["severity"] = payload.get("severity", issue["severity"])
     issue["title"] = payload.get("title", issue["title"])
-    issue["evidence"] = deepcopy(payload.get("evidence", issue.get("evidence", {})))
+    issue["evidence"] = payload.get("evidence", issue.get("evidence", {}))
 
     if payload.get("category") == "process" and payload.get("subtype") == "lesson" and "lesson" in payload:
-        lesson_payload = deepcopy(payload["lesson"])
+        lesson_payload = payload["lesson"]
         lesson_id = f"LES-{len(state['_lessons']) + 1:04d}"
         state["_lessons"].append(
             {
@@ -199,10 +334,9 @@ def _apply_issue_report(state: dict[str, Any], event: dict[str, Any]) -> None:
 def _apply_hotfix_create(state: dict[str, Any], event: dict[str, Any]) -> None:
     payload = event["payload"]
     task_id = payload["task_id"]
-    for task in state["tasks"]:
-        if task["task_id"] == task_id:
-            raise ESAAError("DUPLICATE_TASK", f"task already exists: {task_id}")
-    state["tasks"].append(_new_task(payload))
+    if task_id in state["_tasks_by_id"]:
+        raise ESAAError("DUPLICATE_TASK", f"task already exists: {task_id}")
+    _add_task(state, payload)
     issue_id = payload.get("issue_id")
     if issue_id and issue_id in state["_issues"]:
         state["_issues"][issue_id]["links"]["hotfix_task_id"] = task_id
@@ -215,92 +349,154 @@ def _apply_issue_resolve(state: dict[str, Any], event: dict[str, Any]) -> None:
     if not issue:
         raise ESAAError("ISSUE_NOT_FOUND", f"issue not found: {issue_id}")
     issue["status"] = "resolved"
-    issue["resolution"] = deepcopy(payload.get("resolution", {}))
+    issue["resolution"] = payload.get("resolution", {})
     issue["timeline"]["resolved_event_seq"] = event["event_seq"]
 
 
-def _apply_event(state: dict[str, Any], event: dict[str, Any]) -> None:
-    action = event["action"]
+def _apply_run_start(state: dict[str, Any], event: dict[str, Any]) -> None:
     payload = event["payload"]
+    state["meta"]["master_correlation_id"] = payload.get("master_correlation_id")
+    state["meta"]["run"]["run_id"] = payload.get("run_id", state["meta"]["run"]["run_id"])
+    state["meta"]["run"]["status"] = payload.get("status", "initialized")
+    if payload.get("project_name"):
+        state["project"]["name"] = payload["project_name"]
+    if payload.get("audit_scope"):
+        state["project"]["audit_scope"] = payload["audit_scope"]
 
-    if action == "run.start":
-        state["meta"]["master_correlation_id"] = payload.get("master_correlation_id")
-        state["meta"]["run"]["run_id"] = payload.get("run_id", state["meta"]["run"]["run_id"])
-        state["meta"]["run"]["status"] = payload.get("status", "initialized")
-        if payload.get("project_name"):
-            state["project"]["name"] = payload["project_name"]
-        if payload.get("audit_scope"):
-            state["project"]["audit_scope"] = payload["audit_scope"]
-    elif action == "run.end":
-        state["meta"]["run"]["status"] = payload.get("status", "success")
-    elif action == "task.create":
-        state["tasks"].append(_new_task(payload))
-    elif action == "claim":
-        _apply_claim(state, event)
-    elif action == "complete":
-        _apply_complete(state, event)
-    elif action == "review":
-        _apply_review(state, event)
-    elif action == "issue.report":
-        _apply_issue_report(state, event)
-    elif action == "hotfix.create":
-        _apply_hotfix_create(state, event)
-    elif action == "issue.resolve":
-        _apply_issue_resolve(state, event)
-    elif action == "verify.ok":
-        state["meta"]["run"]["verify_status"] = "ok"
-    elif action == "verify.fail":
-        state["meta"]["run"]["verify_status"] = payload.get("verify_status", "mismatch")
-    elif action == "orchestrator.view.mutate":
-        # R1-fix: um view.mutate pode registrar lessons de forma reconstruivel
-        # por replay. Quando o payload carrega 'lessons', a projecao passa a
-        # deriva-las do event store (e nao de edicao manual do read model).
-        if isinstance(payload.get("lessons"), list):
-            state["_lessons"] = deepcopy(payload["lessons"])
-    elif action in {
-        "output.rejected",
-        "orchestrator.file.write",
-        "runner.metrics",
-        "chain.anchor",
-        "verify.start",
-        "plugin.install",
-        "plugin.remove",
-        "plugin.update",
-        "roadmap.activate",
-        "roadmap.pause",
-        "roadmap.resume",
-        "roadmap.deactivate",
-    }:
-        pass
-    else:
+
+def _apply_run_end(state: dict[str, Any], event: dict[str, Any]) -> None:
+    state["meta"]["run"]["status"] = event["payload"].get("status", "success")
+
+
+def _apply_task_create(state: dict[str, Any], event: dict[str, Any]) -> None:
+    _add_task(state, event["payload"])
+
+
+def _apply_verify_ok(state: dict[str, Any], event: dict[str, Any]) -> None:
+    state["meta"]["run"]["verify_status"] = "ok"
+
+
+def _apply_verify_fail(state: dict[str, Any], event: dict[str, Any]) -> None:
+    state["meta"]["run"]["verify_status"] = event["payload"].get("verify_status", "mismatch")
+
+
+def _apply_view_mutate(state: dict[str, Any], event: dict[str, Any]) -> None:
+    # R1-fix: um view.mutate pode registrar lessons de forma reconstruivel
+    # por replay. Quando o payload carrega 'lessons', a projecao passa a
+    # deriva-las do event store (e nao de edicao manual do read model).
+    lessons = event["payload"].get("lessons")
+    if isinstance(lessons, list):
+        # Copia rasa: issue.report faz append em _lessons, o payload nao pode mudar.
+        state["_lessons"] = list(lessons)
+
+
+def _noop(state: dict[str, Any], event: dict[str, Any]) -> None:
+    return None
+
+
+# Tabela de dispatch por action: um lookup de hash por evento em vez de uma
+# cadeia de comparacoes de string.
+_HANDLERS: dict[str, Callable[[dict[str, Any], dict[str, Any]], None]] = {
+    "run.start": _apply_run_start,
+    "run.end": _apply_run_end,
+    "task.create": _apply_task_create,
+    "claim": _apply_claim,
+    "complete": _apply_complete,
+    "review": _apply_review,
+    "issue.report": _apply_issue_report,
+    "hotfix.create": _apply_hotfix_create,
+    "issue.resolve": _apply_issue_resolve,
+    "verify.ok": _apply_verify_ok,
+    "verify.fail": _apply_verify_fail,
+    "orchestrator.view.mutate": _apply_view_mutate,
+    **dict.fromkeys(NOOP_ACTIONS, _noop),
+}
+# Chaves internadas como as actions vindas do store (ver constants.CANONICAL_ACTIONS).
+_HANDLERS = {sys.intern(action): handler for action, handler in _HANDLERS.items()}
+# Toda action aceita pelo store precisa de handler: falha no import, nao no meio de um replay.
+_UNHANDLED_ACTIONS = CANONICAL_ACTIONS - _HANDLERS.keys()
+if _UNHANDLED_ACTIONS:  # pragma: no cover - guarda de consistencia do vocabulario
+    raise RuntimeError(f"projector has no handler for: {', '.join(sorted(_UNHANDLED_ACTIONS))}")
+
+
+def _apply_event(state: dict[str, Any], event: dict[str, Any]) -> None:
+    action = event["action"]
+    handler = _HANDLERS.get(action)
+    if handler is None:
         raise ESAAError("UNKNOWN_ACTION", f"unknown action: {action}")
+    handler(state, event)
 
     state["meta"]["run"]["last_event_seq"] = event["event_seq"]
     state["meta"]["updated_at"] = event["ts"]
 
 
-def materialize(
-    events: list[dict[str, Any]], project_name: str = "esaa-core"
-) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
-    state = _empty_state(project_name=project_name)
+# Chaves internas reconstruidas por load_state (nao vao para checkpoints).
+_DERIVED_STATE_KEYS = ("_tasks_by_id", "_task_bytes")
+
+
+def new_state(project_name: str = "esaa-core") -> dict[str, Any]:
+    """Estado de projecao vazio, para replay incremental via apply_events."""
+    return _empty_state(project_name=project_name)
+
+
+def apply_events(state: dict[str, Any], events: Iterable[dict[str, Any]]) -> dict[str, Any]:
     for event in events:
         _apply_event(state, event)
+    return state
+
+
+def dump_state(state: dict[str, Any]) -> dict[str, Any]:
+    """Forma JSON-serializavel do estado (checkpoint); indice por task_id e cache de hash sao derivados."""
+    return {key: value for key, value in state.items() if key not in _DERIVED_STATE_KEYS}
+
+
+def load_state(data: dict[str, Any]) -> dict[str, Any]:
+    """Inverso de dump_state: reconstroi os indices internos a partir de tasks."""
+    state = dict(data)
+    state["_tasks_by_id"] = {}
+    state["_task_bytes"] = {}
+    for task in state["tasks"]:
+        state["_tasks_by_id"].setdefault(task["task_id"], task)
+    # Indexes sao recontados das tasks em vez de confiar no checkpoint gravado.
+    state["indexes"] = {
+        "by_status": _index_counts(state["tasks"], "status"),
+        "by_kind": _index_counts(state["tasks"], "task_kind"),
+    }
+    return state
+
+
+def materialize(
+    events: Iterable[dict[str, Any]], project_name: str = "esaa-core"
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    return materialize_from(_empty_state(project_name=project_name), events)
 
-    state["indexes"]["by_status"] = _index_counts(state["tasks"], "status")
-    state["indexes"]["by_kind"] = _index_counts(state["tasks"], "task_kind")
+
+def materialize_from(
+    state: dict[str, Any], events: Iterable[dict[str, Any]]
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+    """Aplica ``events`` sobre ``state`` (ex.: restaurado de checkpoint) e projeta.
+
+    O estado e consumido: os read models devolvidos o referenciam diretamente.
+    """
+    apply_events(state, events)
+
+    # Indexes mantidos incrementalmente pelos handlers; so a ordem canonica
+    # (chave) e fixada aqui porque entra no projection hash.
+    for name in ("by_status", "by_kind"):
+        state["indexes"][name] = dict(sorted(state["indexes"][name].items()))
 
     roadmap = {
-        "meta": deepcopy(state["meta"]),
-        "project": deepcopy(state["project"]),
-        "tasks": deepcopy(state["tasks"]),
-        "indexes": deepcopy(state["indexes"]),
+        "meta": state["meta"],
+        "project": state["project"],
+        "tasks": state["tasks"],
+        "indexes": state["indexes"],
     }
     roadmap["meta"]["run"]["verify_status"] = normalize_legacy_verify_status(
         roadmap["meta"]["run"]["verify_status"]
     )
-    roadmap["meta"]["run"]["projection_hash_sha256"] = compute_projection_hash(roadmap)
+    roadmap["meta"]["run"]["projection_hash_sha256"] = _state_projection_hash(state)
 
-    issues = sorted(state["_issues"].values(), key=lambda issue: issue["issue_id"])
+    issues = sorted(state["_issues"].values(), key=itemgetter("issue_id"))
     open_by_baseline: dict[str, list[str]] = {}
     for issue in issues:
         if issue["status"] != "open":
@@ -318,12 +514,12 @@ def materialize(
             "updated_at": roadmap["meta"]["updated_at"],
         },
         "issues": issues,
-        "indexes": {"open_by_baseline": dict(sorted(open_by_baseline.items(), key=lambda item: item[0]))},
+        "indexes": {"open_by_baseline": dict(sorted(open_by_baseline.items()))},
     }
 
     by_task_kind: dict[str, list[str]] = {}
     by_enforcement: dict[str, list[str]] = {}
-    lessons = deepcopy(state["_lessons"])
+    lessons = state["_lessons"]
     for lesson in lessons:
         for kind in lesson["scope"].get("task_kinds", []):
             by_task_kind.setdefault(kind, []).append(lesson["lesson_id"])
@@ -340,8 +536,60 @@ def materialize(
         },
         "lessons": lessons,
         "indexes": {
-            "by_task_kind": dict(sorted(by_task_kind.items(), key=lambda item: item[0])),
-            "by_enforcement_applies_to": dict(sorted(by_enforcement.items(), key=lambda item: item[0])),
+            "by_task_kind": dict(sorted(by_task_kind.items())),
+            "by_enforcement_applies_to": dict(sorted(by_enforcement.items())),
         },
     }
     return roadmap, issues_view, lessons_view
+
+
+class ProjectionState:
+    """Projecao incremental: cada evento e aplicado uma unica vez sobre o estado vivo.
+
+    Substitui sequencias de ``materialize(events + candidatos)`` em submit/run: o
+    historico e reprojetado uma vez e ``snapshot`` so re-serializa as tasks
+    alteradas desde o ultimo hash (cache ``_task_bytes``). Um ``apply`` que
+    levanta ESAAError deixa o estado indefinido - descarte a instancia.
+    """
+
+    __slots__ = ("_state", "_hotfix_task_ids")
+
+    def __init__(self, events: Iterable[dict[str, Any]] = (), project_name: str = "esaa-core") -> None:
+        self._state = _empty_state(project_name=project_name)
+        # task_ids criados por hotfix.create: dedup O(1) em build_hotfix_event sem varrer o log.
+        self._hotfix_task_ids: set[str] = set()
+        for event in events:
+            self.apply(event)
+
+    def apply(self, event: dict[str, Any]) -> None:
+        _apply_event(self._state, event)
+        if event["action"] == "hotfix.create":
+            self._hotfix_task_ids.add(event["payload"]["task_id"])
+
+    @property
+    def next_seq(self) -> int:
+        """event_seq do proximo evento; equivale a next_event_seq sobre os eventos aplicados."""
+        return int(self._state["meta"]["run"]["last_event_seq"]) + 1
+
+    def task_ids(self) -> set[str]:
+        return set(self._state["_tasks_by_id"])
+
+    def task(self, task_id: Any) -> dict[str, Any] | None:
+        """Lookup O(1) no indice do estado; duplicatas resolvem para a primeira task, como a varredura."""
+        try:
+            return self._state["_tasks_by_id"].get(task_id)
+        except TypeError:  # task_id nao-hashable vindo de payload ainda nao validado
+            return None
+
+    def has_hotfix_task(self, task_id: str) -> bool:
+        return task_id in self._hotfix_task_ids
+
+    def issue(self, issue_id: Any) -> dict[str, Any] | None:
+        try:
+            return self._state["_issues"].get(issue_id)
+        except TypeError:
+            return None
+
+    def snapshot(self) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any]]:
+        """Read models do estado atual; referenciam o estado vivo e mudam com o proximo apply."""
+        return materialize_from(self._state, ())
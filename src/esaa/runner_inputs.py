@@ -6,6 +6,7 @@ from typing import Any
 
 import yaml
 
+from . import yamlio
 from .errors import ESAAError
 from .provenance import resolve_runner
 from .utils import ensure_parent
@@ -36,7 +37,7 @@ def _relative(path: Path, root: Path) -> str:
 def _read_yaml(path: Path) -> dict[str, Any]:
     if not path.is_file():
         raise ESAAError("INPUT_NOT_FOUND", f"commands input file not found: {path}")
-    loaded = yaml.safe_load(path.read_text(encoding="utf-8"))
+    loaded = yamlio.safe_load(path.read_bytes())
     if not isinstance(loaded, dict):
         raise ESAAError("INPUT_INVALID", "commands input must be a YAML mapping")
     return loaded
@@ -11,12 +11,12 @@ Sem estado em memoria: tudo derivavel do event store (event-sourced).
 from __future__ import annotations
 
 import re
+from collections.abc import Iterable
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from . import yamlio
 from .errors import ESAAError
 
 DEFAULT_POLICY = {
@@ -32,7 +32,7 @@ def load_policy(root: Path) -> dict[str, Any]:
     path = root / ".roadmap" / "RUNTIME_POLICY.yaml"
     if not path.exists():
         return DEFAULT_POLICY
-    data = yaml.safe_load(path.read_text(encoding="utf-8")) or {}
+    data = yamlio.safe_load(path.read_bytes()) or {}
     return data
 
 
@@ -52,7 +52,7 @@ def _parse_ts(ts: str) -> datetime:
     return datetime.fromisoformat(ts.replace("Z", "+00:00"))
 
 
-def count_penalizing_rejections(events: list[dict[str, Any]], task_id: str) -> int:
+def count_penalizing_rejections(events: Iterable[dict[str, Any]], task_id: str) -> int:
     """Conta output.rejected events para a tarefa onde penalizes_counter != False.
 
     Por compatibilidade, o payload nao traz penalizes_counter; o codigo
@@ -71,7 +71,7 @@ def count_penalizing_rejections(events: list[dict[str, Any]], task_id: str) -> i
     return n
 
 
-def last_rejection_ts(events: list[dict[str, Any]], task_id: str) -> datetime | None:
+def last_rejection_ts(events: Iterable[dict[str, Any]], task_id: str) -> datetime | None:
     last = None
     for e in events:
         if e.get("action") != "output.rejected":
@@ -86,14 +86,16 @@ def last_rejection_ts(events: list[dict[str, Any]], task_id: str) -> datetime |
     return last
 
 
-def is_in_cooldown(events: list[dict[str, Any]], task_id: str, now: datetime, cooldown: timedelta) -> bool:
+def is_in_cooldown(
+    events: Iterable[dict[str, Any]], task_id: str, now: datetime, cooldown: timedelta
+) -> bool:
     ts = last_rejection_ts(events, task_id)
     if ts is None:
         return False
     return (now - ts) < cooldown
 
 
-def is_blocked_by_max_attempts(events: list[dict[str, Any]], task_id: str, max_attempts: int) -> bool:
+def is_blocked_by_max_attempts(events: Iterable[dict[str, Any]], task_id: str, max_attempts: int) -> bool:
     return count_penalizing_rejections(events, task_id) >= max_attempts
 
 
@@ -108,7 +110,7 @@ def resolve_role(actor: str, root: Path | None = None) -> str:
         swarm_path = root / ".roadmap" / "agents_swarm.yaml"
         if swarm_path.exists():
             try:
-                data = yaml.safe_load(swarm_path.read_text(encoding="utf-8")) or {}
+                data = yamlio.safe_load(swarm_path.read_bytes()) or {}
                 role = (data.get("agents", {}).get(actor, {}) or {}).get("role")
                 if role:
                     role_value = str(role)
@@ -133,7 +135,7 @@ def known_runners(root: Path) -> set[str]:
     if not swarm_path.exists():
         return set()
     try:
-        data = yaml.safe_load(swarm_path.read_text(encoding="utf-8")) or {}
+        data = yamlio.safe_load(swarm_path.read_bytes()) or {}
     except Exception:
         return set()
     runners = data.get("runners", {}) or {}
@@ -154,7 +156,7 @@ def review_authorization_mode(policy: dict[str, Any]) -> str:
     return val if val in {"owner", "qa_role"} else "owner"
 
 
-def attempt_expired(events: list[dict[str, Any]], task_id: str, now: datetime, ttl: timedelta) -> bool:
+def attempt_expired(events: Iterable[dict[str, Any]], task_id: str, now: datetime, ttl: timedelta) -> bool:
     """Tarefa em in_progress sem complete ha mais que ttl?"""
     last_claim = None
     last_complete = None
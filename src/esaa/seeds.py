@@ -293,27 +293,33 @@ def select_next_task(tasks: list[dict[str, Any]]) -> dict[str, Any] | None:
 
     by_id = {task["task_id"]: task for task in tasks}
 
-    for status in ("review", "in_progress"):
+    # Dependencia desconhecida nao bloqueia; so bloqueia a task existente ainda nao done.
+    pending_ids = frozenset(task_id for task_id, task in by_id.items() if task["status"] != "done")
 
-        candidates = sorted(
-            [task for task in tasks if task["status"] == status], key=lambda item: item["task_id"]
-        )
+    # Uma passada: menor task_id por status (empate mantem a primeira, como o sort estavel).
+    best: dict[str, dict[str, Any] | None] = {"review": None, "in_progress": None, "todo": None}
 
-        if candidates:
+    for task in tasks:
 
-            return candidates[0]
+        status = task["status"]
 
-    todo = sorted([task for task in tasks if task["status"] == "todo"], key=lambda item: item["task_id"])
+        if status not in best:
 
-    for task in todo:
+            continue
 
-        deps = task.get("depends_on", [])
+        current = best[status]
 
-        if all(by_id[dep]["status"] == "done" for dep in deps if dep in by_id):
+        if current is not None and task["task_id"] >= current["task_id"]:
 
-            return task
+            continue
 
-    return None
+        if status == "todo" and not pending_ids.isdisjoint(task.get("depends_on", [])):
+
+            continue
+
+        best[status] = task
+
+    return best["review"] or best["in_progress"] or best["todo"]
 
 
 def select_task_wave(tasks: list[dict[str, Any]], limit: int = 1) -> list[dict[str, Any]]:
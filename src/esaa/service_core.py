@@ -3,6 +3,7 @@ from __future__ import annotations
 import json
 import random
 import time
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -13,14 +14,15 @@ from .errors import CorruptedStoreError, ESAAError
 from .events import make_event
 from .file_effects import recover_file_effects as recover_file_effects_from_events
 from .metrics import compute_metrics
-from .projector import materialize
+from .projector import ProjectionState, materialize
 from .runner_metrics import normalize_runner_metrics
 from .runtime_policy import load_policy, parse_duration
 from .seeds import BASELINE_LESSONS, all_tasks_done, load_plugin_seeds, seed_tasks
+from .snapshot import project_from_checkpoint, project_store
 from .store import (
     append_events,
     append_transactional,
-    ensure_event_store,
+    event_store_has_content,
     load_roadmap,
     next_event_seq,
     parse_event_store,
@@ -29,6 +31,7 @@ from .store import (
     save_lessons,
     save_roadmap,
 )
+from .utils import utc_now_iso
 
 
 def _projection_hash(events: list[dict[str, Any]]) -> str:
@@ -79,15 +82,13 @@ class ESAAServiceCore:
 
         roadmap_dir.mkdir(parents=True, exist_ok=True)
 
-        if not force and (self.root / ".roadmap/activity.jsonl").exists():
+        event_store = roadmap_dir / "activity.jsonl"
 
-            existing = (self.root / ".roadmap/activity.jsonl").read_text(encoding="utf-8").strip()
+        if not force and event_store_has_content(event_store):
 
-            if existing:
-
-                raise ESAAError(
-                    "INIT_BLOCKED", "event store already contains events; use --force to reinitialize"
-                )
+            raise ESAAError(
+                "INIT_BLOCKED", "event store already contains events; use --force to reinitialize"
+            )
 
         for rel in ("docs/spec", "docs/qa", "src", "tests"):
 
@@ -120,15 +121,18 @@ class ESAAServiceCore:
 
         events: list[dict[str, Any]] = []
 
+        # Lote do init gravado de uma vez: um unico timestamp para todos os eventos.
+        orchestrator_event = partial(make_event, actor="orchestrator", ts=utc_now_iso())
+
         seq = 1
 
-        events.append(make_event(seq, actor="orchestrator", action="run.start", payload=run_start_payload))
+        events.append(orchestrator_event(seq, action="run.start", payload=run_start_payload))
 
         seq += 1
 
         for task in tasks:
 
-            events.append(make_event(seq, actor="orchestrator", action="task.create", payload=task))
+            events.append(orchestrator_event(seq, action="task.create", payload=task))
 
             seq += 1
 
@@ -137,9 +141,8 @@ class ESAAServiceCore:
         # canonicas. O projetor reconstroi lessons.json a partir deste evento (R1-fix).
 
         events.append(
-            make_event(
+            orchestrator_event(
                 seq,
-                actor="orchestrator",
                 action="orchestrator.view.mutate",
                 payload={
                     "target": "lessons",
@@ -151,24 +154,21 @@ class ESAAServiceCore:
 
         seq += 1
 
-        events.append(make_event(seq, actor="orchestrator", action="verify.start", payload={"strict": True}))
+        events.append(orchestrator_event(seq, action="verify.start", payload={"strict": True}))
 
         seq += 1
 
         roadmap_preview, _, _ = materialize(events)
 
         events.append(
-            make_event(
+            orchestrator_event(
                 seq,
-                actor="orchestrator",
                 action="verify.ok",
                 payload={"projection_hash_sha256": roadmap_preview["meta"]["run"]["projection_hash_sha256"]},
             )
         )
 
-        path = ensure_event_store(self.root)
-
-        path.write_text("", encoding="utf-8")
+        event_store.write_text("", encoding="utf-8")
 
         append_events(self.root, events)
 
@@ -189,9 +189,8 @@ class ESAAServiceCore:
 
     def project(self) -> dict[str, Any]:
 
-        events = parse_event_store(self.root)
-
-        roadmap, issues, lessons = materialize(events)
+        # Valida o log inteiro, mas reaplica so a cauda apos o checkpoint valido mais recente.
+        roadmap, issues, lessons, _ = project_store(self.root)
 
         save_roadmap(self.root, roadmap)
 
@@ -270,9 +269,11 @@ class ESAAServiceCore:
         self,
         base_events: list[dict[str, Any]],
         new_events: list[dict[str, Any]],
+        base_projection_hash: str | None = None,
     ) -> dict[str, Any]:
+        # Chamadores que ja materializaram `base_events` repassam o hash e evitam reprojetar o prefixo.
         expected_first_seq = next_event_seq(base_events)
-        expected_hash = _projection_hash(base_events)
+        expected_hash = base_projection_hash or _projection_hash(base_events)
         concurrency = _concurrency_policy(self._policy())
         max_retries = int(concurrency["submit_retries"])
         retry_backoff = float(concurrency["retry_backoff"])
@@ -361,47 +362,47 @@ class ESAAServiceCore:
 
         new_events = list(candidate_events)
 
-        all_events = events + new_events
+        projection = ProjectionState(events + new_events)
 
-        final_roadmap, final_issues, final_lessons = materialize(all_events)
+        final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         if all_tasks_done(final_roadmap["tasks"]) and final_roadmap["meta"]["run"]["status"] != "success":
 
             run_end = make_event(
-                next_event_seq(all_events),
+                projection.next_seq,
                 actor="orchestrator",
                 action="run.end",
                 payload={"status": "success"},
             )
 
-            all_events.append(run_end)
-
             new_events.append(run_end)
 
-            final_roadmap, final_issues, final_lessons = materialize(all_events)
+            projection.apply(run_end)
+
+            final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         verify_start = make_event(
-            next_event_seq(all_events), actor="orchestrator", action="verify.start", payload={"strict": True}
+            projection.next_seq, actor="orchestrator", action="verify.start", payload={"strict": True}
         )
 
-        all_events.append(verify_start)
-
         new_events.append(verify_start)
 
-        final_roadmap, final_issues, final_lessons = materialize(all_events)
+        projection.apply(verify_start)
+
+        final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         verify_ok = make_event(
-            next_event_seq(all_events),
+            projection.next_seq,
             actor="orchestrator",
             action="verify.ok",
             payload={"projection_hash_sha256": final_roadmap["meta"]["run"]["projection_hash_sha256"]},
         )
 
-        all_events.append(verify_ok)
-
         new_events.append(verify_ok)
 
-        final_roadmap, final_issues, final_lessons = materialize(all_events)
+        projection.apply(verify_ok)
+
+        final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         if not dry_run:
             self._append_events_transactionally(events, new_events)
@@ -433,7 +434,9 @@ class ESAAServiceCore:
 
         return result
 
-    def replay(self, until: str | None = None, write_views: bool = True) -> dict[str, Any]:
+    def replay(
+        self, until: str | None = None, write_views: bool = True, rebuild: bool = False
+    ) -> dict[str, Any]:
 
         events = parse_event_store(self.root)
 
@@ -461,7 +464,10 @@ class ESAAServiceCore:
 
                 selected = out
 
-        roadmap, issues, lessons = materialize(selected)
+        # Replay incremental: parte do checkpoint valido mais recente e aplica so a cauda.
+        roadmap, issues, lessons, resumed_from = project_from_checkpoint(
+            self.root, selected, write_checkpoints=write_views, rebuild=rebuild
+        )
 
         if write_views:
 
@@ -473,6 +479,7 @@ class ESAAServiceCore:
 
         return {
             "events_replayed": len(selected),
+            "resumed_from_event_seq": resumed_from,
             "last_event_seq": roadmap["meta"]["run"]["last_event_seq"],
             "projection_hash_sha256": roadmap["meta"]["run"]["projection_hash_sha256"],
             "verify_status": "ok",
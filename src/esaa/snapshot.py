@@ -1,14 +1,21 @@
 from __future__ import annotations
 
-import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
 
+from . import jsonio
+from .constants import SCHEMA_VERSION
 from .errors import ESAAError
-from .projector import materialize
-from .store import load_roadmap, parse_event_store
+from .projector import apply_events, dump_state, load_state, materialize, materialize_from, new_state
+from .store import event_prefix_sha256, iter_event_lines, load_roadmap, parse_event_store, read_event_lines
 from .utils import ensure_parent, sha256_hex, utc_now_iso
 
+# Intervalo (em eventos) entre checkpoints de estado gravados pelo replay.
+CHECKPOINT_INTERVAL = 10_000
+# Checkpoints mantidos em disco (os gravados mais recentemente).
+CHECKPOINT_KEEP = 3
+
 
 def _snapshot_paths(before: int) -> dict[str, Path]:
     base = Path(".roadmap") / "snapshots"
@@ -20,6 +27,140 @@ def _snapshot_paths(before: int) -> dict[str, Path]:
     }
 
 
+def _checkpoint_dir(root: Path) -> Path:
+    return root / ".roadmap" / "snapshots"
+
+
+def _checkpoint_path(root: Path, event_seq: int) -> Path:
+    return _checkpoint_dir(root) / f"checkpoint-{event_seq:08d}.json"
+
+
+def _state_sha256(dumped: dict[str, Any]) -> str:
+    # Indexes ficam de fora: load_state os reconta a partir das tasks.
+    return sha256_hex({key: value for key, value in dumped.items() if key != "indexes"})
+
+
+def _prune_checkpoints(root: Path) -> None:
+    # Ordem de gravacao (mtime), nao de seq: checkpoints de um store reescrito podem ter seq maior.
+    entries = []
+    for path in _checkpoint_dir(root).glob("checkpoint-*.json"):
+        try:
+            entries.append((path.stat().st_mtime_ns, path.name, path))
+        except OSError:
+            continue
+    for _, _, path in sorted(entries)[:-CHECKPOINT_KEEP]:
+        path.unlink(missing_ok=True)
+
+
+def save_checkpoint(root: Path, state: dict[str, Any], event_seq: int, lines: list[bytes]) -> Path:
+    """Grava o estado do projetor apos ``event_seq`` para replay incremental.
+
+    O sha256 do prefixo do event store amarra o checkpoint aos eventos que ele
+    cobre: se o store for reescrito (activity clear, init --force), o
+    checkpoint deixa de casar e e ignorado. O sha256 do estado detecta edicao
+    do proprio checkpoint. So os CHECKPOINT_KEEP mais recentes sao mantidos.
+    """
+    path = _checkpoint_path(root, event_seq)
+    dumped = dump_state(state)
+    _write_json(
+        path,
+        {
+            "checkpoint": {
+                "schema_version": SCHEMA_VERSION,
+                "event_seq": event_seq,
+                "prefix_sha256": event_prefix_sha256(lines, event_seq),
+                "state_sha256": _state_sha256(dumped),
+                "created_at": utc_now_iso(),
+            },
+            "state": dumped,
+        },
+    )
+    _prune_checkpoints(root)
+    return path
+
+
+def load_checkpoint(root: Path, lines: list[bytes], max_seq: int) -> tuple[dict[str, Any], int] | None:
+    """Devolve (estado, event_seq) do checkpoint valido mais recente com seq <= max_seq."""
+    directory = _checkpoint_dir(root)
+    if not directory.is_dir():
+        return None
+    candidates: list[tuple[int, Path]] = []
+    for path in directory.glob("checkpoint-*.json"):
+        try:
+            seq = int(path.stem.split("-", 1)[1])
+        except ValueError:
+            continue
+        if 0 < seq <= min(max_seq, len(lines)):
+            candidates.append((seq, path))
+    for seq, path in sorted(candidates, reverse=True):
+        try:
+            data = jsonio.loads(path.read_bytes())
+            meta = data["checkpoint"]
+            if meta.get("schema_version") != SCHEMA_VERSION or meta.get("event_seq") != seq:
+                continue
+            if meta.get("prefix_sha256") != event_prefix_sha256(lines, seq):
+                continue
+            if meta.get("state_sha256") != _state_sha256(data["state"]):
+                continue
+            return load_state(data["state"]), seq
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            continue
+    return None
+
+
+def project_from_checkpoint(
+    root: Path, events: list[dict[str, Any]], write_checkpoints: bool = True, rebuild: bool = False
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any], int]:
+    """Projeta ``events`` (prefixo do store) partindo do checkpoint valido mais recente.
+
+    Com ``write_checkpoints`` grava um checkpoint a cada CHECKPOINT_INTERVAL
+    eventos aplicados. ``rebuild`` ignora checkpoints existentes. Devolve as
+    tres views e o event_seq a partir do qual o replay foi retomado (0 = completo).
+    """
+    lines = read_event_lines(root)
+    checkpoint = None if rebuild else load_checkpoint(root, lines, max_seq=len(events))
+    state, resumed_from = checkpoint if checkpoint is not None else (new_state(), 0)
+
+    position = resumed_from
+    while write_checkpoints and len(events) - position >= CHECKPOINT_INTERVAL:
+        chunk_end = (position // CHECKPOINT_INTERVAL + 1) * CHECKPOINT_INTERVAL
+        apply_events(state, events[position:chunk_end])
+        save_checkpoint(root, state, chunk_end, lines)
+        position = chunk_end
+
+    roadmap, issues, lessons = materialize_from(state, events[position:])
+    return roadmap, issues, lessons, resumed_from
+
+
+def project_store(
+    root: Path, write_checkpoints: bool = True
+) -> tuple[dict[str, Any], dict[str, Any], dict[str, Any], int]:
+    """Projeta o store inteiro retomando do checkpoint valido mais recente.
+
+    Todas as linhas continuam validadas em passada unica (seq, event_id, cadeia
+    de hash); so o replay do prefixo coberto pelo checkpoint e evitado. Como
+    event_seq e contiguo a partir de 1, o seq coincide com a posicao da linha.
+    """
+    lines = read_event_lines(root)
+    checkpoint = load_checkpoint(root, lines, max_seq=len(lines))
+    state, resumed_from = checkpoint if checkpoint is not None else (new_state(), 0)
+
+    def tail() -> Iterator[dict[str, Any]]:
+        for event in iter_event_lines(lines):
+            seq = event["event_seq"]
+            if seq <= resumed_from:
+                continue
+            if write_checkpoints and seq % CHECKPOINT_INTERVAL == 0:
+                # Grava antes de aplicar a cauda restante: o estado cobre exatamente 1..seq.
+                apply_events(state, (event,))
+                save_checkpoint(root, state, seq, lines)
+                continue
+            yield event
+
+    roadmap, issues, lessons = materialize_from(state, tail())
+    return roadmap, issues, lessons, resumed_from
+
+
 def _verify_projection_ok(root: Path, events: list[dict[str, Any]]) -> str:
     stored = load_roadmap(root)
     if not stored:
@@ -40,15 +181,12 @@ def _last_verify_ok_seq(events: list[dict[str, Any]]) -> int:
 
 def _write_json(path: Path, payload: Any) -> None:
     ensure_parent(path)
-    path.write_text(json.dumps(payload, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    path.write_bytes(jsonio.dumps_indent(payload))
 
 
 def _write_jsonl(path: Path, events: list[dict[str, Any]]) -> None:
     ensure_parent(path)
-    path.write_text(
-        "".join(json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n" for event in events),
-        encoding="utf-8",
-    )
+    path.write_bytes(b"".join(jsonio.dumps(event) + b"\n" for event in events))
 
 
 def create_snapshot(root: Path, before: int, compact: bool = False, dry_run: bool = False) -> dict[str, Any]:
@@ -150,7 +288,7 @@ def replay_compacted(root: Path, manifest: dict[str, Any]) -> dict[str, Any]:
         raise ESAAError("SNAPSHOT_TAIL_MISSING", f"tail missing: {tail_path}")
 
     def read_jsonl(path: Path) -> list[dict[str, Any]]:
-        return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        return [jsonio.loads(line) for line in path.read_bytes().splitlines() if line.strip()]
 
     events = read_jsonl(archive_path) + read_jsonl(tail_path)
     roadmap, _, _ = materialize(events)
@@ -105,3 +105,12 @@ def classify_transition(current: str, action: str) -> tuple[bool, Optional[str]]
         return False, REJECT_WORKFLOW_GATE
 
     return False, REJECT_WORKFLOW_GATE
+
+
+# Tabela (status, action) -> reject_code (None = transicao valida), pre-computada de
+# classify_transition para o caminho quente do projetor.
+TRANSITION_REJECTS: dict[tuple[str, str], Optional[str]] = {
+    (status, action): classify_transition(status, action)[1]
+    for status in TASK_STATUSES
+    for action in AGENT_ACTIONS
+}
@@ -8,10 +8,14 @@ import json
 import os
 import socket
 import sys
+import threading
 import time
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+from . import jsonio, yamlio
 from .compat import normalize_legacy_event
 from .constants import (
     AGENT_CONTRACT_PATH,
@@ -28,6 +32,9 @@ from .utils import ensure_parent, utc_now_iso
 
 _CONCURRENCY_METRICS: Counter[str] = Counter()
 
+_REQUIRED_EVENT_FIELDS = ("schema_version", "event_id", "event_seq", "ts", "actor", "action", "payload")
+_REQUIRED_EVENT_KEYS = frozenset(_REQUIRED_EVENT_FIELDS)
+
 
 def record_concurrency_metric(name: str, value: int = 1) -> None:
     _CONCURRENCY_METRICS[name] += int(value)
@@ -48,12 +55,19 @@ def reset_concurrency_metrics() -> None:
 
 
 def _read_json(path: Path) -> Any:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return jsonio.loads(path.read_bytes())
 
 
 def _write_json(path: Path, data: Any) -> None:
+    # Escrita atomica: leitores concorrentes veem a view antiga ou a nova, nunca truncada.
     ensure_parent(path)
-    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        tmp.write_bytes(jsonio.dumps_indent(data))
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
 
 
 def load_roadmap(root: Path) -> dict[str, Any] | None:
@@ -83,6 +97,23 @@ def ensure_event_store(root: Path) -> Path:
     return path
 
 
+def event_store_has_content(path: Path) -> bool:
+    """True se o store tem algum byte nao-branco, sem ler o arquivo inteiro.
+
+    Tamanho zero sai pelo stat; um store real comeca com '{' e decide no primeiro bloco.
+    """
+    try:
+        if path.stat().st_size == 0:
+            return False
+        with path.open("rb") as handle:
+            while block := handle.read(1 << 16):
+                if block.strip():
+                    return True
+    except FileNotFoundError:
+        return False
+    return False
+
+
 def _sha256_bytes(data: bytes) -> str:
     return hashlib.sha256(data).hexdigest()
 
@@ -96,11 +127,32 @@ def compute_event_hash(event: dict[str, Any]) -> str:
     return _sha256_bytes(_canonical_event_bytes(event))
 
 
-def _anchor_hash(lines: list[str], through_seq: int) -> str:
+def _anchor_hash(lines: list[bytes], through_seq: int) -> str:
     if through_seq <= 0:
         return _sha256_bytes(b"")
-    payload = "\n".join(lines[:through_seq]) + "\n"
-    return _sha256_bytes(payload.encode("utf-8"))
+    return _sha256_bytes(b"\n".join(lines[:through_seq]) + b"\n")
+
+
+def _split_store_lines(buf: bytes) -> list[bytes]:
+    # Linhas nao vazias, sem decode do arquivo inteiro: so b"\n" separa eventos
+    # (o writer grava LF); um CR final de edicao externa (CRLF) e descartado.
+    lines: list[bytes] = []
+    for line in buf.split(b"\n"):
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        if line.strip():
+            lines.append(line)
+    return lines
+
+
+def read_event_lines(root: Path) -> list[bytes]:
+    """Linhas nao vazias do event store, exatamente como gravadas."""
+    return _split_store_lines(ensure_event_store(root).read_bytes())
+
+
+def event_prefix_sha256(lines: list[bytes], through_seq: int) -> str:
+    """sha256 das primeiras ``through_seq`` linhas do store (mesma regra do chain.anchor)."""
+    return _anchor_hash(lines, through_seq)
 
 
 def _find_anchor(events: list[dict[str, Any]]) -> dict[str, Any] | None:
@@ -108,32 +160,26 @@ def _find_anchor(events: list[dict[str, Any]]) -> dict[str, Any] | None:
     return anchors[-1] if anchors else None
 
 
-def _validate_hash_chain(lines: list[str], events: list[dict[str, Any]]) -> None:
-    anchor = _find_anchor(events)
-    if anchor is None:
-        return
-
+def _anchor_error(anchor: dict[str, Any], prefix_sha256: str) -> str | None:
     payload = anchor.get("payload") or {}
     anchored_through = int(payload.get("anchored_through_seq", -1))
     anchor_hash = payload.get("anchor_sha256")
     if not isinstance(anchor_hash, str) or not anchor_hash:
-        raise CorruptedStoreError("CHAIN_BROKEN", "chain.anchor missing anchor_sha256")
+        return "chain.anchor missing anchor_sha256"
     if anchor.get("event_seq") != anchored_through + 1:
-        raise CorruptedStoreError("CHAIN_BROKEN", "chain.anchor must immediately follow anchored events")
-    if _anchor_hash(lines, anchored_through) != anchor_hash:
-        raise CorruptedStoreError("CHAIN_BROKEN", "anchor hash mismatch")
-
-    prev_hash = anchor_hash
-    for event in events:
-        if event["event_seq"] <= anchor["event_seq"]:
-            continue
-        declared_prev = event.get("prev_event_hash")
-        declared_hash = event.get("event_hash")
-        if declared_prev != prev_hash:
-            raise CorruptedStoreError("CHAIN_BROKEN", f"prev_event_hash mismatch at seq {event['event_seq']}")
-        if not isinstance(declared_hash, str) or declared_hash != compute_event_hash(event):
-            raise CorruptedStoreError("CHAIN_BROKEN", f"event_hash mismatch at seq {event['event_seq']}")
-        prev_hash = declared_hash
+        return "chain.anchor must immediately follow anchored events"
+    if prefix_sha256 != anchor_hash:
+        return "anchor hash mismatch"
+    return None
+
+
+def _chain_link_error(event: dict[str, Any], prev_hash: str | None) -> str | None:
+    declared_hash = event.get("event_hash")
+    if event.get("prev_event_hash") != prev_hash:
+        return f"prev_event_hash mismatch at seq {event['event_seq']}"
+    if not isinstance(declared_hash, str) or declared_hash != compute_event_hash(event):
+        return f"event_hash mismatch at seq {event['event_seq']}"
+    return None
 
 
 def _prepare_events_for_append(
@@ -162,8 +208,6 @@ def _prepare_events_for_append(
 
 
 def verify_hash_chain(root: Path) -> dict[str, Any]:
-    path = ensure_event_store(root)
-    lines = [ln for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
     try:
         events = parse_event_store(root)
     except CorruptedStoreError as exc:
@@ -184,7 +228,7 @@ def init_hash_chain(root: Path, force: bool = False) -> dict[str, Any]:
     events = parse_event_store(root)
     if _find_anchor(events) is not None and not force:
         raise ESAAError("CHAIN_ALREADY_ANCHORED", "event store already has chain.anchor")
-    lines = [ln for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
+    lines = _split_store_lines(path.read_bytes())
     anchored_through = events[-1]["event_seq"] if events else 0
     payload = {
         "anchored_through_seq": anchored_through,
@@ -205,18 +249,23 @@ def init_hash_chain(root: Path, force: bool = False) -> dict[str, Any]:
     return {"status": "anchored", "event_id": event["event_id"], **payload}
 
 
-def parse_event_store(root: Path) -> list[dict[str, Any]]:
-    path = ensure_event_store(root)
-    lines = [ln for ln in path.read_text(encoding="utf-8").splitlines() if ln.strip()]
+def _validated_events(lines: Iterable[bytes]) -> Iterator[dict[str, Any]]:
+    """Valida e normaliza as linhas do store na ordem, sem reter as linhas lidas.
 
-    events: list[dict[str, Any]] = []
+    A cadeia de hash e conferida incrementalmente a partir do chain.anchor mais
+    recente (sha256 corrente do prefixo); como so o ultimo anchor vale, um
+    CHAIN_BROKEN e levantado apenas ao fim do stream.
+    """
     seen_ids: set[str] = set()
     last_seq = 0
+    prefix = hashlib.sha256()
+    prev_hash: str | None = None
+    chain_error: str | None = None
 
     for idx, line in enumerate(lines, start=1):
         try:
-            raw = json.loads(line)
-        except json.JSONDecodeError as exc:
+            raw = jsonio.loads(line)
+        except (jsonio.JSONDecodeError, UnicodeDecodeError) as exc:
             raise CorruptedStoreError("JSONL_INVALID", f"invalid JSON at line {idx}: {exc}") from exc
 
         event = normalize_legacy_event(raw)
@@ -236,13 +285,15 @@ def parse_event_store(root: Path) -> list[dict[str, Any]]:
             raise CorruptedStoreError("EVENT_ID_DUPLICATE", f"duplicate event_id {event['event_id']}")
         seen_ids.add(event["event_id"])
 
-        required = ("schema_version", "event_id", "event_seq", "ts", "actor", "action", "payload")
-        missing = [k for k in required if k not in event]
-        if missing:
+        # Caminho comum: um unico teste de subconjunto; a lista so e montada para a mensagem de erro.
+        if not _REQUIRED_EVENT_KEYS <= event.keys():
+            missing = [k for k in _REQUIRED_EVENT_FIELDS if k not in event]
             raise CorruptedStoreError("EVENT_MISSING_FIELDS", f"missing fields: {', '.join(missing)}")
 
         if event["action"] not in CANONICAL_ACTIONS:
             raise CorruptedStoreError("UNKNOWN_ACTION", f"unknown action in event store: {event['action']}")
+        # Uma unica instancia por action em todo o log (memoria e dispatch por identidade).
+        event["action"] = sys.intern(event["action"])
 
         # G08/PROV-01: bloco runner e opcional (legado nao tem), mas se presente deve ser valido
         if "runner" in event and event["runner"] is not None:
@@ -251,10 +302,51 @@ def parse_event_store(root: Path) -> list[dict[str, Any]]:
             except ESAAError as exc:
                 raise CorruptedStoreError("RUNNER_INVALID", f"line {idx}: {exc}") from exc
 
-        events.append(event)
+        if event["action"] == "chain.anchor":
+            # Um anchor posterior substitui o anterior: erros de cadeia pendentes sao descartados.
+            chain_error = _anchor_error(event, prefix.hexdigest())
+            prev_hash = (event.get("payload") or {}).get("anchor_sha256")
+        elif prev_hash is not None and chain_error is None:
+            chain_error = _chain_link_error(event, prev_hash)
+            prev_hash = event.get("event_hash")
+        prefix.update(line)
+        prefix.update(b"\n")
+
+        yield event
+
+    if chain_error is not None:
+        raise CorruptedStoreError("CHAIN_BROKEN", chain_error)
 
-    _validate_hash_chain(lines, events)
-    return events
+
+def _iter_store_lines(path: Path) -> Iterator[bytes]:
+    # Mesma quebra de _split_store_lines, sem carregar o arquivo inteiro.
+    with path.open("rb") as handle:
+        for line in handle:
+            line = line.rstrip(b"\n")
+            if line.endswith(b"\r"):
+                line = line[:-1]
+            if line.strip():
+                yield line
+
+
+def parse_event_store(root: Path) -> list[dict[str, Any]]:
+    # Linhas consumidas direto do arquivo e validadas em uma passada: nem o buffer
+    # inteiro nem a lista de linhas ficam vivos ao lado dos eventos.
+    return list(_validated_events(_iter_store_lines(ensure_event_store(root))))
+
+
+def iter_event_lines(lines: Iterable[bytes]) -> Iterator[dict[str, Any]]:
+    """Valida linhas ja lidas (read_event_lines), com a mesma semantica de iter_event_store."""
+    return _validated_events(lines)
+
+
+def iter_event_store(root: Path) -> Iterator[dict[str, Any]]:
+    """Versao streaming de parse_event_store para projecoes de passada unica.
+
+    Erros de corrupcao surgem durante a iteracao (CHAIN_BROKEN so ao final):
+    consumidores devem tratar o resultado como valido apenas apos esgotar o iterador.
+    """
+    return _validated_events(_iter_store_lines(ensure_event_store(root)))
 
 
 def _lock_path(path: Path) -> Path:
@@ -396,11 +488,11 @@ def _release_store_lock(lock_path: Path) -> None:
         pass
 
 
-def _verify_appended_lines(path: Path, expected_lines: list[str]) -> None:
+def _verify_appended_lines(path: Path, expected_lines: list[bytes]) -> None:
     if not expected_lines:
         return
     try:
-        actual_lines = [line for line in path.read_text(encoding="utf-8").splitlines() if line.strip()]
+        actual_lines = [line for line in path.read_bytes().splitlines() if line.strip()]
     except OSError as exc:
         record_concurrency_metric("append_verify_failed")
         raise ESAAError("APPEND_VERIFY_FAILED", f"failed to re-read appended events: {exc}") from exc
@@ -409,6 +501,30 @@ def _verify_appended_lines(path: Path, expected_lines: list[str]) -> None:
         raise ESAAError("APPEND_VERIFY_FAILED", "read-after-write verification did not match appended events")
 
 
+def _ends_without_newline(path: Path) -> bool:
+    with path.open("rb") as handle:
+        if handle.seek(0, os.SEEK_END) == 0:
+            return False
+        handle.seek(-1, os.SEEK_END)
+        return handle.read(1) != b"\n"
+
+
+def _write_event_lines(path: Path, events: list[dict[str, Any]]) -> None:
+    """Anexa eventos ja preparados com um unico write em O_APPEND; confere read-after-write."""
+    serialized_lines = [jsonio.dumps(event) for event in events]
+    buf = b"".join(line + b"\n" for line in serialized_lines)
+    if _ends_without_newline(path):
+        buf = b"\n" + buf
+    fd = os.open(path, os.O_WRONLY | os.O_APPEND | getattr(os, "O_BINARY", 0) | getattr(os, "O_CLOEXEC", 0))
+    try:
+        view = memoryview(buf)
+        while view:  # write parcial e raro, mas permitido pelo POSIX
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+    _verify_appended_lines(path, serialized_lines)
+
+
 def append_events(
     root: Path,
     events: list[dict[str, Any]],
@@ -425,17 +541,7 @@ def append_events(
     try:
         current_events = parse_event_store(root)
         prepared = _prepare_events_for_append(current_events, events)
-        serialized_lines = [
-            json.dumps(event, ensure_ascii=False, separators=(",", ":")) for event in prepared
-        ]
-        existing = path.read_bytes()
-        needs_sep = bool(existing) and not existing.endswith(b"\n")
-        with path.open("a", encoding="utf-8", newline="\n") as handle:
-            if needs_sep:
-                handle.write("\n")
-            for line in serialized_lines:
-                handle.write(line + "\n")
-        _verify_appended_lines(path, serialized_lines)
+        _write_event_lines(path, prepared)
     finally:
         _release_store_lock(lock_path)
 
@@ -446,16 +552,41 @@ def next_event_seq(events: list[dict[str, Any]]) -> int:
     return int(events[-1]["event_seq"]) + 1
 
 
-def load_agent_contract(root: Path) -> dict[str, Any]:
-    import yaml
+# Contrato e schema mudam raramente: cache por (path, mtime_ns, size), invalidado ao
+# editar o arquivo. O dict devolvido e compartilhado entre chamadas (somente-leitura).
+# Bundles com o mesmo conteudo (varios roots/workspaces) compartilham o mesmo objeto,
+# o que tambem reaproveita os validadores compilados por schema em validator.py.
+@lru_cache(maxsize=64)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    return _parse_yaml_shared(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=64)
+def _load_json_cached(path: str, mtime_ns: int, size: int) -> Any:
+    return _parse_json_shared(Path(path).read_bytes())
+
+
+@lru_cache(maxsize=8)
+def _parse_yaml_shared(data: bytes) -> Any:
+    return yamlio.safe_load(data)
 
-    path = root / AGENT_CONTRACT_PATH
-    return yaml.safe_load(path.read_text(encoding="utf-8"))
+
+@lru_cache(maxsize=8)
+def _parse_json_shared(data: bytes) -> Any:
+    return jsonio.loads(data)
+
+
+def _stat_key(path: Path) -> tuple[str, int, int]:
+    st = path.stat()
+    return str(path), st.st_mtime_ns, st.st_size
+
+
+def load_agent_contract(root: Path) -> dict[str, Any]:
+    return _load_yaml_cached(*_stat_key(root / AGENT_CONTRACT_PATH))
 
 
 def load_agent_result_schema(root: Path) -> dict[str, Any]:
-    path = root / AGENT_RESULT_SCHEMA_PATH
-    return _read_json(path)
+    return _load_json_cached(*_stat_key(root / AGENT_RESULT_SCHEMA_PATH))
 
 
 def require_task(roadmap: dict[str, Any], task_id: str) -> dict[str, Any]:
@@ -524,17 +655,7 @@ def append_transactional(
         final_roadmap, final_issues, final_lessons = materialize(events + new_events)
 
         # Append (reentrante sob lock atual; usa a logica de newline-guard)
-        serialized_lines = [
-            json.dumps(event, ensure_ascii=False, separators=(",", ":")) for event in new_events
-        ]
-        existing = path.read_bytes()
-        needs_sep = bool(existing) and not existing.endswith(b"\n")
-        with path.open("a", encoding="utf-8", newline="\n") as handle:
-            if needs_sep:
-                handle.write("\n")
-            for line in serialized_lines:
-                handle.write(line + "\n")
-        _verify_appended_lines(path, serialized_lines)
+        _write_event_lines(path, new_events)
 
         save_roadmap(root, final_roadmap)
         save_issues(root, final_issues)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Sequence
+from itertools import chain
 from pathlib import Path
 from typing import Any
 
 from .conflicts import conflict_between_sets, explain_conflict, normalize_write_set
+from .constants import REVIEWER_ROLES
 from .edits import resolve_edit_updates
 from .errors import ESAAError
 from .events import build_hotfix_event, build_issue_resolve_event, make_event
@@ -15,17 +18,16 @@ from .file_effects import (
     discard_staged,
     stage_and_compute,
 )
-from .projector import materialize
+from .projector import ProjectionState
 from .provenance import resolve_runner
 from .runtime_policy import is_blocked_by_max_attempts
 from .seeds import all_tasks_done
 from .store import (
     load_agent_contract,
     load_agent_result_schema,
-    next_event_seq,
     parse_event_store,
 )
-from .utils import normalize_rel_path
+from .utils import normalize_rel_path, utc_now_iso
 from .validator import (
     validate_agent_output,
     validate_file_update_resource_limits,
@@ -33,7 +35,7 @@ from .validator import (
 )
 
 
-def _normalize_file_updates(root: Path, file_updates: list[dict[str, Any]]) -> list[dict[str, Any]]:
+def _normalize_file_updates(root: Path, file_updates: Sequence[dict[str, Any]]) -> list[dict[str, Any]]:
     normalized = [
         {"path": normalize_rel_path(item["path"]), "content": item["content"]}
         for item in resolve_edit_updates(root, file_updates)
@@ -98,25 +100,52 @@ class SubmissionMixin:
 
         schema = load_agent_result_schema(self.root)
 
-        roadmap, _, _ = materialize(events)
+        result, new_events, staged_file_effects, base_hash = self._stage_submission(
+            events, agent_output, actor, dry_run, contract, schema, self._policy()
+        )
 
-        activity_event = agent_output.get("activity_event", {})
+        if not dry_run:
+            try:
+                self._append_events_transactionally(events, new_events, base_hash)
+                commit_staged(self.root, staged_file_effects)
+            except Exception:
+                discard_staged(staged_file_effects)
+                raise
 
-        task_id = activity_event.get("task_id")
+        return result
 
-        if not task_id:
+    def _stage_submission(
+        self,
+        events: list[dict[str, Any]],
+        agent_output: dict[str, Any],
+        actor: str,
+        dry_run: bool,
+        contract: dict[str, Any],
+        schema: dict[str, Any],
+        policy: dict[str, Any],
+    ) -> tuple[dict[str, Any], list[dict[str, Any]], list[dict[str, Any]], str]:
+        """Valida e projeta uma submissao sobre `events` sem persistir (append fica com o chamador).
 
-            raise ESAAError("SCHEMA_INVALID", "activity_event.task_id is required")
+        O ultimo item e o projection hash de `events`, reaproveitado pelo append transacional.
+        """
 
-        task = None
+        projection = ProjectionState(events)
 
-        for t in roadmap["tasks"]:
+        ts = utc_now_iso()  # submissao atomica: todos os eventos do lote compartilham o timestamp
 
-            if t["task_id"] == task_id:
+        roadmap, _, _ = projection.snapshot()
 
-                task = t
+        base_hash = roadmap["meta"]["run"]["projection_hash_sha256"]
 
-                break
+        activity_event = agent_output.get("activity_event", {})
+
+        task_id = activity_event.get("task_id")
+
+        if not task_id:
+
+            raise ESAAError("SCHEMA_INVALID", "activity_event.task_id is required")
+
+        task = projection.task(task_id)
 
         if not task:
 
@@ -124,8 +153,6 @@ class SubmissionMixin:
 
         # R2: bloqueia se ja atingiu max_attempts
 
-        policy = self._policy()
-
         max_attempts = policy.get("attempt_limits", {}).get("max_attempts_per_task", 3)
 
         if is_blocked_by_max_attempts(events, task_id, max_attempts):
@@ -139,7 +166,7 @@ class SubmissionMixin:
 
         validate_runner_id(resolve_runner()["runner_id"], root=self.root, policy=policy)
 
-        current_seq = next_event_seq(events)
+        current_seq = projection.next_seq
         new_events: list[dict[str, Any]] = []
         files_written = 0
         staged_file_effects: list[dict[str, Any]] = []
@@ -160,7 +187,7 @@ class SubmissionMixin:
 
                 if mode == "qa_role":
 
-                    if role not in {"qa", "orchestrator"}:
+                    if role not in REVIEWER_ROLES:
 
                         raise ESAAError(
                             "REVIEW_ROLE_VIOLATION",
@@ -170,12 +197,12 @@ class SubmissionMixin:
                     validated_event["_reviewer_role"] = role
 
             agent_event = make_event(
-                current_seq, actor=actor, action=validated_event["action"], payload=validated_event
+                current_seq, actor=actor, action=validated_event["action"], payload=validated_event, ts=ts
             )
 
             candidate_events = [agent_event]
 
-            _ = materialize(events + candidate_events)
+            projection.apply(agent_event)
 
             if file_updates:
                 if dry_run:
@@ -187,18 +214,19 @@ class SubmissionMixin:
                     actor="orchestrator",
                     action="orchestrator.file.write",
                     payload=_file_write_payload(task_id, effects),
+                    ts=ts,
                 )
                 effects_for_result = effects
                 candidate_events.append(write_event)
-                _ = materialize(events + candidate_events)
+                projection.apply(write_event)
                 files_written += len(file_updates)
 
             if validated_event["action"] == "issue.report":
                 # M-03: validacao interna em build_hotfix_event (raise_on_invalid=True).
-                hotfix_event = build_hotfix_event(events + candidate_events, validated_event)
+                hotfix_event = build_hotfix_event(projection, validated_event)
                 if hotfix_event:
                     candidate_events.append(hotfix_event)
-                    _ = materialize(events + candidate_events)
+                    projection.apply(hotfix_event)
 
             if validated_event["action"] == "review":
 
@@ -208,60 +236,56 @@ class SubmissionMixin:
 
                     candidate_events.append(resolve_event)
 
-                    _ = materialize(events + candidate_events)
+                    projection.apply(resolve_event)
 
             new_events.extend(candidate_events)
         except Exception:
             discard_staged(staged_file_effects)
             raise
 
-        all_events = events + new_events
-
         verify_start = make_event(
-            next_event_seq(all_events), actor="orchestrator", action="verify.start", payload={"strict": True}
+            projection.next_seq,
+            actor="orchestrator",
+            action="verify.start",
+            payload={"strict": True},
+            ts=ts,
         )
 
-        all_events.append(verify_start)
-
         new_events.append(verify_start)
 
-        final_roadmap, final_issues, final_lessons = materialize(all_events)
+        projection.apply(verify_start)
+
+        final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         if all_tasks_done(final_roadmap["tasks"]) and final_roadmap["meta"]["run"]["status"] != "success":
 
             run_end = make_event(
-                next_event_seq(all_events),
+                projection.next_seq,
                 actor="orchestrator",
                 action="run.end",
                 payload={"status": "success"},
+                ts=ts,
             )
 
-            all_events.append(run_end)
-
             new_events.append(run_end)
 
-            final_roadmap, final_issues, final_lessons = materialize(all_events)
+            projection.apply(run_end)
+
+            final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         verify_ok = make_event(
-            next_event_seq(all_events),
+            projection.next_seq,
             actor="orchestrator",
             action="verify.ok",
             payload={"projection_hash_sha256": final_roadmap["meta"]["run"]["projection_hash_sha256"]},
+            ts=ts,
         )
 
-        all_events.append(verify_ok)
-
         new_events.append(verify_ok)
 
-        final_roadmap, final_issues, final_lessons = materialize(all_events)
+        projection.apply(verify_ok)
 
-        if not dry_run:
-            try:
-                self._append_events_transactionally(events, new_events)
-                commit_staged(self.root, staged_file_effects)
-            except Exception:
-                discard_staged(staged_file_effects)
-                raise
+        final_roadmap, final_issues, final_lessons = projection.snapshot()
 
         result = {
             "status": "dry_run" if dry_run else "accepted",
@@ -291,77 +315,7 @@ class SubmissionMixin:
             ]
             if external_effects:
                 result["external_effects"] = external_effects
-        return result
-
-    def process(self, dry_run: bool = False) -> dict[str, Any]:
-
-        inbox = self.root / ".roadmap" / "inbox"
-
-        if not inbox.exists():
-
-            return {"processed": 0, "accepted": 0, "rejected": 0, "results": []}
-
-        done_dir = inbox / "done"
-
-        rejected_dir = inbox / "rejected"
-
-        done_dir.mkdir(parents=True, exist_ok=True)
-
-        rejected_dir.mkdir(parents=True, exist_ok=True)
-
-        files = sorted(inbox.glob("*.json"))
-
-        results: list[dict[str, Any]] = []
-
-        accepted = 0
-
-        rejected = 0
-
-        for filepath in files:
-
-            name = filepath.stem
-
-            if "__" in name:
-
-                actor, _task_id = name.split("__", 1)
-
-            else:
-
-                actor = "agent-external"
-
-            try:
-
-                agent_output = json.loads(filepath.read_text(encoding="utf-8"))
-
-                result = self.submit(agent_output, actor=actor, dry_run=dry_run)
-
-                results.append(result)
-
-                accepted += 1
-
-                if not dry_run:
-
-                    filepath.rename(done_dir / filepath.name)
-
-            except (ESAAError, json.JSONDecodeError) as exc:
-
-                error_info = {"status": "rejected", "file": filepath.name, "error": str(exc)}
-
-                if isinstance(exc, ESAAError):
-
-                    error_info["error_code"] = exc.code
-
-                    error_info["error"] = exc.message
-
-                results.append(error_info)
-
-                rejected += 1
-
-                if not dry_run:
-
-                    filepath.rename(rejected_dir / filepath.name)
-
-        return {"processed": len(files), "accepted": accepted, "rejected": rejected, "results": results}
+        return result, new_events, staged_file_effects, base_hash
 
     def _accept_agent_output(
         self,
@@ -374,14 +328,23 @@ class SubmissionMixin:
         dry_run: bool,
         wave_write_set: list[str] | None = None,
         staged_file_effects: list[dict[str, Any]] | None = None,
+        projection: ProjectionState | None = None,
     ) -> int:
-        current_seq = next_event_seq(events + new_events)
+        """Valida ``output`` e anexa os eventos aceitos a ``new_events``.
+
+        Com ``projection`` (estado de ``events + new_events`` mantido pelo chamador) os
+        candidatos sao aplicados nela; se a chamada levantar, ela fica indefinida e o
+        chamador deve reconstrui-la.
+        """
         activity_event, file_updates = validate_agent_output(output, schema, contract, task)
         file_updates = _normalize_file_updates(self.root, file_updates)
         validate_file_update_resource_limits(file_updates, self._policy())
         file_updates = resolve_external_file_updates(self.root, task, file_updates)
-        known_roadmap, _, _ = materialize(events + new_events)
-        known_task_ids = {item["task_id"] for item in known_roadmap.get("tasks", [])}
+        if projection is None:
+            # Estado local da chamada: candidatos rejeitados nao vazam para o run.
+            projection = ProjectionState(chain(events, new_events))
+        current_seq = projection.next_seq
+        known_task_ids = projection.task_ids()
         candidate_events: list[dict[str, Any]] = []
         if task["task_id"] not in known_task_ids:
             task_payload = {
@@ -401,7 +364,8 @@ class SubmissionMixin:
             current_seq, actor=self.adapter.agent_id, action=activity_event["action"], payload=activity_event
         )
         candidate_events.append(agent_event)
-        _ = materialize(events + new_events + candidate_events)
+        for event in candidate_events:
+            projection.apply(event)
 
         files_written = 0
         local_staged: list[dict[str, Any]] = []
@@ -421,22 +385,22 @@ class SubmissionMixin:
                     local_staged, effects = stage_and_compute(self.root, file_updates)
 
                 write_event = make_event(
-                    next_event_seq(events + new_events + candidate_events),
+                    projection.next_seq,
                     actor="orchestrator",
                     action="orchestrator.file.write",
                     payload=_file_write_payload(task["task_id"], effects),
                 )
                 candidate_events.append(write_event)
-                _ = materialize(events + new_events + candidate_events)
+                projection.apply(write_event)
                 files_written += len(file_updates)
                 accepted_write_set = current_write_set
 
             if activity_event["action"] == "issue.report":
                 # M-03: validacao interna em build_hotfix_event (raise_on_invalid=True).
-                hotfix_event = build_hotfix_event(events + new_events + candidate_events, activity_event)
+                hotfix_event = build_hotfix_event(projection, activity_event)
                 if hotfix_event:
                     candidate_events.append(hotfix_event)
-                    _ = materialize(events + new_events + candidate_events)
+                    projection.apply(hotfix_event)
 
             if activity_event["action"] == "review":
                 resolve_event = build_issue_resolve_event(
@@ -444,7 +408,7 @@ class SubmissionMixin:
                 )
                 if resolve_event:
                     candidate_events.append(resolve_event)
-                    _ = materialize(events + new_events + candidate_events)
+                    projection.apply(resolve_event)
 
             if staged_file_effects is not None:
                 staged_file_effects.extend(local_staged)
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Iterable
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
@@ -24,8 +26,20 @@ def sha256_hex(value: Any) -> str:
     return hashlib.sha256(canonical_json_bytes(value)).hexdigest()
 
 
+def stream_sha256(chunks: Iterable[bytes]) -> str:
+    """sha256 de uma sequencia de bytes sem concatena-la num buffer unico."""
+    digest = hashlib.sha256()
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.hexdigest()
+
+
+# Funcao pura sobre str: o mesmo punhado de paths (file_updates, scope_patch, grants)
+# se repete ao longo de um run; o cache em C sai mais barato que refazer o trabalho.
+@lru_cache(maxsize=4096)
 def normalize_rel_path(path: str) -> str:
-    norm = path.replace("\\", "/")
+    # Caminho ja POSIX e o caso comum: o teste de pertinencia evita a copia do replace.
+    norm = path.replace("\\", "/") if "\\" in path else path
     while norm.startswith("./"):
         norm = norm[2:]
     return norm
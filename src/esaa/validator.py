@@ -1,16 +1,27 @@
 from __future__ import annotations
 
 import fnmatch
+import os
+import re
+from collections.abc import Callable, Sequence
 from pathlib import PurePosixPath
 from typing import Any
 
-from jsonschema import ValidationError, validate
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 
 from .errors import ESAAError
 from .external_effects import task_accepts_external_path
 from .state_machine import REJECT_PRIOR_MISMATCH, allowed_actions_for
 from .utils import normalize_rel_path
 
+# Backend opcional (extra `esaa-core[fast]`): codigo Python gerado a partir do schema.
+try:  # pragma: no cover - depende do ambiente
+    import fastjsonschema
+except ImportError:  # pragma: no cover - depende do ambiente
+    fastjsonschema = None  # type: ignore[assignment]
+
 
 # RF08: mensagem curta - caminho + razao, sem stack/instance dump.
 def _short_validation_error(exc: ValidationError) -> str:
@@ -19,6 +30,91 @@ def _short_validation_error(exc: ValidationError) -> str:
     return f"{path}: {msg[:140]}"
 
 
+# Keywords 2019-09/2020-12 que o fastjsonschema (drafts 4/6/7) ignoraria em silencio.
+_FAST_UNSUPPORTED_KEYWORDS = frozenset(
+    {
+        "$anchor",
+        "$dynamicAnchor",
+        "$dynamicRef",
+        "$recursiveAnchor",
+        "$recursiveRef",
+        "dependentRequired",
+        "dependentSchemas",
+        "maxContains",
+        "minContains",
+        "prefixItems",
+        "unevaluatedItems",
+        "unevaluatedProperties",
+    }
+)
+
+# Validadores compilados por schema. load_agent_result_schema devolve o mesmo dict
+# enquanto o arquivo nao muda; a entrada guarda o dict para que o id nao seja reutilizado.
+_SCHEMA_VALIDATORS: dict[int, tuple[dict[str, Any], Any, Callable[[Any], Any] | None]] = {}
+_SCHEMA_VALIDATORS_MAX = 8
+
+
+def _uses_keywords(value: Any, keywords: frozenset[str]) -> bool:
+    if isinstance(value, dict):
+        return not keywords.isdisjoint(value) or any(
+            _uses_keywords(item, keywords) for item in value.values()
+        )
+    if isinstance(value, list):
+        return any(_uses_keywords(item, keywords) for item in value)
+    return False
+
+
+def _compile_fast(schema: dict[str, Any]) -> Callable[[Any], Any] | None:
+    if fastjsonschema is None or _uses_keywords(schema, _FAST_UNSUPPORTED_KEYWORDS):
+        return None
+    try:
+        # use_default=False: o validador rapido nunca pode mutar o output do agente.
+        return fastjsonschema.compile(schema, use_default=False)
+    except fastjsonschema.JsonSchemaDefinitionException:
+        return None
+
+
+def _schema_validators(schema: dict[str, Any]) -> tuple[Any, Callable[[Any], Any] | None]:
+    entry = _SCHEMA_VALIDATORS.get(id(schema))
+    if entry is not None and entry[0] is schema:
+        return entry[1], entry[2]
+    cls = validator_for(schema)
+    cls.check_schema(schema)
+    validator = cls(schema)
+    fast = _compile_fast(schema)
+    if len(_SCHEMA_VALIDATORS) >= _SCHEMA_VALIDATORS_MAX:
+        _SCHEMA_VALIDATORS.pop(next(iter(_SCHEMA_VALIDATORS)))
+    _SCHEMA_VALIDATORS[id(schema)] = (schema, validator, fast)
+    return validator, fast
+
+
+def _fast_accepts(fast: Callable[[Any], Any], output: Any) -> bool:
+    try:
+        fast(output)
+    except fastjsonschema.JsonSchemaValueException:
+        return False
+    return True
+
+
+_ALLOWED_ROOT_KEYS = frozenset({"activity_event", "file_updates"})
+
+# Vocabulario/forbidden_fields do contrato como frozensets, por objeto de contrato
+# (load_agent_contract devolve o mesmo dict enquanto o arquivo nao muda).
+_CONTRACT_SETS: dict[int, tuple[dict[str, Any], frozenset[str], frozenset[str]]] = {}
+
+
+def _contract_sets(contract: dict[str, Any]) -> tuple[frozenset[str], frozenset[str]]:
+    entry = _CONTRACT_SETS.get(id(contract))
+    if entry is not None and entry[0] is contract:
+        return entry[1], entry[2]
+    allowed_actions = frozenset(contract["vocabulary"]["allowed_agent_actions"])
+    forbidden = frozenset(contract["output_contract"]["activity_event"]["forbidden_fields"])
+    if len(_CONTRACT_SETS) >= _SCHEMA_VALIDATORS_MAX:
+        _CONTRACT_SETS.pop(next(iter(_CONTRACT_SETS)))
+    _CONTRACT_SETS[id(contract)] = (contract, allowed_actions, forbidden)
+    return allowed_actions, forbidden
+
+
 # R8: minimo de verification.checks por task_kind (alinhado a AGENT_CONTRACT.verification_gate).
 MIN_CHECKS_BY_KIND = {"spec": 1, "impl": 1, "qa": 1, "hotfix": 2}
 DEFAULT_RESOURCE_LIMITS = {
@@ -139,41 +235,128 @@ def validate_unique_file_update_paths(file_updates: list[dict[str, Any]]) -> Non
         seen.add(path)
 
 
+# Cada lista de boundary (contrato/grant) vira uma unica alternancia compilada; FIFO limitado.
+_PATTERN_CACHE: dict[tuple[str, ...], re.Pattern[str] | None] = {}
+_PATTERN_CACHE_MAX = 500
+
+
+def _fused_pattern(patterns: list[str]) -> re.Pattern[str] | None:
+    key = tuple(patterns)
+    try:
+        return _PATTERN_CACHE[key]
+    except KeyError:
+        pass
+    # Mesma semantica de fnmatch.fnmatch: normcase no padrao e no caminho. Lista vazia
+    # nao casa nada (uma alternancia vazia casaria tudo).
+    fused = None
+    if key:
+        globs = (os.path.normcase(pattern.replace("\\", "/")) for pattern in key)
+        fused = re.compile("|".join(f"(?:{fnmatch.translate(glob)})" for glob in globs))
+    if len(_PATTERN_CACHE) >= _PATTERN_CACHE_MAX:
+        _PATTERN_CACHE.pop(next(iter(_PATTERN_CACHE)))
+    _PATTERN_CACHE[key] = fused
+    return fused
+
+
+# Boundaries resolvidos por (contrato, task_kind): allowlist/denylist ja fundidos em regex.
+_BOUNDARY_PACKS: dict[
+    tuple[int, str], tuple[dict[str, Any], tuple[re.Pattern[str] | None, re.Pattern[str] | None, bool]]
+] = {}
+_BOUNDARY_PACKS_MAX = 64
+
+
+def _boundary_pack(
+    contract: dict[str, Any], task_kind: str
+) -> tuple[re.Pattern[str] | None, re.Pattern[str] | None, bool]:
+    key = (id(contract), task_kind)
+    entry = _BOUNDARY_PACKS.get(key)
+    if entry is not None and entry[0] is contract:
+        return entry[1]
+    boundaries = contract["boundaries"]["by_task_kind"][task_kind]
+    pack = (
+        _fused_pattern(boundaries["write"]),
+        _fused_pattern(boundaries.get("forbidden_write", [])),
+        contract["boundaries"]["patch_scope"]["enabled"],
+    )
+    if len(_BOUNDARY_PACKS) >= _BOUNDARY_PACKS_MAX:
+        _BOUNDARY_PACKS.pop(next(iter(_BOUNDARY_PACKS)))
+    _BOUNDARY_PACKS[key] = (contract, pack)
+    return pack
+
+
 def _matches_any(path: str, patterns: list[str]) -> bool:
-    return any(fnmatch.fnmatch(path, pattern.replace("\\", "/")) for pattern in patterns)
+    fused = _fused_pattern(patterns)
+    return fused is not None and fused.match(os.path.normcase(path)) is not None
 
 
 def _validate_safe_path(path: str) -> str:
     if path.startswith("runtime://"):
         return path
     norm = normalize_rel_path(path)
-    if not norm or norm.startswith("/") or norm.startswith(".."):
+    if not norm or norm.startswith(("/", "..")):
         raise ESAAError("BOUNDARY_VIOLATION", f"invalid path: {path}")
-    parts = PurePosixPath(norm).parts
-    if any(part == ".." for part in parts):
+    # Segmento ".." interno ou final, sem montar PurePosixPath (o inicial ja caiu acima).
+    if "/../" in norm + "/":
         raise ESAAError("BOUNDARY_VIOLATION", f"path traversal forbidden: {path}")
     return norm
 
 
+def _validate_complete(event: dict[str, Any], task: dict[str, Any]) -> None:
+    # R8: min de verification.checks por task_kind (hotfix=2).
+    kind_key = "hotfix" if task.get("is_hotfix") else task["task_kind"]
+    min_checks = MIN_CHECKS_BY_KIND.get(kind_key, 1)
+    verification = event.get("verification", {})
+    checks = verification.get("checks", [])
+    if len(checks) < min_checks:
+        raise ESAAError(
+            "MISSING_VERIFICATION",
+            f"complete requires >= {min_checks} verification checks for kind={kind_key}",
+        )
+    if task.get("is_hotfix"):
+        if not event.get("issue_id") or not event.get("fixes"):
+            raise ESAAError("MISSING_VERIFICATION", "hotfix complete requires issue_id and fixes")
+
+
+def _validate_review(event: dict[str, Any], task: dict[str, Any]) -> None:
+    decision = event.get("decision")
+    if decision not in {"approve", "request_changes"}:
+        raise ESAAError("SCHEMA_INVALID", f"invalid review decision: {decision}")
+
+
+# Gates especificos por action; as demais (claim, issue.report, ...) nao tem gate proprio.
+_ACTION_VALIDATORS: dict[str, Callable[[dict[str, Any], dict[str, Any]], None]] = {
+    "complete": _validate_complete,
+    "review": _validate_review,
+}
+
+
 def validate_agent_output(
     output: dict[str, Any],
     schema: dict[str, Any],
     contract: dict[str, Any],
     task: dict[str, Any],
-) -> tuple[dict[str, Any], list[dict[str, str]]]:
-    try:
-        validate(output, schema)
-    except ValidationError as exc:
-        raise ESAAError("SCHEMA_INVALID", _short_validation_error(exc)) from exc
-
-    allowed_root = {"activity_event", "file_updates"}
-    unknown_root = set(output.keys()) - allowed_root
-    if unknown_root:
-        raise ESAAError("SCHEMA_INVALID", f"unknown root keys: {sorted(unknown_root)}")
+) -> tuple[dict[str, Any], Sequence[dict[str, str]]]:
+    # Discriminadores O(1) antes do schema - so os que o schema rejeitaria com o mesmo
+    # codigo (SCHEMA_INVALID); checks com codigo proprio seguem depois dele.
+    if isinstance(output, dict):
+        unknown_root = output.keys() - _ALLOWED_ROOT_KEYS
+        if unknown_root:
+            raise ESAAError("SCHEMA_INVALID", f"unknown root keys: {sorted(unknown_root)}")
+        if not isinstance(output.get("activity_event"), dict):
+            raise ESAAError("SCHEMA_INVALID", "activity_event: must be an object")
+
+    # O backend rapido so decide o aceite; rejeicoes passam pelo jsonschema, que da o
+    # mesmo erro de jsonschema.validate (best_match) e a palavra final.
+    validator, fast = _schema_validators(schema)
+    if fast is None or not _fast_accepts(fast, output):
+        error = best_match(validator.iter_errors(output))
+        if error is not None:
+            raise ESAAError("SCHEMA_INVALID", _short_validation_error(error))
 
     event = output["activity_event"]
     action = event["action"]
-    if action not in contract["vocabulary"]["allowed_agent_actions"]:
+    allowed_actions, forbidden = _contract_sets(contract)
+    if action not in allowed_actions:
         raise ESAAError("UNKNOWN_ACTION", f"unknown action: {action}")
 
     # RF07: prior_status declarado deve bater com o status real do roadmap.
@@ -189,49 +372,32 @@ def validate_agent_output(
     if event["task_id"] != task["task_id"]:
         raise ESAAError("SCHEMA_INVALID", "task_id mismatch")
 
-    forbidden = set(contract["output_contract"]["activity_event"]["forbidden_fields"])
-    found_forbidden = sorted([field for field in event.keys() if field in forbidden])
+    found_forbidden = sorted(event.keys() & forbidden)
     if found_forbidden:
         raise ESAAError("SCHEMA_INVALID", f"forbidden fields: {found_forbidden}")
 
-    if action == "complete":
-        # R8: min de verification.checks por task_kind (hotfix=2).
-        kind_key = "hotfix" if task.get("is_hotfix") else task["task_kind"]
-        min_checks = MIN_CHECKS_BY_KIND.get(kind_key, 1)
-        verification = event.get("verification", {})
-        checks = verification.get("checks", [])
-        if len(checks) < min_checks:
-            raise ESAAError(
-                "MISSING_VERIFICATION",
-                f"complete requires >= {min_checks} verification checks for kind={kind_key}",
-            )
-        if task.get("is_hotfix"):
-            if not event.get("issue_id") or not event.get("fixes"):
-                raise ESAAError("MISSING_VERIFICATION", "hotfix complete requires issue_id and fixes")
+    handler = _ACTION_VALIDATORS.get(action)
+    if handler is not None:
+        handler(event, task)
 
-    if action == "review":
-        decision = event.get("decision")
-        if decision not in {"approve", "request_changes"}:
-            raise ESAAError("SCHEMA_INVALID", f"invalid review decision: {decision}")
-
-    updates = list(output.get("file_updates", []))
+    # Sem copia: a sequencia do payload e devolvida como esta (chamadores que mutam copiam).
+    updates = output.get("file_updates") or ()
     _validate_boundaries(updates, contract, task)
     return event, updates
 
 
 def _validate_boundaries(
-    updates: list[dict[str, str]], contract: dict[str, Any], task: dict[str, Any]
+    updates: Sequence[dict[str, str]], contract: dict[str, Any], task: dict[str, Any]
 ) -> None:
-    boundaries = contract["boundaries"]["by_task_kind"][task["task_kind"]]
-    allowlist = boundaries["write"]
-    denylist = boundaries.get("forbidden_write", [])
-
-    scope_patch_enabled = contract["boundaries"]["patch_scope"]["enabled"]
+    allow_rx, deny_rx, scope_patch_enabled = _boundary_pack(contract, task["task_kind"])
     scope_patch = task.get("scope_patch", [])
     # T-2070: grant por tarefa concedido pelo operador via task.create.
     # Alternativa a allowlist do kind; nao se aplica a runtime:// e nunca
     # sobrepoe forbidden_write nem o safe-path.
     boundary_grant = [str(pattern) for pattern in task.get("boundary_grant", [])]
+    # Prefixos normalizados uma vez por chamada; str.startswith(tuple) testa todos em C.
+    check_scope = scope_patch_enabled and task.get("is_hotfix")
+    norm_scope = tuple(normalize_rel_path(prefix) for prefix in scope_patch) if check_scope else ()
 
     for item in updates:
         path = _validate_safe_path(item["path"])
@@ -243,15 +409,16 @@ def _validate_boundaries(
             and any(path.startswith(str(prefix)) for prefix in scope_patch)
         ):
             continue
-        if not _matches_any(path, allowlist) and not (
+        case_path = os.path.normcase(path)
+        if not (allow_rx is not None and allow_rx.match(case_path)) and not (
             boundary_grant and not path.startswith("runtime://") and _matches_any(path, boundary_grant)
         ):
             raise ESAAError("BOUNDARY_VIOLATION", f"path not allowed for {task['task_kind']}: {path}")
-        if denylist and _matches_any(path, denylist):
+        if deny_rx is not None and deny_rx.match(case_path):
             raise ESAAError("BOUNDARY_VIOLATION", f"path explicitly forbidden: {path}")
 
-        if scope_patch_enabled and task.get("is_hotfix"):
+        if check_scope:
             if not scope_patch:
                 raise ESAAError("BOUNDARY_VIOLATION", "hotfix task missing scope_patch")
-            if not any(path.startswith(normalize_rel_path(prefix)) for prefix in scope_patch):
+            if not path.startswith(norm_scope):
                 raise ESAAError("BOUNDARY_VIOLATION", f"path outside scope_patch: {path}")
@@ -0,0 +1,24 @@
+"""Leitura de YAML pelo parser C (libyaml) quando o PyYAML foi compilado com ele.
+
+Sem libyaml o PyYAML so oferece o SafeLoader puro-Python, bem mais lento;
+``HAS_LIBYAML`` permite diagnosticar o ambiente. A semantica de carga e a de
+``yaml.safe_load`` nos dois casos.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - depende do ambiente
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
+HAS_LIBYAML = _SafeLoader.__name__ == "CSafeLoader"
+
+
+def safe_load(data: bytes | str) -> Any:
+    """Equivalente a ``yaml.safe_load``; bytes UTF-8 vao ao parser sem decode previo."""
+    return yaml.load(data, Loader=_SafeLoader)
@@ -1,21 +1,29 @@
 from __future__ import annotations
 
-import shutil
 from pathlib import Path
 
 import pytest
 
+_BUNDLE_FILES = ("AGENT_CONTRACT.yaml", "agent_result.schema.json", "roadmap.schema.json")
+
 
 @pytest.fixture
 def repo_root() -> Path:
     return Path(__file__).resolve().parents[1]
 
 
+@pytest.fixture(scope="session")
+def _bundle_sources() -> dict[str, bytes]:
+    # Lidos uma vez por sessao. Sem hardlink: testes sobrescrevem arquivos do bundle
+    # in place (ex.: roadmap.schema.json), o que alteraria o .roadmap do repositorio.
+    source = Path(__file__).resolve().parents[1] / ".roadmap"
+    return {name: (source / name).read_bytes() for name in _BUNDLE_FILES}
+
+
 @pytest.fixture
-def contract_bundle(tmp_path: Path, repo_root: Path) -> Path:
-    source = repo_root / ".roadmap"
+def contract_bundle(tmp_path: Path, _bundle_sources: dict[str, bytes]) -> Path:
     target = tmp_path / ".roadmap"
     target.mkdir(parents=True, exist_ok=True)
-    for name in ("AGENT_CONTRACT.yaml", "agent_result.schema.json", "roadmap.schema.json"):
-        shutil.copy2(source / name, target / name)
+    for name, data in _bundle_sources.items():
+        (target / name).write_bytes(data)
     return tmp_path
@@ -8,6 +8,7 @@ from typing import Any
 import pytest
 
 from esaa.errors import ESAAError
+from esaa.projector import materialize
 from esaa.service import ESAAService
 from esaa.store import parse_event_store
 
@@ -37,6 +38,32 @@ def test_submit_claim_accepted(contract_bundle: Path) -> None:
     assert result["verify_status"] == "ok"
 
 
+def test_resubmitting_identical_claim_is_revalidated(contract_bundle: Path) -> None:
+    """Identical outputs are never served from a memo: the second claim sees in_progress."""
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    agent_output = {"activity_event": {"action": "claim", "task_id": "T-1000", "prior_status": "todo"}}
+    assert service.submit(agent_output, actor="agent-spec")["status"] == "accepted"
+    with pytest.raises(ESAAError):
+        service.submit(json.loads(json.dumps(agent_output)), actor="agent-spec")
+
+
+
+def test_init_and_submit_batches_share_one_timestamp(contract_bundle: Path) -> None:
+    """Events written together (init, one submit) carry a single ts."""
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    init_events = parse_event_store(contract_bundle)
+    assert len({event["ts"] for event in init_events}) == 1
+
+    service.submit(
+        {"activity_event": {"action": "claim", "task_id": "T-1000", "prior_status": "todo"}},
+        actor="agent-spec",
+    )
+    submitted = parse_event_store(contract_bundle)[len(init_events) :]
+    assert [event["action"] for event in submitted] == ["claim", "verify.start", "verify.ok"]
+    assert len({event["ts"] for event in submitted}) == 1
+
 def test_submit_complete_with_files(contract_bundle: Path) -> None:
     """An agent can complete a task and write files via submit."""
     service = ESAAService(contract_bundle)
@@ -238,6 +265,10 @@ def test_process_empty_inbox(contract_bundle: Path) -> None:
     assert result["processed"] == 0
     assert result["accepted"] == 0
 
+    # Diretorios com sufixo .json nao sao submissoes.
+    (contract_bundle / ".roadmap" / "inbox" / "archive.json").mkdir(parents=True)
+    assert service.process()["processed"] == 0
+
 
 def test_process_dry_run(contract_bundle: Path) -> None:
     """Process dry run validates but does not move files."""
@@ -258,3 +289,82 @@ def test_process_dry_run(contract_bundle: Path) -> None:
     events_after = parse_event_store(contract_bundle)
     assert len(events_after) == len(events_before)
     assert (inbox / "agent-spec__T-1000.json").exists()
+    assert not (inbox / "done").exists() and not (inbox / "rejected").exists()
+
+
+def test_process_dry_run_predicts_real_run_across_flush(contract_bundle: Path) -> None:
+    """A path overlap flushes the batch; dry run must not count pending events twice."""
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    first_claim = {"activity_event": {"action": "claim", "task_id": "T-1000", "prior_status": "todo"}}
+    service.submit(first_claim, actor="agent-spec")
+
+    inbox = contract_bundle / ".roadmap" / "inbox"
+    inbox.mkdir(parents=True, exist_ok=True)
+    complete = {
+        "activity_event": {
+            "action": "complete",
+            "task_id": "T-1000",
+            "prior_status": "in_progress",
+            "verification": {"checks": ["parity"]},
+        },
+        "file_updates": [{"path": "docs/spec/T-1000.md", "content": "# Spec\n"}],
+    }
+    claim = {"activity_event": {"action": "claim", "task_id": "T-1010", "prior_status": "todo"}}
+    (inbox / "agent-spec__01.json").write_text(json.dumps(complete), encoding="utf-8")
+    (inbox / "agent-spec__02.json").write_text(json.dumps(complete), encoding="utf-8")
+    (inbox / "agent-spec__03.json").write_text(json.dumps(claim), encoding="utf-8")
+
+    def outcomes(result: dict[str, Any]) -> list[tuple[str, str | None]]:
+        return [
+            ("rejected" if item["status"] == "rejected" else "accepted", item.get("error_code"))
+            for item in result["results"]
+        ]
+
+    predicted = service.process(dry_run=True)
+    actual = service.process()
+    assert outcomes(predicted) == outcomes(actual)
+    assert [status for status, _ in outcomes(actual)] == ["accepted", "rejected", "accepted"]
+
+
+def test_process_inbox_batches_sequential_submissions(contract_bundle: Path, monkeypatch) -> None:
+    """Claim + complete in the same sweep are validated in order and appended once."""
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+
+    inbox = contract_bundle / ".roadmap" / "inbox"
+    inbox.mkdir(parents=True, exist_ok=True)
+    claim = {"activity_event": {"action": "claim", "task_id": "T-1000", "prior_status": "todo"}}
+    complete = {
+        "activity_event": {
+            "action": "complete",
+            "task_id": "T-1000",
+            "prior_status": "in_progress",
+            "verification": {"checks": ["batched"]},
+        }
+    }
+    unknown = {"activity_event": {"action": "claim", "task_id": "T-9999", "prior_status": "todo"}}
+    (inbox / "agent-spec__01.json").write_text(json.dumps(claim), encoding="utf-8")
+    (inbox / "agent-spec__02.json").write_text(json.dumps(unknown), encoding="utf-8")
+    (inbox / "agent-spec__03.json").write_text(json.dumps(complete), encoding="utf-8")
+    (inbox / "agent-spec__04.json").write_text("{not json", encoding="utf-8")
+
+    appends: list[int] = []
+    original = service._append_events_transactionally
+
+    def counting_append(base_events, new_events, base_projection_hash=None):
+        appends.append(len(new_events))
+        # O hash repassado pelo lote e o mesmo que a reprojecao da base produziria.
+        assert base_projection_hash == materialize(base_events)[0]["meta"]["run"]["projection_hash_sha256"]
+        return original(base_events, new_events, base_projection_hash)
+
+    monkeypatch.setattr(service, "_append_events_transactionally", counting_append)
+
+    result = service.process()
+    assert (result["processed"], result["accepted"], result["rejected"]) == (4, 2, 2)
+    assert [item["status"] for item in result["results"]] == ["accepted", "rejected", "accepted", "rejected"]
+    assert result["results"][1]["error_code"] == "TASK_NOT_FOUND"
+    assert len(appends) == 1
+    assert sorted(p.name for p in (inbox / "done").iterdir()) == ["agent-spec__01.json", "agent-spec__03.json"]
+    assert service.task_state("T-1000")["task"]["status"] == "review"
+    assert service.verify()["verify_status"] == "ok"
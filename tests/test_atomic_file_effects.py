@@ -46,6 +46,19 @@ def test_commit_staged_writes_final(tmp_path: Path) -> None:
     assert final.read_text(encoding="utf-8") == "# Y\n"
 
 
+def test_commit_staged_keeps_bytes_and_shares_parent_dirs(tmp_path: Path) -> None:
+    (tmp_path / ".roadmap").mkdir()
+    staged = stage_file_updates(tmp_path, [
+        {"path": "docs/qa/a.md", "content": "linha\r\nacentuação\n"},
+        {"path": "docs/qa/b.md", "content": "b"},
+        {"path": "docs/qa/sub/c.md", "content": "c"},
+    ])
+    commit_staged(tmp_path, staged)
+    assert (tmp_path / "docs/qa/a.md").read_bytes() == "linha\r\nacentuação\n".encode()
+    assert (tmp_path / "docs/qa/b.md").read_bytes() == b"b"
+    assert (tmp_path / "docs/qa/sub/c.md").read_bytes() == b"c"
+
+
 def test_discard_staged_cleans_up(tmp_path: Path) -> None:
     (tmp_path / ".roadmap").mkdir()
     staged = stage_file_updates(tmp_path, [{"path": "x.md", "content": "x"}])
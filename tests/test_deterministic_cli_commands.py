@@ -283,3 +283,17 @@ def test_cli_activity_clear_requires_force_and_reprojects_empty_state(contract_b
     backup = contract_bundle / cleared["backup_path"]
     assert backup.exists()
     assert backup.read_text(encoding="utf-8").strip()
+
+
+def test_cli_json_args_are_parsed_from_raw_bytes(tmp_path: Path, monkeypatch) -> None:
+    from esaa.cli import _read_json_arg
+
+    payload = [{"path": "docs/nota.md", "content": "ação\n"}]
+    raw = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+    source = tmp_path / "updates.json"
+    source.write_bytes(raw)
+    assert _read_json_arg(str(source)) == payload
+
+    stdin = io.TextIOWrapper(io.BytesIO(raw), encoding="utf-8")
+    monkeypatch.setattr("sys.stdin", stdin)
+    assert _read_json_arg("-") == payload
@@ -138,3 +138,69 @@ def test_review_role_is_top_level_and_hash_protected(contract_bundle: Path) -> N
     with pytest.raises(CorruptedStoreError) as excinfo:
         parse_event_store(contract_bundle)
     assert excinfo.value.code == "CHAIN_BROKEN"
+
+
+def test_streamed_store_matches_parse_and_defers_chain_break(contract_bundle: Path) -> None:
+    from esaa.store import iter_event_store
+
+    ESAAService(contract_bundle).init(force=True)
+    init_hash_chain(contract_bundle)
+    _append_orchestrator_event(contract_bundle)
+    assert list(iter_event_store(contract_bundle)) == parse_event_store(contract_bundle)
+
+    lines = _activity_lines(contract_bundle)
+    last = json.loads(lines[-1])
+    last["payload"]["runner_id"] = "tampered"
+    lines[-1] = json.dumps(last, ensure_ascii=False, separators=(",", ":"))
+    _write_activity_lines(contract_bundle, lines)
+
+    stream = iter_event_store(contract_bundle)
+    consumed = []
+    with pytest.raises(CorruptedStoreError) as excinfo:
+        for event in stream:
+            consumed.append(event)
+    assert excinfo.value.code == "CHAIN_BROKEN"
+    assert len(consumed) == len(lines)
+
+
+def _runner_metrics_payload(**overrides: object) -> dict:
+    return {
+        "task_id": "T-1000",
+        "actor": "agent-external",
+        "runner_id": "qa-chain",
+        "runner_kind": "codex",
+        "command_surface": "python -m esaa",
+        "status": "success",
+        **overrides,
+    }
+
+
+def test_non_finite_floats_keep_appended_line_matching_event_hash(contract_bundle: Path) -> None:
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    _run_cli(contract_bundle, "chain", "init")
+
+    result = service.record_runner_metrics(_runner_metrics_payload(cost_estimate=float("nan")))
+
+    assert result["action"] == "runner.metrics"
+    metrics_line = next(line for line in _activity_lines(contract_bundle) if '"runner.metrics"' in line)
+    assert '"cost_estimate":NaN' in metrics_line
+    assert verify_hash_chain(contract_bundle)["chain_status"] == "ok"
+    assert service.verify()["verify_status"] == "ok"
+
+
+def test_wide_integers_round_trip_exactly_through_anchored_store(contract_bundle: Path) -> None:
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    _run_cli(contract_bundle, "chain", "init")
+    wide = 1180591620717411303425
+
+    service.record_runner_metrics(_runner_metrics_payload(input_tokens=wide, output_tokens=1))
+
+    metrics = next(
+        event for event in parse_event_store(contract_bundle) if event["action"] == "runner.metrics"
+    )
+    assert metrics["payload"]["input_tokens"] == wide
+    assert isinstance(metrics["payload"]["input_tokens"], int)
+    assert verify_hash_chain(contract_bundle)["chain_status"] == "ok"
+    assert service.verify()["verify_status"] == "ok"
@@ -116,3 +116,33 @@ def test_validate_missing_fixes(contract_bundle: Path) -> None:
     ok, code, _ = validate_hotfix_request(events, {"issue_id": "ISS-1"})
     assert ok is False
     assert code == "HOTFIX_TARGET_NOT_FOUND"
+
+
+def test_build_hotfix_event_accepts_projection_and_skips_duplicates(contract_bundle: Path) -> None:
+    from esaa.projector import ProjectionState
+    from esaa.service import build_hotfix_event
+
+    svc = ESAAService(contract_bundle)
+    svc.init(force=True)
+    _drive_to_done(svc, "T-1000")
+    svc.report_issue(
+        "T-1000",
+        actor="agent-qa",
+        issue_id="ISS-DUP",
+        severity="high",
+        title="Duplicate hotfix issue",
+        symptom="post-done defect",
+        repro_steps=["inspect T-1000"],
+    )
+    events = parse_event_store(contract_bundle)
+    request = {"issue_id": "ISS-DUP", "fixes": "T-1000", "scope_patch": ["src/hotfix/"]}
+    projection = ProjectionState(events)
+    from_projection = build_hotfix_event(projection, request)
+    from_events = build_hotfix_event(events, request)
+    assert from_projection is not None and from_events is not None
+    assert from_projection["event_seq"] == from_events["event_seq"] == projection.next_seq
+    assert from_projection["payload"] == from_events["payload"]
+
+    projection.apply(from_projection)
+    assert projection.has_hotfix_task("HF-ISS-DUP")
+    assert build_hotfix_event(projection, request) is None
@@ -40,3 +40,37 @@ def test_mock_adapter_skips_runtime_uri_for_qa_tasks() -> None:
     )
 
     assert result["file_updates"][0]["path"] == "docs/qa/sso-client-default-T-006.md"
+
+
+def test_mock_adapter_dispatches_by_status_with_fresh_payloads() -> None:
+    adapter = MockAgentAdapter()
+    task = {"task_id": "T-1", "task_kind": "spec", "outputs": {"files": ["docs/spec/T-1.md"]}}
+
+    actions = {
+        status: adapter.execute({"task": {**task, "status": status}})["activity_event"]
+        for status in ("todo", "in_progress", "review", "done")
+    }
+    assert {status: event["action"] for status, event in actions.items()} == {
+        "todo": "claim",
+        "in_progress": "complete",
+        "review": "review",
+        "done": "issue.report",
+    }
+    assert actions["done"]["prior_status"] == "in_progress"
+
+    first = adapter.execute({"task": {**task, "status": "review"}})
+    first["activity_event"]["tasks"].append("T-2")
+    assert adapter.execute({"task": {**task, "status": "review"}})["activity_event"]["tasks"] == ["T-1"]
+
+
+def test_mock_adapter_file_content_is_deterministic_fixture() -> None:
+    result = MockAgentAdapter().execute(
+        {"task": {"task_id": "T-7", "task_kind": "spec", "status": "in_progress", "outputs": {"files": []}}}
+    )
+
+    assert result["file_updates"] == [
+        {
+            "path": "docs/spec/T-7.md",
+            "content": "# T-7\n\n- kind: spec\n- generated_by: mock_adapter\n- note: deterministic fixture output\n",
+        }
+    ]
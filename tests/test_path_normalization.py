@@ -22,6 +22,7 @@ def _sha(text: str) -> str:
         ("./docs/a.md", "docs/a.md"),
         ("./././x", "x"),
         ("a\\b.md", "a/b.md"),
+        (".\\docs\\a.md", "docs/a.md"),
         (".roadmap/lessons.json", ".roadmap/lessons.json"),
         ("docs/.draft.md", "docs/.draft.md"),
         ("/abs/x", "/abs/x"),
@@ -134,3 +135,37 @@ def test_dot_slash_prefix_update_lands_on_normalized_path(contract_bundle: Path)
     )
 
     assert (contract_bundle / "docs/spec/T-1000.md").read_text(encoding="utf-8") == "ok\n"
+
+
+@pytest.mark.parametrize(
+    ("raw", "reason"),
+    [
+        ("docs/../x", "traversal"),
+        ("docs\\..\\x", "traversal"),
+        ("docs//..//x", "traversal"),
+        ("docs/spec/..", "traversal"),
+        ("./../x", "invalid path"),
+        ("/etc/passwd", "invalid path"),
+        ("..hidden", "invalid path"),
+    ],
+)
+def test_safe_path_rejects_dotdot_segments(raw: str, reason: str) -> None:
+    from esaa.validator import _validate_safe_path
+
+    with pytest.raises(ESAAError) as exc:
+        _validate_safe_path(raw)
+    assert exc.value.code == "BOUNDARY_VIOLATION"
+    assert reason in str(exc.value)
+
+
+def test_safe_path_keeps_names_containing_dots() -> None:
+    from esaa.validator import _validate_safe_path
+
+    assert _validate_safe_path("docs/a..b/c...md") == "docs/a..b/c...md"
+    assert _validate_safe_path("./docs/x..") == "docs/x.."
+
+
+def test_normalize_rel_path_is_memoized() -> None:
+    before = normalize_rel_path.cache_info().hits
+    assert normalize_rel_path(".\\memo\\a.md") == normalize_rel_path(".\\memo\\a.md") == "memo/a.md"
+    assert normalize_rel_path.cache_info().hits > before
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import json
+import sys
+
+import pytest
+
+from esaa.errors import ESAAError
+from esaa.projector import materialize
+from esaa.service import make_event
+
+
+def _task_payload(task_id: str, kind: str = "impl") -> dict:
+    return {
+        "task_id": task_id,
+        "task_kind": kind,
+        "title": f"Task {task_id}",
+        "description": f"Task {task_id} description",
+        "depends_on": [],
+        "targets": [],
+        "outputs": {"files": [f"src/{task_id}.txt"]},
+    }
+
+
+def _base_events() -> list[dict]:
+    return [
+        make_event(1, "orchestrator", "run.start", {"run_id": "RUN-1", "status": "initialized"}),
+        make_event(2, "orchestrator", "task.create", _task_payload("T-1")),
+        make_event(3, "orchestrator", "task.create", _task_payload("T-2", kind="spec")),
+    ]
+
+
+def test_claim_on_unknown_task_is_rejected() -> None:
+    events = _base_events() + [make_event(4, "agent-a", "claim", {"task_id": "T-404"})]
+    with pytest.raises(ESAAError) as exc:
+        materialize(events)
+    assert exc.value.code == "TASK_NOT_FOUND"
+
+
+def test_hotfix_create_for_existing_task_is_rejected() -> None:
+    payload = {**_task_payload("T-2"), "is_hotfix": True, "issue_id": "ISS-1", "fixes": "T-1"}
+    events = _base_events() + [make_event(4, "orchestrator", "hotfix.create", payload)]
+    with pytest.raises(ESAAError) as exc:
+        materialize(events)
+    assert exc.value.code == "DUPLICATE_TASK"
+
+
+def test_internal_task_index_is_not_projected() -> None:
+    events = _base_events() + [make_event(4, "agent-a", "claim", {"task_id": "T-2"})]
+    roadmap, _, _ = materialize(events)
+    assert set(roadmap) == {"meta", "project", "tasks", "indexes"}
+    assert [task["task_id"] for task in roadmap["tasks"]] == ["T-1", "T-2"]
+    assert roadmap["tasks"][1]["status"] == "in_progress"
+
+
+def test_incremental_indexes_match_task_recount() -> None:
+    events = _base_events() + [
+        make_event(4, "agent-a", "claim", {"task_id": "T-1"}),
+        make_event(5, "agent-a", "complete", {"task_id": "T-1", "verification": {"checks": ["ok"]}}),
+        make_event(6, "agent-a", "review", {"task_id": "T-1", "decision": "approve", "tasks": ["T-1"]}),
+        make_event(7, "agent-a", "claim", {"task_id": "T-2"}),
+    ]
+    roadmap, _, _ = materialize(events)
+    assert roadmap["indexes"] == {
+        "by_status": {"done": 1, "in_progress": 1},
+        "by_kind": {"impl": 1, "spec": 1},
+    }
+    assert list(roadmap["indexes"]["by_status"]) == sorted(roadmap["indexes"]["by_status"])
+
+
+def test_materialize_does_not_mutate_event_payloads() -> None:
+    lesson = {
+        "mistake": "m",
+        "rule": "r",
+        "scope": {"task_kinds": ["impl"]},
+        "enforcement": {"mode": "warn", "applies_to": "workflow_gate"},
+    }
+    events = _base_events() + [
+        make_event(4, "orchestrator", "orchestrator.view.mutate", {"lessons": []}),
+        make_event(
+            5,
+            "agent-a",
+            "issue.report",
+            {
+                "task_id": "T-1",
+                "issue_id": "ISS-1",
+                "category": "process",
+                "subtype": "lesson",
+                "lesson": lesson,
+            },
+        ),
+    ]
+    snapshot = json.dumps(events, sort_keys=True)
+    first = materialize(events)
+    second = materialize(events)
+    assert json.dumps(events, sort_keys=True) == snapshot
+    assert first[2]["lessons"] == second[2]["lessons"]
+    assert len(second[2]["lessons"]) == 1
+
+
+def test_task_create_defaults_and_hotfix_fields() -> None:
+    bare = {"task_id": "T-3", "task_kind": "impl", "title": "Bare"}
+    hotfix = {
+        **_task_payload("T-4"),
+        "is_hotfix": True,
+        "issue_id": "ISS-1",
+        "fixes": "T-1",
+        "scope_patch": ["src/T-1.txt"],
+    }
+    events = _base_events() + [
+        make_event(4, "orchestrator", "task.create", bare),
+        make_event(5, "orchestrator", "hotfix.create", hotfix),
+    ]
+    roadmap, _, _ = materialize(events)
+    created, fix = roadmap["tasks"][2], roadmap["tasks"][3]
+    assert created["depends_on"] == [] and created["targets"] == []
+    assert created["outputs"] == {"files": []}
+    assert "is_hotfix" not in created
+    assert fix["is_hotfix"] is True
+    assert (fix["issue_id"], fix["fixes"], fix["scope_patch"]) == ("ISS-1", "T-1", ["src/T-1.txt"])
+    assert "baseline_id" not in fix
+
+
+def test_review_with_unknown_decision_is_workflow_gate() -> None:
+    events = _base_events() + [
+        make_event(4, "agent-a", "claim", {"task_id": "T-1"}),
+        make_event(5, "agent-a", "complete", {"task_id": "T-1", "verification": {"checks": ["ok"]}}),
+        make_event(6, "agent-a", "review", {"task_id": "T-1", "decision": "maybe"}),
+    ]
+    with pytest.raises(ESAAError) as exc:
+        materialize(events)
+    assert exc.value.code == "WORKFLOW_GATE_VIOLATION"
+
+
+def test_cached_task_bytes_keep_projection_hash_canonical() -> None:
+    from esaa.projector import apply_events, compute_projection_hash, materialize_from, new_state
+
+    state = new_state()
+    apply_events(state, _base_events() + [make_event(4, "orchestrator", "task.create", _task_payload("T-1"))])
+    state["tasks"][0]["title"] = "Tarefa com acentuação"
+    roadmap, _, _ = materialize_from(state, [])
+    assert roadmap["meta"]["run"]["projection_hash_sha256"] == compute_projection_hash(roadmap)
+    assert set(state["_task_bytes"]) == {"T-1", "T-2"}
+
+    # Mesmo estado vivo: a task transicionada e re-serializada, as demais vem do cache.
+    roadmap, _, _ = materialize_from(state, [make_event(5, "agent-a", "claim", {"task_id": "T-1"})])
+    assert roadmap["tasks"][0]["status"] == "in_progress"
+    assert roadmap["meta"]["run"]["projection_hash_sha256"] == compute_projection_hash(roadmap)
+    assert materialize(_base_events())[0]["meta"]["run"]["projection_hash_sha256"] == compute_projection_hash(
+        materialize(_base_events())[0]
+    )
+
+
+def test_projection_state_applies_incrementally_like_materialize() -> None:
+    from esaa.projector import ProjectionState
+
+    tail = [
+        make_event(4, "agent-a", "claim", {"task_id": "T-1"}),
+        make_event(5, "agent-a", "complete", {"task_id": "T-1", "verification": {"checks": ["ok"]}}),
+        make_event(6, "orchestrator", "task.create", _task_payload("T-3", kind="qa")),
+    ]
+    projection = ProjectionState(_base_events())
+    assert projection.task_ids() == {"T-1", "T-2"}
+    first_hash = projection.snapshot()[0]["meta"]["run"]["projection_hash_sha256"]
+    for event in tail:
+        projection.apply(event)
+
+    roadmap, issues, lessons = projection.snapshot()
+    expected = materialize(_base_events() + tail)
+    assert (roadmap, issues, lessons) == expected
+    assert roadmap["meta"]["run"]["projection_hash_sha256"] != first_hash
+    assert projection.task_ids() == {"T-1", "T-2", "T-3"}
+
+
+def test_projection_state_task_lookup() -> None:
+    from esaa.projector import ProjectionState
+
+    projection = ProjectionState(_base_events())
+    assert projection.task("T-2")["task_kind"] == "spec"
+    assert projection.task("T-404") is None
+    assert projection.task(["T-1"]) is None
+
+
+def test_projection_state_next_seq_follows_applied_events() -> None:
+    from esaa.projector import ProjectionState
+    from esaa.store import next_event_seq
+
+    assert ProjectionState().next_seq == 1
+    projection = ProjectionState(_base_events())
+    assert projection.next_seq == next_event_seq(_base_events()) == 4
+    projection.apply(make_event(projection.next_seq, "agent-a", "claim", {"task_id": "T-1"}))
+    assert projection.next_seq == 5
+
+
+def test_streamed_projection_hash_matches_canonical_bytes() -> None:
+    from esaa.projector import compute_projection_hash
+    from esaa.utils import sha256_hex
+
+    for events in (_base_events()[:1], _base_events()):
+        roadmap, _, _ = materialize(events)
+        roadmap["project"]["name"] = "projeção"
+        payload = {key: roadmap[key] for key in ("project", "tasks", "indexes")}
+        payload["schema_version"] = roadmap["meta"]["schema_version"]
+        assert compute_projection_hash(roadmap) == sha256_hex(payload)
+
+
+def test_every_canonical_action_has_a_projector_handler() -> None:
+    from esaa.constants import CANONICAL_ACTIONS
+    from esaa.projector import _HANDLERS
+
+    assert CANONICAL_ACTIONS <= _HANDLERS.keys()
+    assert all(sys.intern(action) is action for action in _HANDLERS)
+
+
+def test_checkpoint_recount_uses_incremental_index_keys() -> None:
+    from esaa.projector import apply_events, dump_state, load_state, new_state
+
+    state = apply_events(new_state(), _base_events())
+    live = {name: dict(counts) for name, counts in state["indexes"].items()}
+    assert load_state(dump_state(state))["indexes"] == live
+
+    dumped = dump_state(state)
+    del dumped["tasks"][0]["task_kind"]
+    dumped["tasks"][1]["status"] = 7
+    assert load_state(dumped)["indexes"] == {
+        "by_status": {"todo": 1, "7": 1},
+        "by_kind": {"unknown": 1, "spec": 1},
+    }
+
+
+def test_review_with_non_string_decision_is_workflow_gate() -> None:
+    events = _base_events() + [
+        make_event(4, "agent-a", "claim", {"task_id": "T-1"}),
+        make_event(5, "agent-a", "complete", {"task_id": "T-1", "verification": {"checks": ["ok"]}}),
+        make_event(6, "agent-a", "review", {"task_id": "T-1", "decision": ["approve"]}),
+    ]
+    with pytest.raises(ESAAError) as exc:
+        materialize(events)
+    assert exc.value.code == "WORKFLOW_GATE_VIOLATION"
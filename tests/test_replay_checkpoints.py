@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import esaa.snapshot as snapshot
+from esaa.service import ESAAService
+
+
+def test_replay_resumes_from_checkpoint_with_same_hash(contract_bundle: Path, monkeypatch) -> None:
+    monkeypatch.setattr(snapshot, "CHECKPOINT_INTERVAL", 4)
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    service.run(steps=9)
+
+    full = service.replay(rebuild=True)
+    checkpoints = sorted((contract_bundle / ".roadmap/snapshots").glob("checkpoint-*.json"))
+    assert checkpoints
+
+    resumed = service.replay()
+    assert resumed["resumed_from_event_seq"] > 0
+    assert resumed["resumed_from_event_seq"] % 4 == 0
+    assert resumed["projection_hash_sha256"] == full["projection_hash_sha256"]
+    assert service.verify()["verify_status"] == "ok"
+
+
+def test_replay_until_ignores_later_checkpoints(contract_bundle: Path, monkeypatch) -> None:
+    monkeypatch.setattr(snapshot, "CHECKPOINT_INTERVAL", 4)
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    service.run(steps=3)
+    service.replay()
+
+    partial = service.replay(until="5", write_views=False)
+    reference = service.replay(until="5", write_views=False, rebuild=True)
+    assert partial["resumed_from_event_seq"] == 4
+    assert partial["projection_hash_sha256"] == reference["projection_hash_sha256"]
+
+
+def test_stale_checkpoint_is_ignored_after_reinit(contract_bundle: Path, monkeypatch) -> None:
+    monkeypatch.setattr(snapshot, "CHECKPOINT_INTERVAL", 4)
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    service.run(steps=3)
+    service.replay()
+
+    service.init(run_id="RUN-0002", force=True)
+    out = service.replay(write_views=False)
+    assert out["resumed_from_event_seq"] == 0
+
+
+def test_checkpoint_indexes_are_recounted_on_load(contract_bundle: Path, monkeypatch) -> None:
+    monkeypatch.setattr(snapshot, "CHECKPOINT_INTERVAL", 4)
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    service.run(steps=3)
+    full = service.replay(rebuild=True)
+
+    for path in (contract_bundle / ".roadmap/snapshots").glob("checkpoint-*.json"):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["state"]["indexes"] = {"by_status": {"bogus": 99}, "by_kind": {}}
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    resumed = service.replay(write_views=False)
+    assert resumed["resumed_from_event_seq"] > 0
+    assert resumed["projection_hash_sha256"] == full["projection_hash_sha256"]
+
+
+def test_project_writes_and_resumes_from_checkpoints(contract_bundle: Path, monkeypatch) -> None:
+    monkeypatch.setattr(snapshot, "CHECKPOINT_INTERVAL", 4)
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    service.run(steps=3)
+    full = service.replay(rebuild=True, write_views=False)
+    for path in (contract_bundle / ".roadmap/snapshots").glob("checkpoint-*.json"):
+        path.unlink()
+
+    first = service.project()
+    assert sorted((contract_bundle / ".roadmap/snapshots").glob("checkpoint-*.json"))
+    _, _, _, resumed_from = snapshot.project_store(contract_bundle, write_checkpoints=False)
+    assert resumed_from > 0 and resumed_from % 4 == 0
+    assert service.project()["projection_hash_sha256"] == first["projection_hash_sha256"]
+    assert first["projection_hash_sha256"] == full["projection_hash_sha256"]
+    assert service.verify()["verify_status"] == "ok"
+
+
+def test_edited_checkpoint_state_falls_back_to_full_replay(contract_bundle: Path, monkeypatch) -> None:
+    monkeypatch.setattr(snapshot, "CHECKPOINT_INTERVAL", 4)
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    service.run(steps=3)
+    full = service.replay(rebuild=True)
+
+    for path in (contract_bundle / ".roadmap/snapshots").glob("checkpoint-*.json"):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        data["state"]["tasks"][0]["title"] = "forged"
+        path.write_text(json.dumps(data), encoding="utf-8")
+
+    resumed = service.replay(write_views=False)
+    assert resumed["resumed_from_event_seq"] == 0
+    assert resumed["projection_hash_sha256"] == full["projection_hash_sha256"]
+
+
+def test_only_newest_checkpoints_are_kept(contract_bundle: Path, monkeypatch) -> None:
+    monkeypatch.setattr(snapshot, "CHECKPOINT_INTERVAL", 2)
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    service.run(steps=9)
+    service.replay(rebuild=True)
+
+    kept = sorted((contract_bundle / ".roadmap/snapshots").glob("checkpoint-*.json"))
+    assert len(kept) == snapshot.CHECKPOINT_KEEP
+    last_seq = service.verify()["last_event_seq"]
+    assert kept[-1].name == f"checkpoint-{last_seq - last_seq % 2:08d}.json"
+    assert service.replay(write_views=False)["resumed_from_event_seq"] == last_seq - last_seq % 2
@@ -13,6 +13,7 @@ SERVICE_MODULES = (
     "src/esaa/service.py",
     "src/esaa/service_core.py",
     "src/esaa/submission.py",
+    "src/esaa/inbox.py",
     "src/esaa/execution.py",
     "src/esaa/task_admin.py",
     "src/esaa/seeds.py",
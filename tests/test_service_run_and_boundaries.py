@@ -93,3 +93,93 @@ def test_output_rejected_has_no_side_effect_files(contract_bundle: Path) -> None
 
     events = parse_event_store(contract_bundle)
     assert any(event["action"] == "output.rejected" for event in events)
+
+
+class GateViolationAdapter(AgentAdapter):
+    """Sempre tenta complete em task todo: rejeicao penalizante a cada passo."""
+
+    agent_id = "agent-gate"
+
+    def health(self) -> dict[str, str]:
+        return {"status": "ok"}
+
+    def execute(self, dispatch_context: dict[str, Any]) -> dict[str, Any]:
+        task = dispatch_context["task"]
+        return {
+            "activity_event": {
+                "action": "complete",
+                "task_id": task["task_id"],
+                "prior_status": task["status"],
+                "verification": {"checks": ["ok"]},
+            }
+        }
+
+
+def test_run_escalates_after_max_attempts_with_contiguous_seqs(contract_bundle: Path) -> None:
+    (contract_bundle / ".roadmap/RUNTIME_POLICY.yaml").write_text(
+        "attempt_limits:\n  max_attempts_per_task: 2\n  cooldown_between_attempts: PT0S\n", encoding="utf-8"
+    )
+    service = ESAAService(contract_bundle, adapter=GateViolationAdapter())
+    service.init(force=True)
+    result = service.run(steps=3)
+    assert result["rejected"] == 3
+
+    events = parse_event_store(contract_bundle)
+    assert [event["event_seq"] for event in events] == list(range(1, len(events) + 1))
+    rejected = [event["payload"]["task_id"] for event in events if event["action"] == "output.rejected"]
+    # Duas rejeicoes bloqueiam T-1000; o terceiro passo ja escolhe outra task.
+    assert rejected[:2] == ["T-1000", "T-1000"] and rejected[2] != "T-1000"
+    escalations = [event for event in events if event["action"] == "issue.report"]
+    assert [event["payload"]["issue_id"] for event in escalations] == ["ISS-MAXATT-T-1000"]
+    assert service.verify()["verify_status"] == "ok"
+
+
+def test_compiled_boundary_patterns_match_fnmatch() -> None:
+    import fnmatch
+
+    from esaa.validator import _fused_pattern, _matches_any
+
+    patterns = ["docs/spec/**", "src\\*.py", "README.md", "docs/qa/T-[0-9]*.md"]
+    paths = ["docs/spec/a.md", "src/app.py", "src/pkg/app.py", "README.md", "docs/qa/T-1.md", "docs/qa/x.md"]
+    for path in paths:
+        expected = any(fnmatch.fnmatch(path, pattern.replace("\\", "/")) for pattern in patterns)
+        assert _matches_any(path, patterns) is expected
+    assert _matches_any("anything", []) is False
+    assert _fused_pattern(patterns) is _fused_pattern(list(patterns))
+
+
+def test_boundary_pack_is_resolved_once_per_contract_and_kind(contract_bundle: Path) -> None:
+    import copy
+
+    from esaa.validator import _boundary_pack
+
+    contract = load_agent_contract(contract_bundle)
+    allow_rx, deny_rx, _ = pack = _boundary_pack(contract, "spec")
+    assert _boundary_pack(contract, "spec") is pack
+    assert _boundary_pack(contract, "impl") is not pack
+    assert allow_rx is not None and allow_rx.match("docs/spec/T-1.md")
+
+    edited = copy.deepcopy(contract)
+    edited["boundaries"]["by_task_kind"]["spec"]["write"] = ["notes/**"]
+    assert _boundary_pack(edited, "spec")[0].match("docs/spec/T-1.md") is None
+    assert _boundary_pack(contract, "spec") is pack
+
+
+def test_run_keeps_one_projection_across_iterations(contract_bundle: Path, monkeypatch) -> None:
+    import esaa.execution as execution
+    from esaa.projector import materialize
+
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+
+    def no_rebuild(*_args: Any, **_kwargs: Any) -> Any:
+        raise AssertionError("run() should apply new events instead of re-materializing history")
+
+    monkeypatch.setattr(execution, "materialize", no_rebuild)
+    result = service.run(steps=9)
+    monkeypatch.undo()
+
+    assert result["steps_executed"] == 9
+    expected = materialize(parse_event_store(contract_bundle))[0]["meta"]["run"]["projection_hash_sha256"]
+    assert result["projection_hash_sha256"] == expected
+    assert service.verify()["verify_status"] == "ok"
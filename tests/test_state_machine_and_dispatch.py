@@ -20,6 +20,7 @@ from esaa.state_machine import (
     REJECT_IMMUTABLE_DONE,
     REJECT_LOCK,
     REJECT_MISSING_CLAIM,
+    TRANSITION_REJECTS,
     classify_transition,
     expected_action_for,
     next_status,
@@ -64,6 +65,12 @@ def test_classify_transition_reject_codes():
     assert classify_transition("in_progress", "issue.report") == (True, None)
 
 
+def test_transition_table_matches_classify_transition():
+    for (status, action), code in TRANSITION_REJECTS.items():
+        assert classify_transition(status, action) == (code is None, code)
+    assert len(TRANSITION_REJECTS) == 16
+
+
 # --- RF04: slice_schema -----------------------------------------------------
 
 def test_slice_schema_for_claim_omits_complete_and_file_updates():
@@ -151,3 +158,26 @@ def test_minimal_context_changes_with_state():
     assert "boundaries" in ctx_inprog
     assert ctx_inprog["boundaries"]["write"] == ["src/**", "tests/**"]
     assert "dep_interfaces" in ctx_inprog
+
+
+def test_select_next_task_priority_and_dependencies():
+    from esaa.seeds import select_next_task
+
+    def task(task_id, status, deps=()):
+        return {"task_id": task_id, "status": status, "depends_on": list(deps)}
+
+    tasks = [
+        task("T-3", "todo"),
+        task("T-2", "todo", ["T-1"]),
+        task("T-1", "in_progress"),
+        task("T-4", "todo", ["T-404"]),
+    ]
+    assert select_next_task(tasks)["task_id"] == "T-1"
+    tasks[2]["status"] = "done"
+    assert select_next_task(tasks)["task_id"] == "T-2"
+    tasks[1]["depends_on"] = ["T-3"]
+    # Dependencia pendente bloqueia; dependencia desconhecida (T-404) nao.
+    assert select_next_task(tasks)["task_id"] == "T-3"
+    tasks.append(task("T-9", "review"))
+    assert select_next_task(tasks)["task_id"] == "T-9"
+    assert select_next_task([task("T-1", "done")]) is None
@@ -57,6 +57,7 @@ def test_missing_payload_is_rejected(tmp_path: Path) -> None:
     with pytest.raises(CorruptedStoreError) as exc:
         parse_event_store(tmp_path)
     assert exc.value.code == "EVENT_MISSING_FIELDS"
+    assert str(exc.value).endswith("missing fields: payload")
 
 
 def test_unknown_action_is_rejected(tmp_path: Path) -> None:
@@ -78,3 +79,181 @@ def test_unknown_action_is_rejected(tmp_path: Path) -> None:
         parse_event_store(tmp_path)
     assert exc.value.code == "UNKNOWN_ACTION"
 
+
+
+def test_canonical_event_skips_normalization_copy() -> None:
+    from esaa.compat import normalize_legacy_event, normalize_legacy_verify_status
+
+    canonical = {"schema_version": "0.4.1", "action": "claim", "payload": {"task_id": "T-1"}}
+    assert normalize_legacy_event(canonical) is canonical
+
+    legacy = {"action": "claim", "data": {"task_id": "T-1"}}
+    normalized = normalize_legacy_event(legacy)
+    assert normalized is not legacy
+    assert normalized == {"action": "claim", "payload": {"task_id": "T-1"}, "schema_version": "0.3.0"}
+    assert legacy == {"action": "claim", "data": {"task_id": "T-1"}}
+
+    assert normalize_legacy_verify_status("fail") == "mismatch"
+    assert normalize_legacy_verify_status("ok") == "ok"
+
+
+def test_views_are_written_atomically_in_stdlib_layout(tmp_path: Path) -> None:
+    from esaa.store import load_roadmap, save_roadmap
+
+    roadmap = {"meta": {"schema_version": "0.4.1"}, "project": {"name": "ação"}, "tasks": [], "indexes": {}}
+    save_roadmap(tmp_path, roadmap)
+    save_roadmap(tmp_path, roadmap)
+
+    target = tmp_path / ".roadmap/roadmap.json"
+    assert target.read_text(encoding="utf-8") == json.dumps(roadmap, ensure_ascii=False, indent=2) + "\n"
+    assert load_roadmap(tmp_path) == roadmap
+    assert [p.name for p in target.parent.iterdir()] == ["roadmap.json"]
+
+
+def test_loaded_actions_are_interned(tmp_path: Path) -> None:
+    import sys
+
+    base = {"schema_version": "0.4.1", "ts": "2026-02-23T16:44:23Z", "actor": "orchestrator"}
+    _write_lines(
+        tmp_path / ".roadmap/activity.jsonl",
+        [
+            {**base, "event_seq": 1, "action": "run.start", "payload": {"run_id": "RUN-1"}},
+            {**base, "event_seq": 2, "action": "verify.start", "payload": {}},
+            {**base, "event_seq": 3, "action": "verify.start", "payload": {}},
+        ],
+    )
+    events = parse_event_store(tmp_path)
+    assert events[1]["action"] is events[2]["action"] is sys.intern("verify.start")
+
+
+def test_appended_event_lines_keep_compact_utf8_layout(tmp_path: Path) -> None:
+    from esaa.store import append_events
+
+    event = {
+        "schema_version": "0.4.1",
+        "event_id": "EV-00000001",
+        "event_seq": 1,
+        "ts": "2026-02-23T16:44:23Z",
+        "actor": "orchestrator",
+        "action": "run.start",
+        "payload": {"run_id": "RUN-1", "project_name": "projeção"},
+    }
+    append_events(tmp_path, [event])
+
+    raw = (tmp_path / ".roadmap/activity.jsonl").read_bytes()
+    assert raw == (json.dumps(event, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    assert parse_event_store(tmp_path)[0]["payload"]["project_name"] == "projeção"
+
+
+def test_store_lines_split_only_on_lf(tmp_path: Path) -> None:
+    base = {"schema_version": "0.4.1", "ts": "2026-02-23T16:44:23Z", "actor": "orchestrator"}
+    first = {**base, "event_seq": 1, "action": "run.start", "payload": {"note": "a b\u0085c"}}
+    second = {**base, "event_seq": 2, "action": "verify.start", "payload": {}}
+    path = tmp_path / ".roadmap/activity.jsonl"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(
+        json.dumps(first, ensure_ascii=False).encode("utf-8")
+        + b"\r\n\n"
+        + json.dumps(second, ensure_ascii=False).encode("utf-8")
+        + b"\r\n"
+    )
+
+    events = parse_event_store(tmp_path)
+    assert [event["event_seq"] for event in events] == [1, 2]
+    assert events[0]["payload"]["note"] == "a b\u0085c"
+    # parse_event_store le em streaming; anchors/checkpoints usam read_event_lines: mesma quebra.
+    from esaa.store import read_event_lines
+
+    assert len(read_event_lines(tmp_path)) == len(events)
+
+
+def test_append_separates_store_without_trailing_newline(tmp_path: Path, monkeypatch) -> None:
+    import os
+
+    from esaa.store import append_events
+
+    base = {"schema_version": "0.4.1", "ts": "2026-02-23T16:44:23Z", "actor": "orchestrator"}
+    first = {**base, "event_id": "EV-00000001", "event_seq": 1, "action": "run.start", "payload": {}}
+    path = tmp_path / ".roadmap/activity.jsonl"
+    path.parent.mkdir(parents=True)
+    path.write_bytes(json.dumps(first).encode("utf-8"))
+
+    writes: list[int] = []
+    real_write = os.write
+    monkeypatch.setattr(os, "write", lambda fd, data: writes.append(len(data)) or real_write(fd, data))
+    second = {**base, "event_id": "EV-00000002", "event_seq": 2, "action": "verify.start", "payload": {}}
+    third = {**base, "event_id": "EV-00000003", "event_seq": 3, "action": "verify.start", "payload": {}}
+    append_events(tmp_path, [second, third])
+
+    assert len(writes) == 1
+    assert [event["event_seq"] for event in parse_event_store(tmp_path)] == [1, 2, 3]
+    assert path.read_bytes().endswith(b"\n")
+
+
+def test_agent_contract_is_cached_until_file_changes(tmp_path: Path) -> None:
+    from esaa.constants import AGENT_CONTRACT_PATH, AGENT_RESULT_SCHEMA_PATH
+    from esaa.store import load_agent_contract, load_agent_result_schema
+
+    contract_path = tmp_path / AGENT_CONTRACT_PATH
+    schema_path = tmp_path / AGENT_RESULT_SCHEMA_PATH
+    contract_path.parent.mkdir(parents=True, exist_ok=True)
+    schema_path.parent.mkdir(parents=True, exist_ok=True)
+    contract_path.write_text("version: 1\n", encoding="utf-8")
+    schema_path.write_text('{"type": "object"}', encoding="utf-8")
+
+    assert load_agent_contract(tmp_path) is load_agent_contract(tmp_path)
+    assert load_agent_result_schema(tmp_path) is load_agent_result_schema(tmp_path)
+
+    contract_path.write_text("version: 22\n", encoding="utf-8")
+    schema_path.write_text('{"type": "array"}', encoding="utf-8")
+    assert load_agent_contract(tmp_path) == {"version": 22}
+    assert load_agent_result_schema(tmp_path) == {"type": "array"}
+
+
+def test_yamlio_matches_safe_load_for_bytes() -> None:
+    import yaml
+
+    from esaa import yamlio
+
+    text = "agents:\n  agent-qa:\n    role: quality\nlimits: [1, 2.5, null]\nnome: projeção\n"
+    assert yamlio.safe_load(text.encode("utf-8")) == yaml.safe_load(text)
+    with pytest.raises(yaml.YAMLError):
+        yamlio.safe_load(b"!!python/object:os.system {}")
+
+
+def test_event_store_has_content_ignores_blank_stores(tmp_path: Path) -> None:
+    from esaa.errors import ESAAError
+    from esaa.service import ESAAService
+    from esaa.store import event_store_has_content
+
+    store = tmp_path / ".roadmap" / "activity.jsonl"
+    assert event_store_has_content(store) is False
+    store.parent.mkdir(parents=True)
+    store.write_bytes(b"")
+    assert event_store_has_content(store) is False
+    store.write_bytes(b"\n  \n")
+    assert event_store_has_content(store) is False
+    store.write_bytes(b'{"event_seq":1}\n')
+    assert event_store_has_content(store) is True
+
+    with pytest.raises(ESAAError) as exc:
+        ESAAService(tmp_path).init()
+    assert exc.value.code == "INIT_BLOCKED"
+
+
+def test_identical_contract_bundles_share_parsed_objects(tmp_path: Path) -> None:
+    from esaa.constants import AGENT_CONTRACT_PATH, AGENT_RESULT_SCHEMA_PATH
+    from esaa.store import load_agent_contract, load_agent_result_schema
+
+    roots = [tmp_path / "a", tmp_path / "b"]
+    for root in roots:
+        (root / AGENT_CONTRACT_PATH).parent.mkdir(parents=True)
+        (root / AGENT_CONTRACT_PATH).write_text("version: 3\n", encoding="utf-8")
+        (root / AGENT_RESULT_SCHEMA_PATH).write_text('{"type": "object"}', encoding="utf-8")
+
+    assert load_agent_contract(roots[0]) is load_agent_contract(roots[1])
+    assert load_agent_result_schema(roots[0]) is load_agent_result_schema(roots[1])
+
+    (roots[1] / AGENT_CONTRACT_PATH).write_text("version: 4\n", encoding="utf-8")
+    assert load_agent_contract(roots[1]) == {"version": 4}
+    assert load_agent_contract(roots[0]) == {"version": 3}
@@ -60,3 +60,127 @@ def test_hotfix_complete_requires_two_checks():
     with pytest.raises(ESAAError) as exc:
         validate_agent_output(ev, schema, contract, task)
     assert exc.value.code == "MISSING_VERIFICATION"
+
+
+def test_schema_validator_is_compiled_once_per_schema_object(monkeypatch):
+    import esaa.validator as validator_module
+
+    schema, contract = _load_schema(), _load_contract()
+    compiled = []
+    original = validator_module.validator_for
+
+    def counting_validator_for(value, *args, **kwargs):
+        compiled.append(value)
+        return original(value, *args, **kwargs)
+
+    monkeypatch.setattr(validator_module, "validator_for", counting_validator_for)
+    task = {"task_id": "Q-1", "task_kind": "qa", "status": "in_progress",
+            "outputs": {"files": ["docs/qa/Q-1.md"]}}
+    for _ in range(3):
+        with pytest.raises(ESAAError) as exc:
+            validate_agent_output(_complete("Q-1", checks=[]), schema, contract, task)
+        assert exc.value.code == "SCHEMA_INVALID"
+    assert compiled == [schema]
+
+
+def test_fast_schema_backend_only_short_circuits_acceptance(monkeypatch):
+    from types import SimpleNamespace
+
+    import esaa.validator as validator_module
+
+    class FakeValueError(Exception):
+        pass
+
+    calls = []
+
+    def compile_fast(schema, use_default=True):
+        assert use_default is False
+
+        def validate(output):
+            calls.append(output)
+            if not output["activity_event"].get("verification", {}).get("checks"):
+                raise FakeValueError("fast says no")
+
+        return validate
+
+    fake = SimpleNamespace(
+        compile=compile_fast, JsonSchemaValueException=FakeValueError, JsonSchemaDefinitionException=ValueError
+    )
+    monkeypatch.setattr(validator_module, "fastjsonschema", fake)
+    schema, contract = _load_schema(), _load_contract()
+    task = {"task_id": "S-1", "task_kind": "spec", "status": "in_progress",
+            "outputs": {"files": ["docs/spec/S-1.md"]}}
+
+    ok = _complete("S-1", checks=["criterio enumerado"])
+    ok["file_updates"] = [{"path": "docs/spec/S-1.md", "content": "x"}]
+    assert validate_agent_output(ok, schema, contract, task)[0]["action"] == "complete"
+
+    # Rejeicao do backend rapido cai no jsonschema: mesma mensagem do caminho padrao.
+    with pytest.raises(ESAAError) as fast_exc:
+        validate_agent_output(_complete("S-1", checks=[]), schema, contract, task)
+    monkeypatch.setattr(validator_module, "fastjsonschema", None)
+    with pytest.raises(ESAAError) as slow_exc:
+        validate_agent_output(_complete("S-1", checks=[]), _load_schema(), contract, task)
+    assert len(calls) == 2
+    assert (fast_exc.value.code, str(fast_exc.value)) == (slow_exc.value.code, str(slow_exc.value))
+
+    monkeypatch.setattr(validator_module, "fastjsonschema", fake)
+    assert validator_module._compile_fast({"prefixItems": [{"type": "string"}]}) is None
+
+
+def test_hotfix_scope_patch_prefixes_are_normalized():
+    schema, contract = _load_schema(), _load_contract()
+    task = {"task_id": "HF-X", "task_kind": "impl", "status": "in_progress",
+            "is_hotfix": True, "issue_id": "ISS-1", "fixes": "ISS-1",
+            "scope_patch": [".\\src\\hotfix\\", "./src/patches/"],
+            "outputs": {"files": ["src/hotfix/HF-X.txt"]}}
+
+    def output(path):
+        return {"activity_event": {"action": "complete", "task_id": "HF-X", "prior_status": "in_progress",
+                                   "issue_id": "ISS-1", "fixes": "ISS-1",
+                                   "verification": {"checks": ["unit-ok", "regression-ok"]}},
+                "file_updates": [{"path": path, "content": "x"}]}
+
+    for path in ("src/hotfix/HF-X.txt", "src/patches/p.txt"):
+        validate_agent_output(output(path), schema, contract, task)
+    with pytest.raises(ESAAError) as exc:
+        validate_agent_output(output("src/other.txt"), schema, contract, task)
+    assert exc.value.code == "BOUNDARY_VIOLATION"
+    assert "scope_patch" in str(exc.value)
+
+
+def test_contract_vocabulary_and_forbidden_fields_checks():
+    contract = _load_contract()
+    permissive = {"type": "object"}
+    task = {"task_id": "S-1", "task_kind": "spec", "status": "todo"}
+    claim = {"action": "claim", "task_id": "S-1", "prior_status": "todo"}
+
+    with pytest.raises(ESAAError) as exc:
+        validate_agent_output({"activity_event": claim, "extra": 1}, permissive, contract, task)
+    assert str(exc.value).endswith("unknown root keys: ['extra']")
+
+    with pytest.raises(ESAAError) as exc:
+        validate_agent_output({"activity_event": {**claim, "action": "teleport"}}, permissive, contract, task)
+    assert exc.value.code == "UNKNOWN_ACTION"
+
+    with pytest.raises(ESAAError) as exc:
+        validate_agent_output({"activity_event": {**claim, "runner": {}}}, permissive, contract, task)
+    assert str(exc.value).endswith("forbidden fields: ['runner']")
+
+    event, updates = validate_agent_output({"activity_event": claim}, permissive, contract, task)
+    assert event is claim and updates == ()
+
+
+def test_cheap_shape_checks_run_before_schema(monkeypatch):
+    import esaa.validator as validator_module
+
+    def no_schema(schema):
+        raise AssertionError("schema validation should not run")
+
+    monkeypatch.setattr(validator_module, "_schema_validators", no_schema)
+    schema, contract = _load_schema(), _load_contract()
+    task = {"task_id": "S-1", "task_kind": "spec", "status": "todo"}
+    for output in ({"activity_event": {}, "junk": 1}, {"file_updates": []}, {"activity_event": "claim"}):
+        with pytest.raises(ESAAError) as exc:
+            validate_agent_output(output, schema, contract, task)
+        assert exc.value.code == "SCHEMA_INVALID"
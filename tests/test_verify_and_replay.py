@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 
 from esaa.service import ESAAService
@@ -28,6 +29,25 @@ def test_verify_ok_then_mismatch_and_corrupted(contract_bundle: Path) -> None:
     assert corrupted["verify_status"] == "corrupted"
 
 
+def test_verify_replays_even_when_store_stat_is_unchanged(contract_bundle: Path) -> None:
+    """Tampering that preserves size and mtime of activity.jsonl is still detected."""
+    service = ESAAService(contract_bundle)
+    service.init(force=True)
+    assert service.verify()["verify_status"] == "ok"
+
+    activity_path = contract_bundle / ".roadmap/activity.jsonl"
+    before = activity_path.stat()
+    data = activity_path.read_bytes()
+    marker = b'"title":"'
+    start = data.index(marker) + len(marker)
+    tampered = data[:start] + (b"X" if data[start : start + 1] != b"X" else b"Y") + data[start + 1 :]
+    activity_path.write_bytes(tampered)
+    os.utime(activity_path, ns=(before.st_atime_ns, before.st_mtime_ns))
+    assert activity_path.stat().st_size == before.st_size
+
+    assert service.verify()["verify_status"] == "mismatch"
+
+
 def test_replay_until_seq(contract_bundle: Path) -> None:
     service = ESAAService(contract_bundle)
     service.init(force=True)
@@ -35,4 +55,3 @@ def test_replay_until_seq(contract_bundle: Path) -> None:
     out = service.replay(until="2", write_views=False)
     assert out["events_replayed"] == 2
     assert out["last_event_seq"] == 2
-